@@ -1,7 +1,7 @@
 """Configuration objects and helpers for the FastAPI application."""
 
 import os
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -38,6 +38,75 @@ class Settings(BaseSettings):
     DOCLING_MAX_RETRIES: int = 3
     DOCLING_RETRY_BASE_DELAY: int = 30  # seconds, doubles each attempt
 
+    # --- Embeddings ---
+    EMBEDDING_WORKERS: int = 1  # threads running SPECTER2 forward passes for async callers
+    EMBEDDING_TORCH_THREADS: Optional[int] = None  # None keeps the torch default
+    # Concurrent query embeddings are coalesced into forward passes of up to this many texts,
+    # waiting at most EMBEDDING_BATCH_MAX_WAIT_MS for other requests (max size 1 disables it)
+    EMBEDDING_BATCH_MAX_SIZE: int = 32
+    EMBEDDING_BATCH_MAX_WAIT_MS: float = 5.0
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 10_000  # cached query-keyword vectors (0 disables)
+
+    # --- Search ---
+    # "in_process": fetch candidates with their embeddings in one query and rerank with numpy
+    # "database": rerank the candidates with a second SQL query inside Postgres
+    SEARCH_RERANK_MODE: Literal["in_process", "database"] = "in_process"
+    SEARCH_CACHE_MAX_ENTRIES: int = 1024
+    SEARCH_CACHE_TTL_SECONDS: int = 600
+    KEYWORD_MEMO_MAX_ENTRIES: int = 4096
+    # Filtered vector search planner: filters matching at most this many papers are answered
+    # with an exact scan, filters matching less than this fraction with an iterative HNSW scan
+    SEARCH_EXACT_SCAN_MAX_ROWS: int = 20_000
+    SEARCH_ITERATIVE_SCAN_MAX_SELECTIVITY: float = 0.1
+    SEARCH_ITERATIVE_SCAN_EF_SEARCH: int = 1000
+    # Search tiers trade recall for latency: HNSW ef_search and the number of candidates that
+    # are reranked per query. Requests without a tier use SEARCH_DEFAULT_TIER.
+    SEARCH_DEFAULT_TIER: Literal["fast", "balanced", "exhaustive"] = "balanced"
+    SEARCH_FAST_EF_SEARCH: int = 100
+    SEARCH_FAST_POOL_SIZE: int = 100
+    SEARCH_BALANCED_EF_SEARCH: int = 500
+    SEARCH_BALANCED_POOL_SIZE: int = 500
+    SEARCH_EXHAUSTIVE_EF_SEARCH: int = 1000
+    SEARCH_EXHAUSTIVE_POOL_SIZE: int = 1000
+    # "centroid": candidates are the nearest neighbours of the mean of all keyword embeddings
+    # "multi_probe": candidates are the union of the nearest neighbours of every keyword
+    SEARCH_CANDIDATE_STRATEGY: Literal["centroid", "multi_probe"] = "centroid"
+    # Max. number of concurrent keyword extractions of a batch search
+    SEARCH_BATCH_KEYWORD_CONCURRENCY: int = 8
+    # Precision of the HNSW index used for candidate retrieval; candidates are always reranked
+    # with the float32 embeddings. "halfvec" halves the index size, "binary" shrinks it 32x and
+    # retrieves VECTOR_INDEX_BINARY_OVERSAMPLING times more candidates to make up for it.
+    # Build the index with ingestion/build_vector_index.py before switching.
+    VECTOR_INDEX_QUANTIZATION: Literal["none", "halfvec", "binary"] = "none"
+    VECTOR_INDEX_BINARY_OVERSAMPLING: int = 4
+
+    # --- PDF search ---
+    # Text extraction of uploaded PDFs runs in a pool of worker processes. Only the leading
+    # pages are read, up to PDF_SEARCH_MAX_CHARS characters, which is enough for keywords.
+    PDF_EXTRACTION_WORKERS: int = 2
+    PDF_EXTRACTION_TIMEOUT_SECONDS: float = 20.0
+    PDF_SEARCH_MAX_PAGES: int = 50
+    PDF_SEARCH_MAX_CHARS: int = 200_000
+    # Repeat uploads of a document reuse its extracted text and the keywords per query
+    PDF_TEXT_CACHE_MAX_ENTRIES: int = 64
+    PDF_KEYWORD_CACHE_MAX_ENTRIES: int = 1024
+    PDF_CACHE_TTL_SECONDS: int = 3600
+
+    # --- Embedding replica ---
+    # Opt-in: directory of a memory-mapped copy of all paper embeddings (None disables it).
+    # Unfiltered vector searches then generate their candidates in process instead of with the
+    # pgvector HNSW index. The replica is scanned exactly, so every search costs O(rows); above
+    # EMBEDDING_REPLICA_MAX_ROWS it is not used and searches stay on the HNSW index.
+    EMBEDDING_REPLICA_DIR: Optional[str] = None
+    EMBEDDING_REPLICA_MAX_ROWS: int = 1_000_000
+    EMBEDDING_REPLICA_REFRESH_SECONDS: int = 300
+    # Interval of full rebuilds (deleted or updated papers trigger one early)
+    EMBEDDING_REPLICA_REBUILD_SECONDS: int = 86_400
+
+    # --- Metrics ---
+    # Interval of the summary log line of the stage latency histograms (0 disables it)
+    METRICS_LOG_INTERVAL_SECONDS: int = 300
+
     model_config = SettingsConfigDict(
         env_file=os.getenv("ENV_FILE", "dev.env"),
         extra="ignore",
@@ -2,8 +2,9 @@
 
 import logging
 from importlib import import_module
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Set, Tuple
 
+from sqlalchemy import Connection, inspect
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 
@@ -13,13 +14,15 @@ logger = logging.getLogger("inquiro")
 
 Base = declarative_base()
 
+# Postgres extensions required by the models (vector columns, trigram text indexes)
+DATABASE_EXTENSIONS = ("vector", "pg_trgm")
+
 # Use async engine with asyncpg or aiomysql driver
-# Set probes for the vector index for every connection
+# Vector index search parameters are set per connection and transaction by the SearchRepository
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=(settings.ENVIRONMENT == "dev"),
     future=True,
-    connect_args={"server_settings": {"ivfflat.probes": "50"}},
 )
 
 async_session_local = async_sessionmaker(
@@ -30,6 +33,9 @@ async_session_local = async_sessionmaker(
     autoflush=False,
 )
 
+# (table, column) of the model columns missing from the database, found by init_db
+_missing_columns: Set[Tuple[str, str]] = set()
+
 
 async def init_db() -> None:
     """Automatically create or update tables based on SQLAlchemy models."""
@@ -38,16 +44,61 @@ async def init_db() -> None:
         "app.models.project",
         "app.models.paper",
         "app.models.project_paper",
+        "app.models.project_centroid",
         "app.models.paper_content",
+        "app.models.keyword_cache",
     ):
         import_module(module)
 
     logger.info("🔄 Creating / updating database schema...")
     async with engine.begin() as conn:
+        for extension in DATABASE_EXTENSIONS:
+            await conn.exec_driver_sql(f"CREATE EXTENSION IF NOT EXISTS {extension}")
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_warn_missing_schema)
     logger.info("✅ Database schema up to date.")
 
 
+def has_column(table: str, column: str) -> bool:
+    """Whether a model column exists in the database (as of the last init_db)."""
+    return (table, column) not in _missing_columns
+
+
+def _warn_missing_schema(conn: Connection) -> None:
+    """
+    Warn about columns and indexes that were added to a model after its table was created,
+    and record the missing columns (see has_column).
+    create_all skips existing tables entirely, including their indexes. They are not built
+    on startup, since adding a generated column rewrites the table and a plain CREATE INDEX
+    locks it against writes for the whole build; ingestion/build_indexes.py adds them.
+    """
+    inspector = inspect(conn)
+    _missing_columns.clear()
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                _missing_columns.add((table.name, column.name))
+                logger.warning(
+                    "⚠️ Column %s.%s is missing, add it with: python -m ingestion.build_indexes "
+                    "and restart",
+                    table.name,
+                    column.name,
+                )
+
+        for index in table.indexes:
+            quantization = index.info.get("vector_quantization")
+            if quantization not in (None, settings.VECTOR_INDEX_QUANTIZATION):
+                continue
+            if not inspector.has_index(table.name, index.name):
+                logger.warning(
+                    "⚠️ Index %s is missing, build it with: python -m ingestion.build_indexes",
+                    index.name,
+                )
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Yield an async database session for FastAPI routes."""
     async with async_session_local() as session:
@@ -1,9 +1,16 @@
 """Provides dependency-injected access to shared service instances for the FastAPI app."""
 
+import json
 from functools import lru_cache
+from typing import List, Optional
 
+from fastapi import HTTPException, Query
+
+from app.core.config import settings
 from app.llm.embeddings.specter2 import Specter2Embedder
 from app.llm.openai.provider import OpenAIProvider
+from app.schemas.paper_dto import PAPER_FIELDS_DESCRIPTION, PaperField, PaperProjection
+from app.schemas.search_dto import AdvancedSearchFilter
 
 
 @lru_cache(maxsize=1)
@@ -15,7 +22,19 @@ def get_specter2_proximity_embedder() -> Specter2Embedder:
 @lru_cache(maxsize=1)
 def get_specter2_query_embedder() -> Specter2Embedder:
     """Return a shared Specter2Embedder instance, initialized once."""
-    return Specter2Embedder(adapter="allenai/specter2_adhoc_query")
+    embedder = Specter2Embedder(
+        adapter="allenai/specter2_adhoc_query",
+        max_workers=settings.EMBEDDING_WORKERS,
+        torch_threads=settings.EMBEDDING_TORCH_THREADS,
+    )
+    # Concurrent searches share forward passes for their query keywords
+    embedder.enable_batching(
+        max_batch_size=settings.EMBEDDING_BATCH_MAX_SIZE,
+        max_wait_ms=settings.EMBEDDING_BATCH_MAX_WAIT_MS,
+    )
+    # Extracted keywords repeat heavily across users
+    embedder.enable_cache(maxsize=settings.EMBEDDING_CACHE_MAX_ENTRIES)
+    return embedder
 
 
 @lru_cache(maxsize=1)
@@ -24,3 +43,40 @@ def get_openai_provider() -> OpenAIProvider:
     Return a shared OpenAI instance, initialized once.
     """
     return OpenAIProvider()
+
+
+def get_paper_projection(
+    fields: Optional[List[PaperField]] = Query(default=None, description=PAPER_FIELDS_DESCRIPTION),
+    abstract_max_length: Optional[int] = Query(
+        default=None, ge=0, description="Optional: truncate abstracts to this many characters"
+    ),
+) -> PaperProjection:
+    """Read the paper field projection from the query parameters."""
+    return PaperProjection(fields=fields, abstract_max_length=abstract_max_length)
+
+
+def parse_advanced_filter(raw: Optional[str]) -> Optional[AdvancedSearchFilter]:
+    """Parse a JSON-encoded advanced search filter (None if not given)."""
+    if not raw:
+        return None
+    try:
+        return AdvancedSearchFilter.model_validate(json.loads(raw))
+    except json.JSONDecodeError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid filter JSON.",
+        ) from exc
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid filter.",
+        ) from exc
+
+
+def get_advanced_filter(
+    advanced_filter: Optional[str] = Query(
+        default=None, description="Optional: JSON-encoded advanced search filter"
+    ),
+) -> Optional[AdvancedSearchFilter]:
+    """Read the JSON-encoded advanced search filter from the query parameters."""
+    return parse_advanced_filter(advanced_filter)
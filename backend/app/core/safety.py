@@ -1,10 +1,19 @@
+import asyncio
 import logging
+from typing import Any, Coroutine, List, TypeVar
 
 from app.core.config import settings
 from app.core.deps import get_openai_provider
+from app.utils.timing_utils import stage_timer
 
 logger = logging.getLogger("inquiro")
 
+T = TypeVar("T")
+
+
+class ModerationFlaggedError(Exception):
+    """Raised when an input is flagged by the moderation check."""
+
 
 class SafetyService:
     """
@@ -12,6 +21,9 @@ class SafetyService:
     Implements defenses against Prompt Injection and Toxicity.
     """
 
+    # Max. number of texts sent in one moderation request
+    MODERATION_BATCH_SIZE = 32
+
     @staticmethod
     def validate_output(text: str) -> bool:
         """
@@ -35,4 +47,54 @@ class SafetyService:
         """
         openai_provider = get_openai_provider()
 
-        return await openai_provider.check_moderation(input_text)
+        with stage_timer("moderation"):
+            return await openai_provider.check_moderation(input_text)
+
+    @staticmethod
+    async def check_moderation_batch(input_texts: List[str]) -> List[bool]:
+        """
+        Checks several texts against OpenAI's moderation endpoint, MODERATION_BATCH_SIZE texts
+        per request, with all requests in flight concurrently.
+        Returns one flag per text: True if SAFE, False if FLAGGED (toxic).
+        """
+        openai_provider = get_openai_provider()
+        size = SafetyService.MODERATION_BATCH_SIZE
+
+        with stage_timer("moderation"):
+            results = await asyncio.gather(
+                *(
+                    openai_provider.check_moderation_batch(input_texts[start : start + size])
+                    for start in range(0, len(input_texts), size)
+                )
+            )
+        return [is_safe for chunk in results for is_safe in chunk]
+
+    @staticmethod
+    async def run_with_moderation(input_text: str, work: Coroutine[Any, Any, T]) -> T:
+        """
+        Run the moderation check and the given work concurrently, so the moderation round trip
+        overlaps with the (usually slower) LLM work instead of preceding it.
+        If the input is flagged, the work is cancelled and its result is discarded.
+
+        Raises:
+            ModerationFlaggedError: If the input violates the safety policies.
+        """
+        work_task = asyncio.create_task(work)
+
+        try:
+            is_safe = await SafetyService.check_moderation(input_text)
+        except BaseException:
+            await SafetyService._discard(work_task)
+            raise
+
+        if not is_safe:
+            await SafetyService._discard(work_task)
+            raise ModerationFlaggedError("Input violates safety policies.")
+
+        return await work_task
+
+    @staticmethod
+    async def _discard(task: asyncio.Task) -> None:
+        """Cancel a speculative task and wait for it, ignoring its outcome."""
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,146 @@
+"""Server-Timing header, latency histograms and timing log line of instrumented requests."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import math
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import settings
+from app.utils.timing_utils import (
+    HistogramSnapshot,
+    LatencyHistogram,
+    format_server_timing,
+    record_stage_timings,
+)
+
+logger = logging.getLogger("inquiro")
+
+# Name of the overall request duration in the header, histograms and log line
+TOTAL_STAGE = "total"
+
+# Percentiles reported in the summary log line
+SUMMARY_PERCENTILES = (50, 95, 99)
+
+
+class StageTimingStats:
+    """
+    Latency histograms of every timed stage, aggregated over all instrumented requests.
+
+    Uses singleton pattern - access via get_instance().
+    """
+
+    _instance: Optional[StageTimingStats] = None
+
+    def __init__(self, log_interval_seconds: int = 0) -> None:
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._log_interval_seconds = log_interval_seconds
+        self._log_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def get_instance(cls) -> StageTimingStats:
+        """Get or create the singleton stats instance."""
+        if cls._instance is None:
+            cls._instance = cls(log_interval_seconds=settings.METRICS_LOG_INTERVAL_SECONDS)
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Reset the singleton instance (for testing)."""
+        cls._instance = None
+
+    def record(self, timings: Dict[str, float]) -> None:
+        """Add the stage durations (ms) of one request."""
+        for stage, duration_ms in timings.items():
+            self._histograms.setdefault(stage, LatencyHistogram()).observe(duration_ms)
+
+    @property
+    def histograms(self) -> Dict[str, HistogramSnapshot]:
+        """Snapshot of the histogram of every stage."""
+        return {stage: histogram.snapshot for stage, histogram in self._histograms.items()}
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return count, mean and percentiles (ms) of every stage since startup.
+        Percentiles are bucket upper bounds; None if they fall into the overflow bucket.
+        """
+        summary: Dict[str, Dict[str, Any]] = {}
+        for stage, snapshot in self.histograms.items():
+            stage_summary: Dict[str, Any] = {
+                "count": snapshot.count,
+                "mean_ms": round(snapshot.mean_ms, 2),
+            }
+            for q in SUMMARY_PERCENTILES:
+                value = snapshot.percentile_ms(q)
+                stage_summary[f"p{q}_ms"] = None if math.isinf(value) else value
+            summary[stage] = stage_summary
+        return summary
+
+    def log_summary(self) -> None:
+        """Log the summary of all stages as one JSON line (nothing before the first request)."""
+        summary = self.summary()
+        if summary:
+            logger.info("Stage timing summary: %s", json.dumps(summary))
+
+    async def start(self) -> None:
+        """Start logging the summary periodically (no-op if the interval is 0)."""
+        if self._log_interval_seconds <= 0 or self._log_task is not None:
+            return
+        self._log_task = asyncio.create_task(self._log_periodically())
+
+    async def stop(self) -> None:
+        """Stop the periodic summary and log it a last time."""
+        if self._log_task is None:
+            return
+
+        self._log_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._log_task
+        self._log_task = None
+        self.log_summary()
+
+    async def _log_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._log_interval_seconds)
+            self.log_summary()
+
+
+async def server_timing_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """
+    Collect the stage timings of the request (see stage_timer). For requests with timed
+    stages, the timings are returned in a Server-Timing header, added to the histograms of
+    StageTimingStats and logged as one JSON line.
+    Stages of streamed responses that run after the headers were sent are not included.
+    """
+    with record_stage_timings() as timings:
+        start = time.perf_counter()
+        response = await call_next(request)
+        total_ms = (time.perf_counter() - start) * 1000
+
+    if not timings:
+        return response
+
+    timings = {**timings, TOTAL_STAGE: total_ms}
+    response.headers["Server-Timing"] = format_server_timing(timings)
+    StageTimingStats.get_instance().record(timings)
+    logger.info(
+        "Request timing: %s",
+        json.dumps(
+            {
+                "method": request.method,
+                "path": request.url.path,
+                "status": response.status_code,
+                "timings_ms": {stage: round(ms, 2) for stage, ms in timings.items()},
+            }
+        ),
+    )
+    return response
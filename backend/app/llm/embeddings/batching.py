@@ -0,0 +1,142 @@
+"""Dynamic micro-batching of concurrent embedding requests."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, replace
+from typing import Awaitable, Callable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+EmbedFn = Callable[[List[str]], Awaitable[List[Optional[List[float]]]]]
+
+
+@dataclass
+class _PendingRequest:
+    """Texts of one caller waiting to be embedded."""
+
+    texts: List[str]
+    future: "asyncio.Future[List[Optional[List[float]]]]"
+    enqueued_at: float
+
+
+@dataclass
+class BatcherStats:
+    """Batch-size and queue-wait counters of an EmbeddingBatcher."""
+
+    batches: int = 0
+    texts: int = 0
+    max_batch_size: int = 0
+    requests: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Average number of texts per forward pass."""
+        return self.texts / self.batches if self.batches else 0.0
+
+    @property
+    def mean_wait_ms(self) -> float:
+        """Average time a request waited in the queue before its batch was dispatched."""
+        return self.total_wait_ms / self.requests if self.requests else 0.0
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces embedding requests of concurrent callers into shared forward passes.
+
+    Requests are collected until either max_batch_size texts are pending or the oldest request
+    has waited max_wait_ms. The combined batch is embedded with a single call to embed_fn and
+    the vectors are fanned back out to the waiting callers. A single request is never split.
+
+    Must be used from a single event loop.
+    """
+
+    def __init__(self, embed_fn: EmbedFn, max_batch_size: int, max_wait_ms: float) -> None:
+        self._embed_fn = embed_fn
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+
+        self._pending: List[_PendingRequest] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats = BatcherStats()
+
+    async def embed(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Embed the texts as part of the next batch and return their vectors."""
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[List[Optional[List[float]]]] = loop.create_future()
+        self._pending.append(_PendingRequest(texts, future, time.monotonic()))
+
+        if sum(len(r.texts) for r in self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self._flush)
+
+        return await future
+
+    @property
+    def stats(self) -> BatcherStats:
+        """Return a snapshot of the batch-size and queue-wait counters."""
+        return replace(self._stats)
+
+    def _flush(self) -> None:
+        """Dispatch all pending requests as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        requests = [r for r in self._pending if not r.future.done()]
+        self._pending = []
+        if not requests:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run_batch(requests))
+        # Keep a reference until the batch is done, so the task is not garbage collected
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, requests: List[_PendingRequest]) -> None:
+        """Embed the combined texts of the requests and resolve their futures."""
+        texts = [text for request in requests for text in request.texts]
+        self._record(requests, len(texts))
+
+        try:
+            vectors = await self._embed_fn(texts)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # Propagate the failure to every caller of this batch
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(exc)
+            return
+
+        offset = 0
+        for request in requests:
+            end = offset + len(request.texts)
+            if not request.future.done():
+                request.future.set_result(vectors[offset:end])
+            offset = end
+
+    def _record(self, requests: List[_PendingRequest], batch_size: int) -> None:
+        """Update the batch-size and queue-wait counters for a dispatched batch."""
+        now = time.monotonic()
+        waits_ms = [(now - r.enqueued_at) * 1000 for r in requests]
+
+        stats = self._stats
+        stats.batches += 1
+        stats.texts += batch_size
+        stats.max_batch_size = max(stats.max_batch_size, batch_size)
+        stats.requests += len(requests)
+        stats.total_wait_ms += sum(waits_ms)
+        stats.max_wait_ms = max(stats.max_wait_ms, *waits_ms)
+
+        logger.debug(
+            "Embedding batch: %d texts from %d requests, max queue wait %.1f ms",
+            batch_size,
+            len(requests),
+            max(waits_ms),
+        )
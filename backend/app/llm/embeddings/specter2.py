@@ -1,10 +1,17 @@
+import asyncio
 import logging
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import torch
 from adapters import AutoAdapterModel
 from transformers import AutoTokenizer
 
+from app.llm.embeddings.batching import BatcherStats, EmbeddingBatcher
+from app.utils.cache_utils import CacheStats, TTLCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,13 +25,29 @@ def build_specter2_text(title: str, abstract: str, tokenizer: AutoTokenizer) ->
     return t + tokenizer.sep_token + a
 
 
-class Specter2Embedder:
+class Specter2Embedder:  # pylint: disable=too-many-instance-attributes
     """Wrapper around the SPECTER2 retrieval (proximity) model."""
 
     def __init__(
-        self, adapter: str = "allenai/specter2_base", device: Optional[str] = None
+        self,
+        adapter: str = "allenai/specter2_base",
+        device: Optional[str] = None,
+        max_workers: int = 1,
+        torch_threads: Optional[int] = None,
     ) -> None:
-        """Load SPECTER2 tokenizer, base model, and proximity adapter."""
+        """
+        Load SPECTER2 tokenizer, base model, and proximity adapter.
+
+        Args:
+            adapter: Hugging Face name of the adapter to activate.
+            device: Torch device, defaults to CUDA if available.
+            max_workers: Size of the thread pool used by embed_batch_async.
+            torch_threads: Number of intra-op threads for torch (process-wide); None keeps
+                the torch default.
+        """
+
+        if torch_threads is not None:
+            torch.set_num_threads(torch_threads)
 
         if device is None:
             device = "cuda" if torch.cuda.is_available() else "cpu"
@@ -56,6 +79,13 @@ class Specter2Embedder:
         self.model.to(self.device)
         self.model.eval()
 
+        # Dedicated, bounded pool for async callers, so forward passes never run on the event loop
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="specter2")
+        # Fast tokenizers must not be used from several threads at once
+        self._tokenizer_lock = threading.Lock()
+        self._batcher: Optional[EmbeddingBatcher] = None
+        self._cache: Optional[TTLCache[Tuple[str, str], np.ndarray]] = None
+
         logger.info(
             "Loaded SPECTER2 model with adapter '%s' on device '%s'",
             adapter,
@@ -68,16 +98,17 @@ class Specter2Embedder:
         Returns a list of dense vectors or None for failed items.
         """
         try:
-            cleaned = [t.replace("\n", " ") for t in texts]
-
-            inputs = self.tokenizer(
-                cleaned,
-                padding=True,
-                truncation=True,
-                return_tensors="pt",
-                max_length=512,
-                return_token_type_ids=False,
-            ).to(self.device)
+            cleaned = [self._clean_text(t) for t in texts]
+
+            with self._tokenizer_lock:
+                inputs = self.tokenizer(
+                    cleaned,
+                    padding=True,
+                    truncation=True,
+                    return_tensors="pt",
+                    max_length=512,
+                    return_token_type_ids=False,
+                ).to(self.device)
 
             with torch.no_grad():
                 outputs = self.model(**inputs)
@@ -94,6 +125,104 @@ class Specter2Embedder:
             logger.error("Embedding error: %s", e)
             return [None] * len(texts)
 
+    def enable_batching(self, max_batch_size: int, max_wait_ms: float) -> None:
+        """
+        Coalesce concurrent embed_batch_async calls into forward passes of up to max_batch_size
+        texts, waiting at most max_wait_ms for other calls to join (see EmbeddingBatcher).
+        """
+        if max_batch_size > 1:
+            self._batcher = EmbeddingBatcher(
+                self._embed_in_executor,
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_wait_ms,
+            )
+
+    def enable_cache(self, maxsize: int) -> None:
+        """
+        Keep the float32 vectors of up to maxsize recently embedded texts in an LRU cache,
+        keyed by adapter and cleaned text. Only used by embed_batch_async.
+        """
+        if maxsize > 0:
+            self._cache = TTLCache(maxsize)
+
+    async def embed_batch_async(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Awaitable variant of embed_batch.
+        The forward pass runs on the embedder's thread pool instead of the event loop. If
+        caching is enabled, only texts that are not cached are sent to the model. If
+        micro-batching is enabled, they may share a forward pass with concurrent calls.
+        """
+        if self._cache is None:
+            return await self._embed_uncached(texts)
+
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        # Positions of every distinct cache miss within texts
+        misses: Dict[Tuple[str, str], List[int]] = {}
+
+        for i, text in enumerate(texts):
+            key = (self.adapter, self._clean_text(text))
+            cached = self._cache.get(key)
+            if cached is not None:
+                results[i] = cached.tolist()
+            else:
+                misses.setdefault(key, []).append(i)
+
+        stats = self._cache.stats
+        logger.debug(
+            "Embedding cache: %d of %d texts cached (hit rate %.2f, size=%d)",
+            len(texts) - sum(len(positions) for positions in misses.values()),
+            len(texts),
+            stats.hit_rate,
+            stats.size,
+        )
+
+        if misses:
+            vectors = await self._embed_uncached([text for _, text in misses])
+            for (key, positions), vector in zip(misses.items(), vectors):
+                if vector is not None:
+                    self._cache.set(key, np.asarray(vector, dtype=np.float32))
+                for i in positions:
+                    results[i] = vector
+
+        return results
+
+    @property
+    def batch_stats(self) -> Optional[BatcherStats]:
+        """Batch-size and queue-wait metrics, or None if micro-batching is disabled."""
+        return self._batcher.stats if self._batcher is not None else None
+
+    @property
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Hit/miss counters of the embedding cache, or None if caching is disabled."""
+        return self._cache.stats if self._cache is not None else None
+
+    async def _embed_uncached(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Embed the texts through the batcher if enabled, else directly on the thread pool."""
+        if self._batcher is None:
+            return await self._embed_in_executor(texts)
+
+        vectors = await self._batcher.embed(texts)
+        stats = self._batcher.stats
+        logger.debug(
+            "Embedding batches: %d (mean size %.1f, max %d), mean queue wait %.1f ms (max %.1f)",
+            stats.batches,
+            stats.mean_batch_size,
+            stats.max_batch_size,
+            stats.mean_wait_ms,
+            stats.max_wait_ms,
+        )
+        return vectors
+
+    async def _embed_in_executor(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Run embed_batch on the embedder's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.embed_batch, texts)
+
     def embed_one(self, text: str) -> Optional[List[float]]:
         """Compute a single SPECTER2 embedding."""
         return self.embed_batch([text])[0]
+
+    @staticmethod
+    def _clean_text(text: str) -> str:
+        """Normalize a text before tokenization."""
+        return text.replace("\n", " ")
@@ -1,3 +1,5 @@
+import hashlib
+
 from app.core.config import settings
 
 KEYWORD_PROMPT = """
@@ -18,6 +20,9 @@ problem/task, method/architecture, dataset, application domain, theoretical conc
 Output only a JSON list: ["keyword1", ...].
 """
 
+# Identifies the keyword prompt for memoized extraction results; changes whenever the prompt does
+KEYWORD_PROMPT_VERSION = hashlib.sha256(KEYWORD_PROMPT.encode("utf-8")).hexdigest()[:16]
+
 PDF_KEYWORD_PROMPT = """
 You are an expert in academic information retrieval.
 
@@ -42,6 +47,9 @@ stated focus.
 Output only a JSON list: ["query1", "query2", ...].
 """
 
+# Identifies the PDF keyword prompt for cached extraction results (see KEYWORD_PROMPT_VERSION)
+PDF_KEYWORD_PROMPT_VERSION = hashlib.sha256(PDF_KEYWORD_PROMPT.encode("utf-8")).hexdigest()[:16]
+
 SUMMARIZATION_PROMPT = f"""
 {settings.SAFETY_CANARY}
 Role: You are an expert scientific research assistant specializing in natural sciences.
@@ -241,3 +241,28 @@ class OpenAIProvider:
         except APIStatusError as e:
             logger.error("Moderation API error: %s", e)
             return False
+
+    async def check_moderation_batch(self, input_texts: List[str]) -> List[bool]:
+        """
+        Checks several texts against OpenAI's moderation endpoint in a single request.
+        Returns one flag per text: True if SAFE, False if FLAGGED (toxic).
+        If the request fails, all texts are treated as flagged.
+        """
+        try:
+            response = await self.client.moderations.create(input=input_texts)
+
+            flagged = [result.flagged for result in response.results]
+            logger.info(
+                "Batch moderation result: %d of %d inputs flagged",
+                sum(flagged),
+                len(flagged),
+            )
+
+            return [not is_flagged for is_flagged in flagged]
+
+        except (APIConnectionError, RateLimitError) as e:
+            logger.error("Moderation connection or rate limit error: %s", e)
+            return [False] * len(input_texts)
+        except APIStatusError as e:
+            logger.error("Moderation API error: %s", e)
+            return [False] * len(input_texts)
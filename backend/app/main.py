@@ -11,8 +11,10 @@ from starlette.requests import Request
 from starlette.responses import Response
 
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.database import engine, init_db
 from app.core.limiter import limiter
+from app.core.timing import StageTimingStats, server_timing_middleware
+from app.repositories.search_repository import SearchRepository
 from app.routes import (
     auth_routes,
     paper_routes,
@@ -20,6 +22,9 @@ from app.routes import (
     search_routes,
     user_routes,
 )
+from app.services.embedding_replica import EmbeddingReplica
+from app.services.pdf_extraction_pool import PdfExtractionPool
+from app.services.search_cache import SearchCache
 from app.workers.queues.conversion_queue import ConversionQueue
 
 # ---------------------------------------------------------
@@ -40,12 +45,33 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, Any]:
     """Initialize and tear down application resources."""
 
     logger.info("🚀 Starting Inquiro API in '%s' mode...", settings.ENVIRONMENT)
+    SearchRepository.register_connection_defaults(engine)
     await init_db()
 
     # Start PDF conversion workers
     queue = ConversionQueue.get_instance()
     await queue.start_workers()
 
+    # Invalidate cached search results whenever new papers are ingested
+    search_cache = SearchCache.get_instance()
+    try:
+        await search_cache.start_listener()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        # Cached results still expire after SEARCH_CACHE_TTL_SECONDS
+        logger.error("Failed to start search cache invalidation listener: %s", e)
+
+    # Keep the opt-in embedding replica in sync (if EMBEDDING_REPLICA_DIR is set)
+    replica = EmbeddingReplica.get_instance()
+    try:
+        await replica.start()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        # Searches keep using Postgres for candidate generation
+        logger.error("Failed to start embedding replica: %s", e)
+
+    # Log the latency histograms of the timed search stages periodically
+    timing_stats = StageTimingStats.get_instance()
+    await timing_stats.start()
+
     logger.info("✅ Startup complete.")
 
     yield
@@ -55,6 +81,14 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, Any]:
     # Stop conversion workers
     await queue.stop_workers()
 
+    await search_cache.stop_listener()
+
+    await replica.stop()
+
+    await timing_stats.stop()
+
+    PdfExtractionPool.get_instance().shutdown()
+
     logger.info("👋 Shutdown complete.")
 
 
@@ -74,6 +108,8 @@ app.add_exception_handler(
     cast(Callable[[Request, Exception], Response], _rate_limit_exceeded_handler),
 )
 app.add_middleware(SlowAPIMiddleware)
+# Server-Timing header and latency histograms of the instrumented search stages
+app.middleware("http")(server_timing_middleware)
 
 # ---------------------------------------------------------
 # Development-only CORS configuration
@@ -1,17 +1,21 @@
 """Expose SQLAlchemy models for convenient imports."""
 
+from .keyword_cache import KeywordCache
 from .paper import Paper, PaperSource, PaperType
 from .paper_content import PaperContent
 from .project import Project
+from .project_centroid import ProjectCentroid
 from .project_paper import ProjectPaper
 from .user import User
 
 __all__ = [
+    "KeywordCache",
     "Paper",
     "PaperContent",
     "PaperSource",
     "PaperType",
     "Project",
+    "ProjectCentroid",
     "ProjectPaper",
     "User",
 ]
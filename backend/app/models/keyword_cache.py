@@ -0,0 +1,34 @@
+"""SQLAlchemy model memoizing LLM keyword extraction results."""
+
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import JSON, BigInteger, DateTime, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class KeywordCache(Base):
+    """Keywords extracted for a normalized query text with a specific prompt version."""
+
+    __tablename__ = "keyword_cache"
+
+    # The query text can be up to 5000 characters, so the lookup is done on its hash.
+    __table_args__ = (
+        UniqueConstraint(
+            "query_hash",
+            "prompt_version",
+            name="uq_keyword_cache_query_hash_prompt_version",
+        ),
+    )
+
+    keyword_cache_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)
+    query_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    prompt_version: Mapped[str] = mapped_column(String(64), nullable=False)
+    query_text: Mapped[str] = mapped_column(Text, nullable=False)
+    keywords: Mapped[List[str]] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
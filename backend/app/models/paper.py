@@ -1,30 +1,66 @@
 """SQLAlchemy model and enumerations for scholarly papers."""
 
 from datetime import date, datetime
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import BIT, HALFVEC, Vector
 from sqlalchemy import Enum as SqlEnum
 from sqlalchemy import (
     JSON,
     BigInteger,
+    ColumnClause,
+    Computed,
+    Connection,
     Date,
     DateTime,
+    Dialect,
     Index,
     String,
+    Table,
     Text,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.schema import SchemaItem
+from sqlalchemy.sql import cast, func, literal_column
+from sqlalchemy.sql.compiler import DDLCompiler
+from sqlalchemy.sql.ddl import BaseDDLElement
 
 from app.constants.database_constants import PaperSource, PaperType
+from app.core.config import settings
 from app.core.database import Base
 from .paper_content import PaperContent
 
 
+# Build parameters shared by the HNSW indexes of the embedding
+HNSW_INDEX_WITH = {"m": 16, "ef_construction": 64}
+
+
+def _vector_index_enabled(  # pylint: disable=too-many-arguments,unused-argument
+    ddl: BaseDDLElement,
+    target: Union[SchemaItem, str],
+    bind: Optional[Connection],
+    tables: Optional[List[Table]] = None,
+    state: Optional[Any] = None,
+    *,
+    dialect: Dialect,
+    compiler: Optional[DDLCompiler] = None,
+    **kw: Any,
+) -> bool:
+    """Only the HNSW index matching settings.VECTOR_INDEX_QUANTIZATION is created."""
+    return (
+        isinstance(target, Index)
+        and target.info["vector_quantization"] == settings.VECTOR_INDEX_QUANTIZATION
+    )
+
+
 class Paper(Base):
     """Database representation of a scholarly paper with vector embeddings."""
 
+    # astroid mis-infers Mapped when app.models.keyword_cache is linted before this module and
+    # reports every Mapped[...] annotation as unsubscriptable (false positive).
+    # pylint: disable=unsubscriptable-object
+
     __tablename__ = "paper"
 
     # Columns
@@ -48,12 +84,23 @@ class Paper(Base):
     published_at: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     paper_id_external: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     fetched_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
+        DateTime(timezone=True), nullable=False, server_default=func.now(), index=True
     )
 
     # Vector Embedding
     embedding: Mapped[Optional[List[float]]] = mapped_column(Vector(768), nullable=True)
 
+    # Full-text search document (title + abstract) of the hybrid search, maintained by Postgres.
+    # Deferred, since it is only used in WHERE / ORDER BY clauses.
+    search_document: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english'::regconfig, title || ' ' || coalesce(abstract, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
     # Relationships
     project_links: Mapped[List["ProjectPaper"]] = relationship(
         "ProjectPaper", back_populates="paper", cascade="all, delete-orphan"
@@ -78,11 +125,55 @@ class Paper(Base):
             "embedding",
             postgresql_using="hnsw",
             postgresql_ops={"embedding": "vector_cosine_ops"},
-            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_with=HNSW_INDEX_WITH,
+            info={"vector_quantization": "none"},
+        ).ddl_if(callable_=_vector_index_enabled),
+        # Trigram indexes (pg_trgm) for the ILIKE text conditions of the advanced search
+        Index(
+            "ix_paper_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_paper_abstract_trgm",
+            "abstract",
+            postgresql_using="gin",
+            postgresql_ops={"abstract": "gin_trgm_ops"},
         ),
+        Index("ix_paper_search_document", "search_document", postgresql_using="gin"),
     )
 
 
+# Text search configuration of Paper.search_document, used to parse the full-text queries
+PAPER_TS_CONFIG: ColumnClause[Any] = literal_column("'english'::regconfig")
+
+# Quantized embeddings for the smaller HNSW indexes (see VECTOR_INDEX_QUANTIZATION). They are
+# only stored in the index; search candidates are reranked with the float32 embedding.
+PAPER_EMBEDDING_HALFVEC = cast(Paper.embedding, HALFVEC(768))
+PAPER_EMBEDDING_BINARY = cast(func.binary_quantize(Paper.embedding), BIT(768))
+Paper.__table__.append_constraint(
+    Index(
+        "ix_paper_embedding_halfvec_hnsw",
+        PAPER_EMBEDDING_HALFVEC.label("embedding_halfvec"),
+        postgresql_using="hnsw",
+        postgresql_ops={"embedding_halfvec": "halfvec_cosine_ops"},
+        postgresql_with=HNSW_INDEX_WITH,
+        info={"vector_quantization": "halfvec"},
+    ).ddl_if(callable_=_vector_index_enabled)
+)
+Paper.__table__.append_constraint(
+    Index(
+        "ix_paper_embedding_binary_hnsw",
+        PAPER_EMBEDDING_BINARY.label("embedding_binary"),
+        postgresql_using="hnsw",
+        postgresql_ops={"embedding_binary": "bit_hamming_ops"},
+        postgresql_with=HNSW_INDEX_WITH,
+        info={"vector_quantization": "binary"},
+    ).ddl_if(callable_=_vector_index_enabled)
+)
+
+
 if TYPE_CHECKING:
     from .project import Project
     from .project_paper import ProjectPaper
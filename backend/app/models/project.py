@@ -1,7 +1,7 @@
 """SQLAlchemy model for projects managed in the application."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 from sqlalchemy import BigInteger, DateTime, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -28,6 +28,9 @@ class Project(Base):
     project_papers: Mapped[List["ProjectPaper"]] = relationship(
         "ProjectPaper", back_populates="project", cascade="all, delete-orphan"
     )
+    centroid: Mapped[Optional["ProjectCentroid"]] = relationship(
+        "ProjectCentroid", back_populates="project", cascade="all, delete-orphan"
+    )
     papers: Mapped[List["Paper"]] = relationship(
         "Paper", secondary="project_paper", back_populates="projects", viewonly=True
     )
@@ -35,5 +38,6 @@ class Project(Base):
 
 if TYPE_CHECKING:
     from .paper import Paper
+    from .project_centroid import ProjectCentroid
     from .project_paper import ProjectPaper
     from .user import User
@@ -0,0 +1,76 @@
+"""SQLAlchemy model for the running embedding centroid of a project."""
+
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import DDL, BigInteger, DateTime, ForeignKey, Integer, event
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class ProjectCentroid(Base):
+    """
+    Sum and count of the embeddings of the papers stored in a project; their mean is the
+    centroid. Papers are added incrementally, and a removal recomputes the row.
+    A rewritten paper embedding deletes the rows of the projects storing the paper (trigger
+    below); the repository recreates them from all papers on next access.
+    """
+
+    __tablename__ = "project_centroid"
+
+    project_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("project.project_id"), primary_key=True
+    )
+    # None while no paper of the project has an embedding
+    embedding_sum: Mapped[Optional[List[float]]] = mapped_column(Vector(768), nullable=True)
+    # Number of papers with an embedding
+    paper_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    project: Mapped["Project"] = relationship("Project", back_populates="centroid")
+
+
+# Metadata-level DDL runs after every create_all (init_db), so existing databases get the
+# trigger as well; both statements are idempotent.
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(
+        """
+        CREATE OR REPLACE FUNCTION invalidate_project_centroids() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            DELETE FROM project_centroid
+            WHERE project_id IN (
+                SELECT project_id FROM project_paper WHERE paper_id = NEW.paper_id
+            );
+            RETURN NULL;
+        END
+        $$
+        """
+    ),
+)
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(
+        """
+        CREATE OR REPLACE TRIGGER paper_embedding_changed
+        AFTER UPDATE OF embedding ON paper
+        FOR EACH ROW WHEN (OLD.embedding IS DISTINCT FROM NEW.embedding)
+        EXECUTE FUNCTION invalidate_project_centroids()
+        """
+    ),
+)
+
+
+if TYPE_CHECKING:
+    from .project import Project
@@ -0,0 +1,45 @@
+from typing import List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.keyword_cache import KeywordCache
+
+
+class KeywordCacheRepository:
+    """Repository for memoized keyword extraction results."""
+
+    @staticmethod
+    async def get_keywords(
+        session: AsyncSession, query_hash: str, prompt_version: str
+    ) -> Optional[List[str]]:
+        """Return the memoized keywords for the query hash and prompt version, if any."""
+        stmt = select(KeywordCache.keywords).where(
+            KeywordCache.query_hash == query_hash,
+            KeywordCache.prompt_version == prompt_version,
+        )
+        return await session.scalar(stmt)
+
+    @staticmethod
+    async def upsert_keywords(
+        session: AsyncSession,
+        query_hash: str,
+        prompt_version: str,
+        query_text: str,
+        keywords: List[str],
+    ) -> None:
+        """Store the keywords for the query hash and prompt version, replacing older entries."""
+        insert_stmt = pg_insert(KeywordCache).values(
+            query_hash=query_hash,
+            prompt_version=prompt_version,
+            query_text=query_text,
+            keywords=keywords,
+        )
+        stmt = insert_stmt.on_conflict_do_update(
+            constraint="uq_keyword_cache_query_hash_prompt_version",
+            set_={"keywords": insert_stmt.excluded.keywords},
+        )
+
+        await session.execute(stmt)
+        await session.commit()
@@ -1,5 +1,8 @@
+from typing import List, Optional
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.models import Paper
 
@@ -15,3 +18,21 @@ class PaperRepository:
         stmt = select(Paper).where(Paper.paper_id == paper_id)
         result = await session.scalars(stmt)
         return result.first()
+
+    @staticmethod
+    async def get_paper_embedding_by_id(session: AsyncSession, paper_id: int) -> Optional[Paper]:
+        """
+        Returns a paper identified by its id with only its embedding loaded
+        """
+        stmt = select(Paper).where(Paper.paper_id == paper_id).options(load_only(Paper.embedding))
+        result = await session.scalars(stmt)
+        return result.first()
+
+    @staticmethod
+    async def get_papers_by_ids(session: AsyncSession, paper_ids: List[int]) -> List[Paper]:
+        """
+        Returns the papers with the given ids (in no particular order); unknown ids are skipped
+        """
+        stmt = select(Paper).where(Paper.paper_id.in_(paper_ids))
+        result = await session.scalars(stmt)
+        return list(result.all())
@@ -1,11 +1,13 @@
 from typing import List, Optional
 
-from sqlalchemy import select, func
+from sqlalchemy import Select, exists, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.paper import Paper
 from app.models.project import Project
+from app.models.project_centroid import ProjectCentroid
 from app.models.project_paper import ProjectPaper
 
 
@@ -124,8 +126,12 @@ class ProjectRepository:
         existing_link = existing_result.first()
 
         if existing_link is None:
+            # The centroid is updated in the same transaction as the link
+            await ProjectRepository._ensure_centroid(session, project_id)
             link = ProjectPaper(project_id=project_id, paper_id=paper_id)
             session.add(link)
+            await session.flush()
+            await ProjectRepository._add_to_centroid(session, project_id, paper_id)
             await session.commit()
 
         await session.refresh(project, attribute_names=["papers"])
@@ -151,12 +157,126 @@ class ProjectRepository:
         link = link_result.first()
 
         if link is not None:
+            await ProjectRepository._ensure_centroid(session, project_id)
             await session.delete(link)
+            await session.flush()
+            await ProjectRepository._rebuild_centroid(session, project_id)
             await session.commit()
 
         await session.refresh(project, attribute_names=["papers"])
         return project
 
+    @staticmethod
+    def paper_ids_stmt(project_id: int) -> Select:
+        """Return a statement selecting the ids of the papers stored in a project."""
+        return select(ProjectPaper.paper_id).where(ProjectPaper.project_id == project_id)
+
+    # ------------------------------------------------------------------
+    # Project centroid (running embedding sum / count)
+    # ------------------------------------------------------------------
+    @staticmethod
+    async def get_centroid(
+            session: AsyncSession,
+            project_id: int,
+    ) -> ProjectCentroid:
+        """Return the embedding centroid of a project, computing it on first access."""
+        await ProjectRepository._ensure_centroid(session, project_id)
+        await session.commit()
+        result = await session.scalars(
+            select(ProjectCentroid).where(ProjectCentroid.project_id == project_id)
+        )
+        return result.one()
+
+    @staticmethod
+    async def _ensure_centroid(
+            session: AsyncSession,
+            project_id: int,
+    ) -> None:
+        """
+        Create the centroid row of a project from all its papers, unless it already exists.
+        Only projects created before centroids were maintained, and projects whose centroid
+        was invalidated by a rewritten paper embedding (see ProjectCentroid), need this
+        backfill; for all other projects the aggregate is skipped, since the NOT EXISTS
+        condition is evaluated once before the join. Concurrent backfills are resolved by
+        ON CONFLICT DO NOTHING.
+        """
+        aggregate = (
+            select(
+                literal(project_id),
+                func.sum(Paper.embedding),
+                func.count(Paper.embedding),
+            )
+            .select_from(ProjectPaper)
+            .join(Paper, Paper.paper_id == ProjectPaper.paper_id)
+            .where(
+                ProjectPaper.project_id == project_id,
+                ~exists().where(ProjectCentroid.project_id == project_id),
+            )
+        )
+        await session.execute(
+            insert(ProjectCentroid)
+            .from_select(["project_id", "embedding_sum", "paper_count"], aggregate)
+            .on_conflict_do_nothing(index_elements=[ProjectCentroid.project_id])
+        )
+
+    @staticmethod
+    async def _add_to_centroid(
+            session: AsyncSession,
+            project_id: int,
+            paper_id: int,
+    ) -> None:
+        """
+        Add the embedding of a paper to the centroid of a project.
+        A single UPDATE, so concurrent changes of the same project are serialized by its row
+        lock. Papers without an embedding do not change the centroid.
+        """
+        await session.execute(
+            update(ProjectCentroid)
+            .where(
+                ProjectCentroid.project_id == project_id,
+                Paper.paper_id == paper_id,
+                Paper.embedding.is_not(None),
+            )
+            .values(
+                embedding_sum=func.coalesce(
+                    ProjectCentroid.embedding_sum.op("+")(Paper.embedding), Paper.embedding
+                ),
+                paper_count=ProjectCentroid.paper_count + 1,
+            )
+        )
+
+    @staticmethod
+    async def _rebuild_centroid(
+            session: AsyncSession,
+            project_id: int,
+    ) -> None:
+        """
+        Recompute the centroid of a project from its current papers (after a removal).
+        Subtracting the removed paper would leave the rounding residue in the sum, and a
+        wrong sum if its embedding was rewritten after it was added. The row is locked
+        first, so the aggregate (a new statement) sees the papers of concurrent changes
+        that committed while waiting.
+        """
+        await session.execute(
+            select(ProjectCentroid.project_id)
+            .where(ProjectCentroid.project_id == project_id)
+            .with_for_update()
+        )
+        papers = (
+            select(Paper.embedding)
+            .join(ProjectPaper, ProjectPaper.paper_id == Paper.paper_id)
+            .where(ProjectPaper.project_id == project_id)
+            .subquery()
+        )
+        await session.execute(
+            update(ProjectCentroid)
+            .where(ProjectCentroid.project_id == project_id)
+            .values(
+                embedding_sum=select(func.sum(papers.c.embedding)).scalar_subquery(),
+                paper_count=select(func.count(papers.c.embedding)).scalar_subquery(),
+            )
+        )
+
     # ------------------------------------------------------------------
     # Project checks (existence / ownership)
     # ------------------------------------------------------------------
@@ -1,16 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
 from datetime import date
-from typing import List, Optional, Tuple, Union
+from enum import Enum
+from functools import reduce
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
 
 import numpy as np
-from sqlalchemy import ColumnElement, and_, or_, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from pgvector.sqlalchemy import BIT, HALFVEC, Vector
+from sqlalchemy import (
+    ColumnElement,
+    Executable,
+    Float,
+    Integer,
+    Select,
+    and_,
+    cast,
+    event,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    true,
+    union_all,
+    values,
+)
+from sqlalchemy import column as sql_column
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement
 
+from app.core.config import settings
+from app.models.paper import (
+    PAPER_EMBEDDING_BINARY,
+    PAPER_EMBEDDING_HALFVEC,
+    PAPER_TS_CONFIG,
+)
 from app.models.paper import Paper as PaperModel
 from app.schemas.search_dto import (
     AdvancedSearchFilter,
     ConditionGroup,
+    SearchTier,
     TextCondition,
 )
+from app.utils.timing_utils import stage_timer
+from app.utils.vector_utils import (
+    centroid,
+    mean_cosine_distances,
+    mean_unit_vector,
+    rank_by_distance,
+    reciprocal_rank_fusion,
+    to_matrix,
+)
+
+logger = logging.getLogger("inquiro")
 
 # Mapping from DTO field names to SQLAlchemy model columns
 _FIELD_COLUMN = {
@@ -18,42 +65,644 @@ _FIELD_COLUMN = {
     "abstract": PaperModel.abstract,
 }
 
+_LIKE_ESCAPE = "\\"
+
+# Largest hnsw.ef_search value accepted by pgvector
+HNSW_MAX_EF_SEARCH = 1000
+
+# Key of the session-level hnsw.ef_search in the info dict of a connection
+_CONNECTION_EF_SEARCH = "hnsw.ef_search"
+
+# Key of the (transaction, HNSW settings) set with SET LOCAL in the info dict of a session
+_TRANSACTION_INDEX_SETTINGS = "hnsw.transaction_settings"
+
+CandidateStrategy = Literal["centroid", "multi_probe"]
+
+
+class FilteredSearchPlan(str, Enum):
+    """Strategy used to combine the vector index with advanced search filters."""
+
+    # Filter the rows produced by the regular HNSW index scan (unselective filters)
+    POST_FILTER = "post_filter"
+    # Let pgvector keep scanning the HNSW index until enough rows pass the filter
+    ITERATIVE_SCAN = "iterative_scan"
+    # Compute the exact distance for every paper matching the filter (very selective filters)
+    EXACT_SCAN = "exact_scan"
+
+
+class _Explain(Executable, ClauseElement):  # pylint: disable=abstract-method,too-many-ancestors
+    """EXPLAIN (FORMAT JSON) of a statement, used to read the planner's row estimate."""
+
+    inherit_cache = False
+
+    def __init__(self, stmt: Select) -> None:
+        self.stmt = stmt
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.stmt, **kw)
+
+
+@dataclass(frozen=True)
+class VectorSearchParams:
+    """Vector index parameters of a search tier."""
+
+    # Size of the HNSW candidate list (hnsw.ef_search) during the index scan
+    ef_search: int
+    # Number of nearest neighbours of the query centroid that are considered for reranking
+    pool_size: int
+
+    @classmethod
+    def for_tier(cls, tier: SearchTier, exact: bool = False) -> VectorSearchParams:
+        """
+        Return the configured parameters of a tier.
+        The binary index retrieves more candidates, since its Hamming distances are coarse;
+        with exact=True (candidates found by float32 distance, e.g. by the embedding replica)
+        the pool is not enlarged.
+        An HNSW scan returns at most ef_search rows, so ef_search is raised to the pool size.
+        """
+        ef_search, pool_size = {
+            "fast": (settings.SEARCH_FAST_EF_SEARCH, settings.SEARCH_FAST_POOL_SIZE),
+            "balanced": (settings.SEARCH_BALANCED_EF_SEARCH, settings.SEARCH_BALANCED_POOL_SIZE),
+            "exhaustive": (
+                settings.SEARCH_EXHAUSTIVE_EF_SEARCH,
+                settings.SEARCH_EXHAUSTIVE_POOL_SIZE,
+            ),
+        }[tier]
+        if settings.VECTOR_INDEX_QUANTIZATION == "binary" and not exact:
+            pool_size *= settings.VECTOR_INDEX_BINARY_OVERSAMPLING
+        pool_size = min(pool_size, HNSW_MAX_EF_SEARCH)
+        ef_search = min(max(ef_search, pool_size), HNSW_MAX_EF_SEARCH)
+        return cls(ef_search=ef_search, pool_size=pool_size)
+
 
 class SearchRepository:
     """Repository for search-related database operations."""
 
+    # Max. avg. cosine distance of a search result to the query embeddings
+    DEFAULT_DISTANCE_THRESHOLD = 0.4
+    # Lower bound for the number of neighbours retrieved per query vector in multi-probe mode
+    MIN_PROBE_SIZE = 100
+    # Number of full-text matches that are merged with the vector candidates in hybrid search
+    LEXICAL_POOL_SIZE = 100
+    # Max. number of full-text matches that are ranked to select the LEXICAL_POOL_SIZE best
+    LEXICAL_MATCH_LIMIT = 5000
+    # Rank offset of the reciprocal rank fusion (60 is the value from the original paper)
+    RRF_K = 60
+
     @staticmethod
-    async def search_papers_by_embeddings(
+    async def search_papers_by_embeddings(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         db: AsyncSession,
         embeddings: List[List[float]],
-        limit: int = 5,
-        threshold: float = 0.4,
+        limit: Optional[int] = 5,
+        threshold: float = DEFAULT_DISTANCE_THRESHOLD,
         search_filter: Optional[AdvancedSearchFilter] = None,
-    ) -> List[Tuple[PaperModel, float]]:
+        tier: SearchTier = "balanced",
+        strategy: Optional[CandidateStrategy] = None,
+        excluded_ids: Optional[Select] = None,
+    ) -> List[Tuple[int, float]]:
         """
         Perform a vector search for papers based on a list of embeddings.
-        Returns a list of (PaperModel, avg_distance) tuples ordered by ascending distance.
+        Returns a list of (paper_id, avg_distance) tuples ordered by ascending distance; the
+        caller loads the papers of the page it returns (see PaperRepository.get_papers_by_ids).
+        With limit=None, all candidates below the threshold are returned.
         Optionally applies advanced search filters (year range, text conditions).
+        The tier trades recall for latency (see VectorSearchParams).
+        The strategy selects how candidates are retrieved from the vector index (defaults to
+        SEARCH_CANDIDATE_STRATEGY, see _probe_vectors).
+        Papers whose id is selected by excluded_ids are left out of the candidates.
+        """
+        clauses = SearchRepository._build_filter_clauses(search_filter) if search_filter else []
+        cand_stmt = await SearchRepository._build_candidate_stmt(
+            db,
+            SearchRepository._probe_vectors(embeddings, strategy),
+            clauses,
+            VectorSearchParams.for_tier(tier),
+            excluded_ids,
+        )
+
+        if settings.SEARCH_RERANK_MODE == "database":
+            return await SearchRepository._rerank_in_database(
+                db, cand_stmt, embeddings, limit, threshold
+            )
+        return await SearchRepository._rerank_in_process(
+            db, cand_stmt, embeddings, limit, threshold
+        )
+
+    @staticmethod
+    async def search_papers_batch(
+        db: AsyncSession,
+        embeddings: List[List[List[float]]],
+        threshold: float = DEFAULT_DISTANCE_THRESHOLD,
+        search_filter: Optional[AdvancedSearchFilter] = None,
+        tier: SearchTier = "balanced",
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Perform the vector searches of several queries in a single statement.
+        embeddings holds the keyword embeddings of every query. The centroids of all queries
+        form a VALUES list, and a LATERAL subquery retrieves the nearest neighbours of each
+        centroid from the vector index. The candidates are reranked in the same statement by
+        their avg. distance to the query's keyword embeddings, so only ids and distances are
+        returned (see _build_batch_stmt).
+
+        Returns, per query, all (paper_id, avg_distance) below the threshold in ascending
+        order of distance. Queries without embeddings get an empty result.
+        """
+        query_indexes = [i for i, query in enumerate(embeddings) if query]
+        if not query_indexes:
+            return [[] for _ in embeddings]
+
+        clauses = SearchRepository._build_filter_clauses(search_filter) if search_filter else []
+        params = VectorSearchParams.for_tier(tier)
+        plan = FilteredSearchPlan.POST_FILTER
+        if clauses:
+            plan = await SearchRepository._choose_filtered_plan(db, clauses)
+        await SearchRepository._apply_index_settings(db, plan, params)
+
+        stmt = SearchRepository._build_batch_stmt(
+            [(i, mean_unit_vector(embeddings[i])) for i in query_indexes],
+            clauses,
+            plan,
+            params,
+            threshold,
+        )
+        with stage_timer("candidate_query"):
+            rows = (await db.execute(stmt)).all()
+        logger.info("Batch vector search: %d queries, %d results", len(query_indexes), len(rows))
+
+        # Rows are ordered by query and distance
+        results: List[List[Tuple[int, float]]] = [[] for _ in embeddings]
+        for query_index, paper_id, distance in rows:
+            results[query_index].append((paper_id, float(distance)))
+        return results
+
+    @staticmethod
+    def _build_batch_stmt(
+        probes: List[Tuple[int, np.ndarray]],
+        clauses: List[ColumnElement[bool]],
+        plan: FilteredSearchPlan,
+        params: VectorSearchParams,
+        threshold: float,
+    ) -> Select:
+        """
+        Build the query returning (query_index, paper_id, avg_distance) of the nearest
+        neighbours of every (query_index, mean_unit_vector) with a LATERAL join over a VALUES
+        list, ordered by query and distance. Neighbours at or above the threshold are dropped.
+        The avg. distance to the keyword embeddings is derived from the exact distance to
+        their mean (see mean_unit_vector), so no embeddings leave the database.
+        """
+        # Without the casts Postgres would infer the types of the VALUES columns as text
+        query_vectors = values(
+            sql_column("query_index", Integer),
+            sql_column("embedding", Vector(768)),
+            sql_column("norm", Float),
+            name="query_vectors",
+        ).data(
+            [
+                (
+                    cast(literal(query_index, Integer), Integer),
+                    cast(literal(mean.tolist(), Vector(768)), Vector(768)),
+                    cast(literal(float(np.linalg.norm(mean)), Float), Float),
+                )
+                for query_index, mean in probes
+            ]
+        )
+
+        if plan == FilteredSearchPlan.EXACT_SCAN:
+            filtered = (
+                select(PaperModel.paper_id, PaperModel.embedding)
+                .where(and_(*clauses))
+                .cte("filtered_papers")
+                .prefix_with("MATERIALIZED")
+            )
+            source = select(filtered.c.paper_id)
+            exact_distance = filtered.c.embedding.cosine_distance(query_vectors.c.embedding)
+            distance = exact_distance
+        else:
+            source = select(PaperModel.paper_id).where(*clauses)
+            exact_distance = PaperModel.embedding.cosine_distance(query_vectors.c.embedding)
+            distance = SearchRepository._index_distance(query_vectors.c.embedding)
+
+        norm = query_vectors.c.norm
+        avg_distance = (1 - norm + norm * exact_distance).label("avg_distance")
+        neighbours = (
+            source.add_columns(avg_distance)
+            .order_by(distance)
+            .limit(params.pool_size)
+            .lateral("neighbours")
+        )
+        return (
+            select(query_vectors.c.query_index, neighbours.c.paper_id, neighbours.c.avg_distance)
+            .join_from(query_vectors, neighbours, true())
+            .where(neighbours.c.avg_distance < threshold)
+            .order_by(query_vectors.c.query_index, neighbours.c.avg_distance)
+        )
+
+    @staticmethod
+    async def search_papers_hybrid(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        db: AsyncSession,
+        lexical_db: AsyncSession,
+        embeddings: List[List[float]],
+        lexical_terms: List[str],
+        limit: Optional[int] = 5,
+        threshold: float = DEFAULT_DISTANCE_THRESHOLD,
+        search_filter: Optional[AdvancedSearchFilter] = None,
+        tier: SearchTier = "balanced",
+    ) -> List[Tuple[int, float]]:
+        """
+        Perform a hybrid full-text + vector search for papers.
+
+        The vector candidate query (on db) and a full-text ranking query for the lexical terms
+        (on lexical_db) run concurrently. The union of both candidate lists is reranked by the
+        avg. distance to all search queries, and this ranking is merged with the full-text
+        ranking by reciprocal rank fusion. Full-text matches are kept even if their distance
+        exceeds the threshold, so verbatim terms such as dataset or model names are not lost.
+
+        Returns a list of (paper_id, avg_distance) tuples in fused order.
+        """
+        clauses = SearchRepository._build_filter_clauses(search_filter) if search_filter else []
+        cand_stmt = await SearchRepository._build_candidate_stmt(
+            db,
+            SearchRepository._probe_vectors(embeddings, None),
+            clauses,
+            VectorSearchParams.for_tier(tier),
+        )
+
+        with stage_timer("candidate_query"):
+            vector_result, lexical_rows = await asyncio.gather(
+                db.execute(cand_stmt),
+                SearchRepository._search_papers_by_text(lexical_db, lexical_terms, clauses),
+            )
+            vector_rows = vector_result.all()
+
+        with stage_timer("rerank"):
+            results = SearchRepository._fuse_candidates(
+                vector_rows, lexical_rows, embeddings, limit, threshold
+            )
+        logger.info(
+            "Hybrid search: %d vector candidates, %d full-text matches, %d results",
+            len(vector_rows),
+            len(lexical_rows),
+            len(results),
+        )
+        return results
+
+    @staticmethod
+    def _fuse_candidates(
+        vector_rows: Sequence[Any],
+        lexical_rows: Sequence[Any],
+        embeddings: List[List[float]],
+        limit: Optional[int],
+        threshold: float,
+    ) -> List[Tuple[int, float]]:
+        """
+        Rerank the union of both (paper_id, embedding) candidate lists by the avg. distance to
+        all search queries and merge that ranking with the full-text ranking by reciprocal
+        rank fusion.
+        """
+        candidates: Dict[int, Any] = {}
+        for paper_id, embedding in [*vector_rows, *lexical_rows]:
+            if embedding is not None:
+                candidates.setdefault(paper_id, embedding)
+        if not candidates:
+            return []
+
+        paper_ids = list(candidates)
+        distances = mean_cosine_distances(
+            to_matrix(list(candidates.values())),
+            to_matrix(embeddings),
+        )
+        distance_by_id = {paper_id: float(d) for paper_id, d in zip(paper_ids, distances)}
+
+        lexical_ids = [paper_id for paper_id, _ in lexical_rows]
+        scores = reciprocal_rank_fusion(
+            [[paper_ids[i] for i in np.argsort(distances, kind="stable")], lexical_ids],
+            k=SearchRepository.RRF_K,
+        )
+
+        fused_ids = [
+            paper_id
+            for paper_id in sorted(candidates, key=scores.__getitem__, reverse=True)
+            if distance_by_id[paper_id] < threshold or paper_id in lexical_ids
+        ]
+        if limit is not None:
+            fused_ids = fused_ids[:limit]
+
+        return [(paper_id, distance_by_id[paper_id]) for paper_id in fused_ids]
+
+    @staticmethod
+    async def _search_papers_by_text(
+        db: AsyncSession,
+        terms: List[str],
+        clauses: List[ColumnElement[bool]],
+    ) -> List[Any]:
+        """
+        Return the (paper_id, embedding) of the papers matching any of the terms in full-text
+        search, best match first.
+        Each term is parsed with websearch_to_tsquery, so quoted phrases are supported.
+        The matches are looked up in the GIN index of the stored search document. Only the
+        first LEXICAL_MATCH_LIMIT of them are ranked, so terms that occur in a large share of
+        all papers do not rank the whole table.
+        """
+        terms = [term for term in terms if term.strip()]
+        if not terms:
+            return []
+
+        queries: List[ColumnElement[Any]] = [
+            func.websearch_to_tsquery(PAPER_TS_CONFIG, term) for term in terms
+        ]
+        ts_query = reduce(lambda left, right: left.op("||")(right), queries)
+
+        matches = (
+            select(PaperModel.paper_id, PaperModel.search_document)
+            .where(PaperModel.search_document.op("@@")(ts_query), *clauses)
+            .limit(SearchRepository.LEXICAL_MATCH_LIMIT)
+            .subquery("text_matches")
+        )
+        stmt = (
+            select(PaperModel.paper_id, PaperModel.embedding)
+            .join(matches, PaperModel.paper_id == matches.c.paper_id)
+            .order_by(func.ts_rank_cd(matches.c.search_document, ts_query).desc())
+            .limit(SearchRepository.LEXICAL_POOL_SIZE)
+        )
+        return list((await db.execute(stmt)).all())
+
+    @staticmethod
+    def _probe_vectors(
+        embeddings: List[List[float]], strategy: Optional[CandidateStrategy]
+    ) -> List[List[float]]:
+        """
+        Return the vectors whose nearest neighbours form the rerank candidates.
+        "centroid" probes the normalized mean of all search queries; "multi_probe" probes every
+        search query, so papers that match a single query well are not lost.
+        """
+        if (strategy or settings.SEARCH_CANDIDATE_STRATEGY) == "multi_probe":
+            return [list(embedding) for embedding in embeddings]
+        return [centroid(embeddings).tolist()]
+
+    @staticmethod
+    def probe_size(pool_size: int, probe_count: int) -> int:
+        """
+        Return the number of nearest neighbours retrieved per probe vector.
+        The pool is split between the probes, so the number of candidates stays comparable.
+        """
+        if probe_count <= 1:
+            return pool_size
+        return max(pool_size // probe_count, SearchRepository.MIN_PROBE_SIZE)
+
+    @staticmethod
+    async def _build_candidate_stmt(
+        db: AsyncSession,
+        probes: List[List[float]],
+        clauses: List[ColumnElement[bool]],
+        params: VectorSearchParams,
+        excluded_ids: Optional[Select] = None,
+    ) -> Select:
+        """
+        Build the query for the (paper_id, embedding) of the rerank candidates: the union of
+        the nearest neighbours of all probe vectors. Several probes are combined in a single
+        UNION ALL statement, in which every branch is a separate index scan. Index scans order
+        by the (possibly quantized) representation of the configured HNSW index; the exact
+        scan uses the float32 vectors.
+        The index search parameters are set for the current transaction only, unless they
+        are already in effect (see _apply_index_settings).
+        Excluded ids are filtered from the rows of the index scan. They can make up a large
+        share of the nearest neighbours (e.g. the papers of a project are close to its
+        centroid), so a plain index scan is turned into an iterative scan, which keeps
+        scanning the index until pool_size rows remain.
+        """
+        plan = FilteredSearchPlan.POST_FILTER
+        if clauses:
+            plan = await SearchRepository._choose_filtered_plan(db, clauses)
+        if excluded_ids is not None and plan == FilteredSearchPlan.POST_FILTER:
+            plan = FilteredSearchPlan.ITERATIVE_SCAN
+        await SearchRepository._apply_index_settings(db, plan, params)
+
+        if excluded_ids is not None:
+            clauses = [*clauses, PaperModel.paper_id.not_in(excluded_ids)]
+
+        if len(probes) == 1 and plan != FilteredSearchPlan.EXACT_SCAN:
+            return (
+                select(PaperModel.paper_id, PaperModel.embedding)
+                .where(*clauses)
+                .order_by(SearchRepository._index_distance(probes[0]))
+                .limit(params.pool_size)
+            )
+
+        probe_size = SearchRepository.probe_size(params.pool_size, len(probes))
+
+        if plan == FilteredSearchPlan.EXACT_SCAN:
+            # A materialized CTE cannot use the HNSW index, so Postgres computes the exact
+            # distance for every matching paper instead of scanning the index
+            filtered = (
+                select(PaperModel.paper_id, PaperModel.embedding)
+                .where(and_(*clauses))
+                .cte("filtered_papers")
+                .prefix_with("MATERIALIZED")
+            )
+            source = select(filtered.c.paper_id)
+            distance = filtered.c.embedding.cosine_distance
+        else:
+            source = select(PaperModel.paper_id).where(*clauses)
+            distance = SearchRepository._index_distance
+
+        nearest_ids = [source.order_by(distance(probe)).limit(probe_size) for probe in probes]
+        candidate_ids = nearest_ids[0]
+        if len(nearest_ids) > 1:
+            union = union_all(*nearest_ids).subquery("probe_neighbours")
+            candidate_ids = select(union.c.paper_id)
+        return select(PaperModel.paper_id, PaperModel.embedding).where(
+            PaperModel.paper_id.in_(candidate_ids)
+        )
+
+    @staticmethod
+    def _index_distance(
+        probe: Union[List[float], ColumnElement[Any]],
+    ) -> ColumnElement[float]:
+        """
+        Return the distance to the probe in the representation of the configured HNSW index,
+        so that the ORDER BY is answered by that index.
+        The probe is a vector or a vector-typed column (e.g. of a LATERAL join).
+        """
+        is_column = isinstance(probe, ColumnElement)
+        if settings.VECTOR_INDEX_QUANTIZATION == "halfvec":
+            return PAPER_EMBEDDING_HALFVEC.cosine_distance(
+                cast(probe, HALFVEC(768)) if is_column else probe
+            )
+        if settings.VECTOR_INDEX_QUANTIZATION == "binary":
+            probe_vector = probe if is_column else cast(literal(probe, Vector(768)), Vector(768))
+            return PAPER_EMBEDDING_BINARY.hamming_distance(
+                cast(func.binary_quantize(probe_vector), BIT(768))
+            )
+        return PaperModel.embedding.cosine_distance(probe)
+
+    @staticmethod
+    def register_connection_defaults(async_engine: AsyncEngine) -> None:
+        """
+        Start every new connection of the engine with the ef_search of SEARCH_DEFAULT_TIER
+        as session default, so searches of the default tier need no SET LOCAL round trip.
+        """
+        ef_search = VectorSearchParams.for_tier(settings.SEARCH_DEFAULT_TIER).ef_search
+
+        def set_defaults(dbapi_connection: Any, connection_record: Any) -> None:
+            # A SET inside the driver's implicit transaction would be undone by its rollback
+            autocommit = dbapi_connection.autocommit
+            dbapi_connection.autocommit = True
+            cursor = dbapi_connection.cursor()
+            cursor.execute(f"SET hnsw.ef_search = {int(ef_search)}")
+            cursor.close()
+            dbapi_connection.autocommit = autocommit
+            connection_record.info[_CONNECTION_EF_SEARCH] = ef_search
+
+        event.listen(async_engine.sync_engine, "connect", set_defaults)
+
+    @staticmethod
+    async def _apply_index_settings(
+        db: AsyncSession, plan: FilteredSearchPlan, params: VectorSearchParams
+    ) -> None:
+        """
+        Set the HNSW search parameters of the plan for the current transaction, in a single
+        statement. Only the parameters that differ from the values in effect are set: the
+        defaults of the connection (see register_connection_defaults), overridden by the
+        values an earlier search of the same transaction set (tracked in db.info).
         """
-        # Compute centroid of all extracted search queries, so we can use the IVF index for
-        # efficient vector searches
-        vecs = np.array(embeddings, dtype=np.float32)
-        q = vecs.mean(axis=0)
-        q /= np.linalg.norm(q) + 1e-12
-        q_list = q.tolist()
+        if plan == FilteredSearchPlan.EXACT_SCAN:
+            return
 
-        cand_stmt = (
-            select(PaperModel.paper_id)
-            .order_by(PaperModel.embedding.cosine_distance(q_list))
-            .limit(500)
+        if plan == FilteredSearchPlan.POST_FILTER:
+            wanted = {"hnsw.iterative_scan": "off", "hnsw.ef_search": str(params.ef_search)}
+        else:
+            ef_search = min(
+                max(settings.SEARCH_ITERATIVE_SCAN_EF_SEARCH, params.ef_search),
+                HNSW_MAX_EF_SEARCH,
+            )
+            wanted = {"hnsw.iterative_scan": "relaxed_order", "hnsw.ef_search": str(ef_search)}
+
+        connection = await db.connection()
+        default_ef_search = connection.info.get(_CONNECTION_EF_SEARCH)
+        current: Dict[str, Optional[str]] = {
+            "hnsw.iterative_scan": "off",
+            "hnsw.ef_search": str(default_ef_search) if default_ef_search is not None else None,
+        }
+        transaction = db.sync_session.get_transaction()
+        local: Dict[str, str] = {}
+        tracked = db.info.get(_TRANSACTION_INDEX_SETTINGS)
+        if tracked is not None and tracked[0] is transaction:
+            local = tracked[1]
+        current.update(local)
+
+        changed = {name: value for name, value in wanted.items() if current[name] != value}
+        if not changed:
+            return
+
+        calls = ", ".join(
+            f"set_config('{name}', :value_{i}, true)" for i, name in enumerate(changed)
         )
+        with stage_timer("index_settings"):
+            await db.execute(
+                text(f"SELECT {calls}"),
+                {f"value_{i}": value for i, value in enumerate(changed.values())},
+            )
+        db.info[_TRANSACTION_INDEX_SETTINGS] = (transaction, {**local, **changed})
 
-        if search_filter:
-            clauses = SearchRepository._build_filter_clauses(search_filter)
-            if clauses:
-                cand_stmt = cand_stmt.where(and_(*clauses))
+    @staticmethod
+    async def _choose_filtered_plan(
+        db: AsyncSession, clauses: List[ColumnElement[bool]]
+    ) -> FilteredSearchPlan:
+        """
+        Choose how to retrieve the candidates of a filtered search based on the estimated
+        selectivity of the filter.
 
-        cand_ids = [r[0] for r in (await db.execute(cand_stmt)).all()]
+        An HNSW index scan only visits hnsw.ef_search entries, so adding a selective WHERE
+        clause to it returns far fewer than pool_size rows. Depending on how many
+        papers match the filter, the candidates are therefore retrieved with
+        - an exact scan over the matching papers (few matches),
+        - an iterative HNSW scan with a larger ef_search (selective filters), or
+        - a plain HNSW scan with the filter applied to its rows (unselective filters).
+        """
+        with stage_timer("filter_plan"):
+            matching, total = await SearchRepository._estimate_filter_rows(db, clauses)
+        selectivity = matching / total if total > 0 else 1.0
+
+        if matching <= settings.SEARCH_EXACT_SCAN_MAX_ROWS:
+            plan = FilteredSearchPlan.EXACT_SCAN
+        elif selectivity <= settings.SEARCH_ITERATIVE_SCAN_MAX_SELECTIVITY:
+            plan = FilteredSearchPlan.ITERATIVE_SCAN
+        else:
+            plan = FilteredSearchPlan.POST_FILTER
+
+        logger.info(
+            "Filtered vector search plan: %s (estimated %d of %d papers match, selectivity %.4f)",
+            plan.value,
+            matching,
+            total,
+            selectivity,
+        )
+        return plan
+
+    @staticmethod
+    async def _estimate_filter_rows(
+        db: AsyncSession, clauses: List[ColumnElement[bool]]
+    ) -> Tuple[float, float]:
+        """
+        Return the (matching, total) number of papers estimated from the Postgres statistics.
+        Neither number requires a scan of the paper table.
+        """
+        total = await db.scalar(
+            text("SELECT reltuples FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+            {"table": PaperModel.__tablename__},
+        )
+
+        explain = await db.scalar(_Explain(select(PaperModel.paper_id).where(and_(*clauses))))
+        plan = json.loads(explain) if isinstance(explain, str) else explain
+        matching = float(plan[0]["Plan"]["Plan Rows"])
+
+        # reltuples is -1 if the table has never been analyzed
+        return matching, max(float(total or 0), 0.0)
+
+    @staticmethod
+    async def _rerank_in_process(
+        db: AsyncSession,
+        cand_stmt: Select,
+        embeddings: List[List[float]],
+        limit: Optional[int],
+        threshold: float,
+    ) -> List[Tuple[int, float]]:
+        """
+        Fetch the ids and embeddings of the candidates in a single round trip and rerank them
+        by the avg. distance to all search queries as one numpy matrix product.
+        """
+        with stage_timer("candidate_query"):
+            result = await db.execute(cand_stmt)
+            candidates = [(paper_id, emb) for paper_id, emb in result.all() if emb is not None]
+        if not candidates:
+            return []
+
+        with stage_timer("rerank"):
+            distances = mean_cosine_distances(
+                to_matrix([embedding for _, embedding in candidates]),
+                to_matrix(embeddings),
+            )
+            order = rank_by_distance(distances, threshold, limit)
+
+        return [(candidates[i][0], float(distances[i])) for i in order]
+
+    @staticmethod
+    async def _rerank_in_database(
+        db: AsyncSession,
+        cand_stmt: Select,
+        embeddings: List[List[float]],
+        limit: Optional[int],
+        threshold: float,
+    ) -> List[Tuple[int, float]]:
+        """
+        Rerank the candidates inside Postgres using a second query that computes the avg.
+        distance to all search queries.
+        """
+        id_stmt = cand_stmt.with_only_columns(PaperModel.paper_id)
+        with stage_timer("candidate_query"):
+            cand_ids = [r[0] for r in (await db.execute(id_stmt)).all()]
 
         # Rerank the retrieved results based on the avg. distance to all search queries
         # This drastically improves the quality of the responses with negligible more runtime
@@ -61,15 +710,16 @@ class SearchRepository:
         avg_distance = sum(distance_exprs) / len(distance_exprs)
 
         stmt = (
-            select(PaperModel, avg_distance.label("avg_distance"))
+            select(PaperModel.paper_id, avg_distance.label("avg_distance"))
             .where(avg_distance < threshold, PaperModel.paper_id.in_(cand_ids))
             .order_by(avg_distance.asc())
             .limit(limit)
         )
 
-        rows = (await db.execute(stmt)).all()
+        with stage_timer("rerank_query"):
+            rows = (await db.execute(stmt)).all()
 
-        return [(paper, float(dist)) for paper, dist in rows]
+        return [(paper_id, float(dist)) for paper_id, dist in rows]
 
     @staticmethod
     def _build_filter_clauses(search_filter: AdvancedSearchFilter) -> list:
@@ -116,8 +766,21 @@ class SearchRepository:
             return SearchRepository._build_group_clause(node)
 
         column = _FIELD_COLUMN[node.field]
-        pattern = f"%{node.value}%"
+        # A substring ILIKE can be answered by the trigram (pg_trgm) GIN index on the column.
+        # LIKE wildcards in the user input are escaped so they match literally.
+        pattern = f"%{_escape_like(node.value)}%"
 
         if node.operator == "contains":
-            return column.ilike(pattern)
-        return or_(column.is_(None), ~column.ilike(pattern))
+            return column.ilike(pattern, escape=_LIKE_ESCAPE)
+        # Negated conditions match most papers, so they are cheapest to evaluate on the rows
+        # produced by the vector search instead of through the index
+        return or_(column.is_(None), ~column.ilike(pattern, escape=_LIKE_ESCAPE))
+
+
+def _escape_like(value: str) -> str:
+    """Escape the LIKE wildcards and the escape character itself in a search term."""
+    return (
+        value.replace(_LIKE_ESCAPE, _LIKE_ESCAPE * 2)
+        .replace("%", _LIKE_ESCAPE + "%")
+        .replace("_", _LIKE_ESCAPE + "_")
+    )
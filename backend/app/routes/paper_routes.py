@@ -1,19 +1,25 @@
 import io
 import logging
+from typing import Optional
 
-from fastapi import APIRouter, Depends, Request, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.deps import get_advanced_filter, get_paper_projection
 from app.core.limiter import limiter
 from app.schemas.paper_dto import (
     PaperChatRequest,
     PaperChatResponse,
+    PaperProjection,
     PaperSummaryRequest,
     PaperSummaryResponse,
 )
+from app.schemas.search_dto import AdvancedSearchFilter, SearchResponse, SearchTier
 from app.services.paper_service import PaperService
+from app.services.search_service import SearchService
+from app.utils.response_utils import paper_list_response
 
 logger = logging.getLogger("inquiro")
 
@@ -90,3 +96,35 @@ async def get_paper_pdf(
         media_type="application/pdf",
         headers={"Content-Disposition": f"inline; filename=paper_{paper_id}.pdf"},
     )
+
+
+@router.get(
+    "/{paper_id}/similar",
+    response_model=SearchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Find papers similar to the specified paper",
+)
+@limiter.shared_limit("60/minute", scope="paper_similar")
+async def similar_papers(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    request: Request,  # pylint: disable=unused-argument
+    paper_id: int,
+    limit: int = Query(default=10, ge=1, le=50),
+    tier: Optional[SearchTier] = Query(default=None),
+    search_filter: Optional[AdvancedSearchFilter] = Depends(get_advanced_filter),
+    projection: PaperProjection = Depends(get_paper_projection),
+    db: AsyncSession = Depends(get_db),
+) -> ORJSONResponse:
+    """
+    Returns the papers closest to the stored embedding of the specified paper, which itself is
+    excluded. Needs no LLM call or query embedding.
+    Optionally accepts a JSON-encoded advanced filter (query parameter advanced_filter).
+    Papers can be reduced to the listed fields and abstracts truncated.
+    """
+    papers = await SearchService.find_similar_papers(
+        paper_id=paper_id,
+        db=db,
+        search_filter=search_filter,
+        tier=tier,
+        limit=limit,
+    )
+    return paper_list_response(papers, projection)
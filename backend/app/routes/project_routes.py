@@ -1,15 +1,24 @@
-from fastapi import APIRouter, Depends, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.deps import get_paper_projection
+from app.core.limiter import limiter
 from app.core.security import get_current_user_id
+from app.schemas.paper_dto import PaperProjection
 from app.schemas.project_dto import (
     ProjectCreate,
+    ProjectRecommendationsResponse,
     ProjectResponse,
     ProjectUpdate,
     ProjectWithPapersResponse,
 )
+from app.schemas.search_dto import SearchTier
 from app.services.project_service import ProjectService
+from app.utils.response_utils import paper_list_response
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
@@ -89,13 +98,49 @@ async def get_papers_for_project(
         project_id: int,
         db: AsyncSession = Depends(get_db),
         current_user_id: int = Depends(get_current_user_id),
-) -> ProjectWithPapersResponse:
-    """Retrieve all papers for a project."""
-    return await ProjectService.list_project_papers(
+        projection: PaperProjection = Depends(get_paper_projection),
+) -> ORJSONResponse:
+    """
+    Retrieve all papers for a project.
+    Papers can be reduced to the listed fields and abstracts truncated.
+    """
+    response = await ProjectService.list_project_papers(
         session=db,
         user_id=current_user_id,
         project_id=project_id,
     )
+    return paper_list_response(response, projection)
+
+
+@router.get(
+    "/{project_id}/recommendations",
+    response_model=ProjectRecommendationsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Recommend papers for a project",
+)
+@limiter.shared_limit("60/minute", scope="project_recommendations")
+async def get_project_recommendations(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        request: Request,  # pylint: disable=unused-argument
+        project_id: int,
+        limit: int = Query(default=10, ge=1, le=50),
+        tier: Optional[SearchTier] = Query(default=None),
+        db: AsyncSession = Depends(get_db),
+        current_user_id: int = Depends(get_current_user_id),
+        projection: PaperProjection = Depends(get_paper_projection),
+) -> ORJSONResponse:
+    """
+    Recommend papers similar to the papers of the project, excluding the papers it
+    already contains.
+    Papers can be reduced to the listed fields and abstracts truncated.
+    """
+    response = await ProjectService.recommend_papers(
+        session=db,
+        user_id=current_user_id,
+        project_id=project_id,
+        limit=limit,
+        tier=tier,
+    )
+    return paper_list_response(response, projection)
 
 
 @router.post(
@@ -109,10 +154,14 @@ async def add_paper_to_project(
         paper_id: int,
         current_user_id: int = Depends(get_current_user_id),
         db: AsyncSession = Depends(get_db),
-) -> ProjectWithPapersResponse:
+        projection: PaperProjection = Depends(get_paper_projection),
+) -> ORJSONResponse:
     """Store a reference to an existing paper in the given project."""
 
-    return await ProjectService.add_paper_to_project(db, current_user_id, project_id, paper_id)
+    response = await ProjectService.add_paper_to_project(
+        db, current_user_id, project_id, paper_id
+    )
+    return paper_list_response(response, projection)
 
 
 @router.delete(
@@ -126,7 +175,11 @@ async def remove_paper_from_project(
         paper_id: int,
         current_user_id: int = Depends(get_current_user_id),
         db: AsyncSession = Depends(get_db),
-) -> ProjectWithPapersResponse:
+        projection: PaperProjection = Depends(get_paper_projection),
+) -> ORJSONResponse:
     """Remove a stored paper reference from the given project."""
 
-    return await ProjectService.remove_paper_from_project(db, current_user_id, project_id, paper_id)
+    response = await ProjectService.remove_paper_from_project(
+        db, current_user_id, project_id, paper_id
+    )
+    return paper_list_response(response, projection)
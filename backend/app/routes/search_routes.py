@@ -1,16 +1,38 @@
-import json
-
+import orjson
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.deps import parse_advanced_filter
 from app.core.limiter import limiter
-from app.schemas.search_dto import AdvancedSearchFilter, SearchRequest, SearchResponse
+from app.core.security import get_current_user_id
+from app.schemas.paper_dto import PAPER_FIELDS_DESCRIPTION, PaperField, PaperProjection
+from app.schemas.search_dto import (
+    MAX_BATCH_QUERIES,
+    BatchSearchRequest,
+    BatchSearchResponse,
+    SearchMode,
+    SearchRequest,
+    SearchResponse,
+    SearchTier,
+)
 from app.services.search_service import SearchService
+from app.utils.response_utils import paper_list_content, paper_list_response
 
 router = APIRouter(prefix="/search", tags=["Search"])
 
 
+def _count_batch_queries(request: Request, payload: BatchSearchRequest) -> None:
+    """Record the number of queries of a batch search for its rate limit."""
+    request.state.batch_query_count = len(payload.queries)
+
+
+def _batch_query_count(request: Request) -> int:
+    """Rate limit cost of a batch search: one hit per query."""
+    return request.state.batch_query_count
+
+
 @router.post(
     "",
     response_model=SearchResponse,
@@ -22,18 +44,95 @@ async def search(
     request: Request,  # pylint: disable=unused-argument
     payload: SearchRequest,
     db: AsyncSession = Depends(get_db),
-) -> SearchResponse:
+) -> ORJSONResponse:
     """
     Returns a list of papers that match the search query.
     Optionally accepts an advanced filter with year range and text conditions.
+    With mode "hybrid", exact term matches from full-text search are merged into the results.
+    The optional tier ("fast", "balanced", "exhaustive") trades recall for latency.
+    Further pages are requested by repeating the search with the returned next_cursor.
+    Papers can be reduced to the listed fields and abstracts truncated.
     """
 
     papers = await SearchService.search_papers(
         query=payload.query,
         db=db,
         search_filter=payload.filter,
+        mode=payload.mode,
+        tier=payload.tier,
+        page_size=payload.page_size,
+        cursor=payload.cursor,
+    )
+    return paper_list_response(papers, payload.projection)
+
+
+@router.post(
+    "/batch",
+    response_model=BatchSearchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Search for papers with many queries at once",
+    dependencies=[Depends(get_current_user_id), Depends(_count_batch_queries)],
+)
+@limiter.limit(f"{MAX_BATCH_QUERIES}/minute", cost=_batch_query_count)
+async def search_batch(
+    request: Request,  # pylint: disable=unused-argument
+    payload: BatchSearchRequest,
+    db: AsyncSession = Depends(get_db),
+) -> ORJSONResponse:
+    """
+    Returns one result list per query, in the order of the queries. Requires authentication;
+    the rate limit counts every query of the batch.
+    All queries share the filter, tier, page size and projection. They are searched
+    together, so one batch costs a fraction of the same number of single searches.
+    Queries that violate the safety policies get an error instead of papers.
+    Further pages of a query are requested from POST /search with its next_cursor.
+    """
+    response = await SearchService.search_papers_batch(
+        queries=payload.queries,
+        db=db,
+        search_filter=payload.filter,
+        tier=payload.tier,
+        page_size=payload.page_size,
+    )
+    return ORJSONResponse(
+        {"results": [paper_list_content(result, payload.projection) for result in response.results]}
+    )
+
+
+@router.post(
+    "/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Search for papers with progressively streamed results",
+)
+@limiter.limit("5/minute")
+async def search_stream(
+    request: Request,  # pylint: disable=unused-argument
+    payload: SearchRequest,
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Streams newline-delimited JSON (SearchStreamChunk per line).
+    The first line contains a preliminary ranking based on the raw query, the second line the
+    final ranking based on the extracted keywords. Cached searches only stream the final line.
+    Further pages are requested from POST /search with the final next_cursor.
+    """
+    chunks = await SearchService.stream_search_papers(
+        query=payload.query,
+        db=db,
+        search_filter=payload.filter,
+        mode=payload.mode,
+        tier=payload.tier,
+        page_size=payload.page_size,
+    )
+    projection = payload.projection
+    return StreamingResponse(
+        (
+            orjson.dumps(paper_list_content(chunk, projection)) + b"\n"  # pylint: disable=no-member
+            async for chunk in chunks
+        ),
+        media_type="application/x-ndjson",
     )
-    return SearchResponse.model_validate(papers)
 
 
 @router.post(
@@ -43,7 +142,7 @@ async def search(
     summary="Search for papers using a PDF",
 )
 @limiter.limit("3/minute")
-async def search_by_pdf(
+async def search_by_pdf(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     request: Request,  # pylint: disable=unused-argument
     pdf: UploadFile = File(..., description="Research paper PDF", max_size=10 * 1024 * 1024),
     # Optional: user can also input a query
@@ -56,8 +155,18 @@ async def search_by_pdf(
         default=None,
         description="Optional: JSON-encoded advanced search filter",
     ),
+    mode: SearchMode = Form(default="vector"),
+    tier: SearchTier | None = Form(default=None),
+    page_size: int = Form(default=10, ge=1, le=50),
+    cursor: str | None = Form(
+        default=None,
+        max_length=1000,
+        description="Optional: next_cursor of a previous response for the same PDF and query",
+    ),
+    fields: list[PaperField] | None = Form(default=None, description=PAPER_FIELDS_DESCRIPTION),
+    abstract_max_length: int | None = Form(default=None, ge=0),
     db: AsyncSession = Depends(get_db),
-) -> SearchResponse:
+) -> ORJSONResponse:
     """
     Returns a list of papers that are relevant to the uploaded PDF.
     The PDF is analyzed, turned into semantic search queries, and used for vector search on our DB.
@@ -69,25 +178,18 @@ async def search_by_pdf(
             detail="Invalid file type: Only PDF files are supported.",
         )
 
-    search_filter = None
-    if advanced_filter:
-        try:
-            search_filter = AdvancedSearchFilter.model_validate(json.loads(advanced_filter))
-        except json.JSONDecodeError as exc:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid filter JSON.",
-            ) from exc
-        except ValueError as exc:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid filter.",
-            ) from exc
+    search_filter = parse_advanced_filter(advanced_filter)
 
     papers = await SearchService.search_papers_from_pdf(
         pdf_file=pdf,
         db=db,
         query=query,
         search_filter=search_filter,
+        mode=mode,
+        tier=tier,
+        page_size=page_size,
+        cursor=cursor,
+    )
+    return paper_list_response(
+        papers, PaperProjection(fields=fields, abstract_max_length=abstract_max_length)
     )
-    return SearchResponse.model_validate(papers)
@@ -1,5 +1,5 @@
 from datetime import date
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional, Set
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -18,7 +18,61 @@ class PaperDto(BaseModel):
     abstract: Optional[str]
     published_at: Optional[date]
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(
+        from_attributes=True,
+        # Paper lists can be projected to a subset of the fields (see PaperProjection), so the
+        # schema only guarantees paper_id
+        json_schema_extra={"required": ["paper_id"]},
+    )
+
+
+PaperField = Literal[
+    "paper_id", "doi", "source", "paper_type", "title", "authors", "abstract", "published_at"
+]
+
+# Description of the fields parameter of paper list endpoints (OpenAPI)
+PAPER_FIELDS_DESCRIPTION = (
+    "Optional: only return these paper fields (repeatable); paper_id is always returned. "
+    "The other fields are omitted from the papers."
+)
+
+
+class PaperProjection(BaseModel):
+    """
+    Field selection for paper lists.
+    paper_id is always included; abstracts can be truncated to a maximum number of characters.
+    Projected papers are plain dicts that lack the unselected fields; the PaperDto schema
+    therefore only requires paper_id.
+    """
+
+    fields: Optional[List[PaperField]] = None
+    abstract_max_length: Optional[int] = Field(default=None, ge=0)
+
+    def apply(self, paper: PaperDto) -> Dict[str, Any]:
+        """Return the selected fields of the paper as a dict."""
+        include: Optional[Set[str]] = None
+        if self.fields is not None:
+            include = {"paper_id", *self.fields}
+        data = paper.model_dump(include=include)
+
+        abstract = data.get("abstract")
+        if abstract and self.abstract_max_length is not None:
+            data["abstract"] = truncate_text(abstract, self.abstract_max_length)
+        return data
+
+
+def truncate_text(text: str, max_length: int) -> str:
+    """Shorten text to at most max_length characters, preferably at a word boundary."""
+    if len(text) <= max_length:
+        return text
+    if max_length <= 1:
+        return text[:max_length]
+
+    cut = text[: max_length - 1]
+    boundary = cut.rfind(" ")
+    if boundary > max_length // 2:
+        cut = cut[:boundary]
+    return cut.rstrip() + "…"
 
 
 class PaperSummaryRequest(BaseModel):
@@ -28,6 +28,12 @@ class ProjectResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ProjectRecommendationsResponse(BaseModel):
+    """Papers recommended for a project, most similar first."""
+
+    papers: List[PaperDto]
+
+
 class ProjectWithPapersResponse(BaseModel):
     """Project including its stored papers."""
 
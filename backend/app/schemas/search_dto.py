@@ -4,7 +4,7 @@ from typing import Annotated, List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field, model_validator
 
-from app.schemas.paper_dto import PaperDto
+from app.schemas.paper_dto import PAPER_FIELDS_DESCRIPTION, PaperDto, PaperField, PaperProjection
 
 
 class TextCondition(BaseModel):
@@ -40,6 +40,15 @@ class AdvancedSearchFilter(BaseModel):
         return self
 
 
+# "vector": semantic search over the paper embeddings
+# "hybrid": additionally matches the query terms with Postgres full-text search
+SearchMode = Literal["vector", "hybrid"]
+# Recall / latency trade-off of the vector search, None uses the server default
+SearchTier = Literal["fast", "balanced", "exhaustive"]
+# Max. number of queries of a batch search request
+MAX_BATCH_QUERIES = 100
+
+
 class SearchRequest(BaseModel):
     """
     Request to search for specified query
@@ -47,6 +56,19 @@ class SearchRequest(BaseModel):
 
     query: str = Field(..., max_length=5000)
     filter: Optional[AdvancedSearchFilter] = None
+    mode: SearchMode = "vector"
+    tier: Optional[SearchTier] = None
+    page_size: int = Field(default=10, ge=1, le=50)
+    # Opaque cursor from a previous response; query and filter must be the same as before
+    cursor: Optional[str] = Field(default=None, max_length=1000)
+    # Optional projection of the returned papers (see PaperProjection)
+    fields: Optional[List[PaperField]] = Field(default=None, description=PAPER_FIELDS_DESCRIPTION)
+    abstract_max_length: Optional[int] = Field(default=None, ge=0)
+
+    @property
+    def projection(self) -> PaperProjection:
+        """Field projection requested for the returned papers."""
+        return PaperProjection(fields=self.fields, abstract_max_length=self.abstract_max_length)
 
 
 class SearchResponse(BaseModel):
@@ -55,3 +77,53 @@ class SearchResponse(BaseModel):
     """
 
     papers: List[PaperDto]
+    # Cursor for the next page, None if this is the last page
+    next_cursor: Optional[str] = None
+
+
+class BatchSearchRequest(BaseModel):
+    """
+    Request to search for several queries at once (vector mode only)
+    """
+
+    queries: List[Annotated[str, Field(max_length=5000)]] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_QUERIES
+    )
+    # Filter, tier, page size and projection apply to every query
+    filter: Optional[AdvancedSearchFilter] = None
+    tier: Optional[SearchTier] = None
+    page_size: int = Field(default=10, ge=1, le=50)
+    fields: Optional[List[PaperField]] = Field(default=None, description=PAPER_FIELDS_DESCRIPTION)
+    abstract_max_length: Optional[int] = Field(default=None, ge=0)
+
+    @property
+    def projection(self) -> PaperProjection:
+        """Field projection requested for the returned papers."""
+        return PaperProjection(fields=self.fields, abstract_max_length=self.abstract_max_length)
+
+
+class BatchSearchResult(SearchResponse):
+    """
+    Result of one query of a batch search
+    """
+
+    query: str
+    # Reason why the query was not searched (e.g. moderation), None on success
+    error: Optional[str] = None
+
+
+class BatchSearchResponse(BaseModel):
+    """
+    Response to a batch search, one result per query in request order
+    """
+
+    results: List[BatchSearchResult]
+
+
+class SearchStreamChunk(SearchResponse):
+    """
+    One line of a streamed search response (NDJSON)
+    """
+
+    # "preliminary": ranking of the raw query embedding, replaced by the "final" ranking
+    stage: Literal["preliminary", "final"]
@@ -0,0 +1,459 @@
+"""Optional in-process, memory-mapped replica of the paper embeddings."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import fcntl
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select, text
+
+from app.core.config import settings
+from app.core.database import async_session_local
+from app.models.paper import Paper
+from app.repositories.search_repository import SearchRepository
+from app.utils.vector_utils import (
+    mean_cosine_distances,
+    normalize_rows,
+    rank_by_distance,
+    to_matrix,
+)
+
+logger = logging.getLogger("inquiro")
+
+EMBEDDING_DIM = 768
+
+
+@dataclass
+class ReplicaMeta:
+    """Contents of the replica's meta.json."""
+
+    rows: int = 0
+    dim: int = EMBEDDING_DIM
+    # Largest paper.fetched_at that has been exported (ISO format)
+    fetched_at: Optional[str] = None
+    # Set once the initial export has reached the end of the paper table
+    complete: bool = False
+    # Generation of the matrix and id files; a rebuild writes the next one
+    generation: int = 0
+    # Start of the export that created the generation (ISO format, UTC)
+    built_at: Optional[str] = None
+    # Deleted + updated paper rows counted by Postgres when the generation was started
+    row_changes: Optional[int] = None
+
+
+class EmbeddingReplica:  # pylint: disable=too-many-instance-attributes
+    """
+    Read-only, memory-mapped copy of all paper embeddings, used to generate search candidates
+    without a database round trip.
+
+    The replica directory holds the unit-normalized float32 embedding matrix, the matching
+    paper ids and meta.json. The matrix and id files are only ever appended to, and meta.json
+    is replaced atomically after the rows are written, so readers never map partial rows.
+    The process holding refresh.lock exports new papers by paper.fetched_at; every process
+    maps the files read-only, so uvicorn workers share the pages through the OS page cache.
+
+    Appending cannot reflect deleted papers or changed embeddings. The replica is therefore
+    rebuilt into a new generation of files every rebuild_seconds, and as soon as the
+    cumulative delete and update counters of the paper table in pg_stat_user_tables differ
+    from the ones recorded at the start of the generation (also catching a delete followed by
+    an insert). meta.json switches to the new generation once it is complete; processes keep
+    reading the old files (which stay valid while mapped) until they remap. Until then,
+    deleted papers are skipped on hydration.
+
+    Candidates are found with an exact scan of the matrix in chunks on a worker thread. Its
+    cost grows linearly with the corpus (about the time to stream the matrix through memory),
+    so the replica is opt-in and not used for searches once it holds more than max_rows rows;
+    candidates then come from the pgvector HNSW index again.
+
+    Uses singleton pattern - access via get_instance().
+    """
+
+    MATRIX_FILE = "embeddings.{generation}.f32"
+    IDS_FILE = "paper_ids.{generation}.i64"
+    META_FILE = "meta.json"
+    LOCK_FILE = "refresh.lock"
+
+    # Rows fetched per database round trip during a refresh
+    FETCH_BATCH_ROWS = 10_000
+    # Rows multiplied with the query vectors at once during a scan
+    SCAN_CHUNK_ROWS = 65_536
+    # Papers committed late can carry a fetched_at below the watermark, so a refresh re-reads
+    # this window and skips the papers that are already exported
+    REFRESH_OVERLAP = timedelta(minutes=10)
+
+    _instance: Optional[EmbeddingReplica] = None
+
+    def __init__(
+        self,
+        directory: Optional[Path],
+        max_rows: int,
+        refresh_seconds: float,
+        rebuild_seconds: float,
+    ) -> None:
+        self._directory = directory
+        self._max_rows = max_rows
+        self._refresh_seconds = refresh_seconds
+        self._rebuild_interval = timedelta(seconds=rebuild_seconds)
+        self._matrix: Optional[np.ndarray] = None
+        self._ids: Optional[np.ndarray] = None
+        # Generation of the mapped files
+        self._generation: Optional[int] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def get_instance(cls) -> EmbeddingReplica:
+        """Get or create the singleton replica instance."""
+        if cls._instance is None:
+            directory = settings.EMBEDDING_REPLICA_DIR
+            cls._instance = cls(
+                directory=Path(directory) if directory else None,
+                max_rows=settings.EMBEDDING_REPLICA_MAX_ROWS,
+                refresh_seconds=settings.EMBEDDING_REPLICA_REFRESH_SECONDS,
+                rebuild_seconds=settings.EMBEDDING_REPLICA_REBUILD_SECONDS,
+            )
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Reset the singleton instance (for testing)."""
+        cls._instance = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether a complete replica of at most max_rows rows is mapped and can serve searches."""
+        return self._matrix is not None and len(self._matrix) <= self._max_rows
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+    async def search(
+        self,
+        embeddings: List[List[float]],
+        pool_size: int,
+        threshold: float,
+    ) -> List[Tuple[int, float]]:
+        """
+        Return (paper_id, avg_distance) of all candidates below the threshold, ordered by
+        ascending avg. distance to the search queries. Candidates are the pool_size nearest
+        papers of the query centroid, or with the multi_probe strategy the nearest papers of
+        every query, split like the pool of the Postgres search (SearchRepository.probe_size).
+        """
+        return await asyncio.to_thread(self._search, to_matrix(embeddings), pool_size, threshold)
+
+    def _search(
+        self, queries: np.ndarray, pool_size: int, threshold: float
+    ) -> List[Tuple[int, float]]:
+        matrix, ids = self._matrix, self._ids
+        if matrix is None or ids is None:
+            return []
+
+        if settings.SEARCH_CANDIDATE_STRATEGY == "multi_probe":
+            probes = normalize_rows(queries)
+        else:
+            probes = normalize_rows(queries.mean(axis=0, keepdims=True))
+
+        probe_size = SearchRepository.probe_size(pool_size, len(probes))
+        rows = self._nearest_rows(matrix, probes, probe_size)
+        distances = mean_cosine_distances(np.asarray(matrix[rows]), queries)
+        order = rank_by_distance(distances, threshold, None)
+        return [(int(ids[rows[i]]), float(distances[i])) for i in order]
+
+    @staticmethod
+    def _nearest_rows(matrix: np.ndarray, probes: np.ndarray, k: int) -> np.ndarray:
+        """Return the row indices of the k nearest rows of every probe (exact scan)."""
+        best_sims = np.empty((len(probes), 0), dtype=np.float32)
+        best_rows = np.empty((len(probes), 0), dtype=np.int64)
+
+        for start in range(0, len(matrix), EmbeddingReplica.SCAN_CHUNK_ROWS):
+            chunk = np.asarray(matrix[start : start + EmbeddingReplica.SCAN_CHUNK_ROWS])
+            # Rows are unit length, so the dot product is the cosine similarity
+            sims = np.concatenate([best_sims, probes @ chunk.T], axis=1)
+            chunk_rows = np.arange(start, start + len(chunk), dtype=np.int64)
+            rows = np.concatenate(
+                [best_rows, np.broadcast_to(chunk_rows, (len(probes), len(chunk)))], axis=1
+            )
+            if sims.shape[1] > k:
+                top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+                sims = np.take_along_axis(sims, top, axis=1)
+                rows = np.take_along_axis(rows, top, axis=1)
+            best_sims, best_rows = sims, rows
+
+        return np.unique(best_rows)
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+    async def start(self) -> None:
+        """Start refreshing the replica in the background (no-op if it is disabled)."""
+        if self._directory is None or self._refresh_task is not None:
+            return
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._refresh_task = asyncio.create_task(self._refresh_periodically())
+        logger.info("Embedding replica enabled in %s", self._directory)
+
+    async def stop(self) -> None:
+        """Stop the background refresh."""
+        if self._refresh_task is None:
+            return
+
+        self._refresh_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._refresh_task
+        self._refresh_task = None
+
+    async def refresh(self) -> None:
+        """
+        Export the papers added since the last refresh and rebuild the replica if it is
+        stale, unless another process is already doing so, and map the current files.
+        """
+        with self._try_lock() as locked:
+            if locked:
+                meta = await self._export_new_papers()
+                if await self._is_stale(meta):
+                    await self._rebuild(meta)
+        self._remap()
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                # Searches fall back to Postgres until the next successful refresh
+                logger.error("Embedding replica refresh failed: %s", exc)
+            await asyncio.sleep(self._refresh_seconds)
+
+    async def _export_new_papers(self) -> ReplicaMeta:
+        """Append the embeddings of all papers newer than the watermark to the replica."""
+        meta = await asyncio.to_thread(self._prepare_append)
+        if meta.built_at is None:
+            meta.built_at = datetime.now(timezone.utc).isoformat()
+            meta.row_changes = await self._row_changes()
+        known_ids = np.fromfile(
+            self._data_path(self.IDS_FILE, meta.generation), dtype="<i8", count=meta.rows
+        )
+
+        meta, exported = await self._export(meta, known_ids, publish=True)
+
+        if not meta.complete:
+            meta.complete = True
+            await asyncio.to_thread(self._write_meta, meta)
+
+        if exported:
+            logger.info(
+                "Exported %d papers to the embedding replica (%d rows)", exported, meta.rows
+            )
+        return meta
+
+    async def _is_stale(self, meta: ReplicaMeta) -> bool:
+        """
+        Whether the rebuild interval has passed or papers were deleted or updated since the
+        generation was started.
+        """
+        if not meta.complete:
+            return False
+        if meta.built_at is not None:
+            age = datetime.now(timezone.utc) - datetime.fromisoformat(meta.built_at)
+            if age > self._rebuild_interval:
+                return True
+
+        # Any difference counts, since the counters restart at zero after a statistics reset
+        return await self._row_changes() != meta.row_changes
+
+    @staticmethod
+    async def _row_changes() -> Optional[int]:
+        """
+        Return the number of paper rows deleted or updated since the statistics were last
+        reset (a catalog lookup, no table scan). Postgres reports them with a short delay.
+        """
+        async with async_session_local() as session:
+            return await session.scalar(
+                text(
+                    "SELECT n_tup_del + n_tup_upd FROM pg_stat_user_tables "
+                    "WHERE relid = CAST(:table AS regclass)"
+                ),
+                {"table": Paper.__tablename__},
+            )
+
+    async def _rebuild(self, current: ReplicaMeta) -> None:
+        """
+        Export all papers into the next generation of files, switch meta.json to it and
+        remove the files of the current generation.
+        """
+        meta = ReplicaMeta(
+            dim=current.dim,
+            generation=current.generation + 1,
+            built_at=datetime.now(timezone.utc).isoformat(),
+            row_changes=await self._row_changes(),
+        )
+        await asyncio.to_thread(self._create_files, meta.generation)
+
+        meta, _ = await self._export(meta, np.empty(0, dtype=np.int64), publish=False)
+        meta.complete = True
+        await asyncio.to_thread(self._write_meta, meta)
+        await asyncio.to_thread(self._remove_files, current.generation)
+        logger.info(
+            "Rebuilt the embedding replica with %d papers (generation %d)",
+            meta.rows,
+            meta.generation,
+        )
+
+    async def _export(
+        self, meta: ReplicaMeta, known_ids: np.ndarray, publish: bool
+    ) -> Tuple[ReplicaMeta, int]:
+        """
+        Append the papers newer than the watermark of meta that are not in known_ids to the
+        files of its generation. With publish=True, meta.json is updated after every batch.
+        Returns the updated meta and the number of exported papers.
+        """
+        stmt = (
+            select(Paper.paper_id, Paper.embedding, Paper.fetched_at)
+            .where(Paper.embedding.is_not(None))
+            .order_by(Paper.fetched_at, Paper.paper_id)
+            .execution_options(yield_per=self.FETCH_BATCH_ROWS)
+        )
+        if meta.fetched_at is not None:
+            watermark = datetime.fromisoformat(meta.fetched_at)
+            stmt = stmt.where(Paper.fetched_at > watermark - self.REFRESH_OVERLAP)
+
+        exported = 0
+        async with async_session_local() as session:
+            result = await session.stream(stmt)
+            async for rows in result.partitions():
+                ids = np.fromiter((row.paper_id for row in rows), dtype=np.int64, count=len(rows))
+                fresh = ~np.isin(ids, known_ids)
+                vectors = to_matrix([row.embedding for row in rows])[fresh]
+                meta = await asyncio.to_thread(
+                    self._append, meta, ids[fresh], vectors, rows[-1].fetched_at, publish
+                )
+                exported += int(fresh.sum())
+        return meta, exported
+
+    def _prepare_append(self) -> ReplicaMeta:
+        """Read meta.json and drop rows that were written after its last update."""
+        meta = self._read_meta()
+        for name, itemsize in ((self.MATRIX_FILE, 4 * meta.dim), (self.IDS_FILE, 8)):
+            path = self._data_path(name, meta.generation)
+            path.touch()
+            if path.stat().st_size > meta.rows * itemsize:
+                os.truncate(path, meta.rows * itemsize)
+        return meta
+
+    def _append(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        meta: ReplicaMeta,
+        ids: np.ndarray,
+        vectors: np.ndarray,
+        fetched_at: datetime,
+        publish: bool,
+    ) -> ReplicaMeta:
+        """Append rows to the replica files and return the updated meta."""
+        if len(ids):
+            with open(self._data_path(self.MATRIX_FILE, meta.generation), "ab") as f:
+                normalize_rows(vectors).astype("<f4").tofile(f)
+            with open(self._data_path(self.IDS_FILE, meta.generation), "ab") as f:
+                ids.astype("<i8").tofile(f)
+
+        watermark = fetched_at.isoformat()
+        if meta.fetched_at is not None:
+            watermark = max(meta.fetched_at, watermark, key=datetime.fromisoformat)
+
+        updated = replace(meta, rows=meta.rows + len(ids), fetched_at=watermark)
+        if publish:
+            self._write_meta(updated)
+        return updated
+
+    def _remap(self) -> None:
+        """Map the rows listed in meta.json if they changed since the last call."""
+        meta = self._read_meta()
+        if not meta.complete:
+            return
+        if (
+            self._ids is not None
+            and self._generation == meta.generation
+            and len(self._ids) == meta.rows
+        ):
+            return
+        if meta.rows == 0:
+            self._matrix, self._ids, self._generation = None, None, meta.generation
+            return
+
+        self._matrix = np.memmap(
+            self._data_path(self.MATRIX_FILE, meta.generation),
+            dtype="<f4",
+            mode="r",
+            shape=(meta.rows, meta.dim),
+        )
+        self._ids = np.memmap(
+            self._data_path(self.IDS_FILE, meta.generation),
+            dtype="<i8",
+            mode="r",
+            shape=(meta.rows,),
+        )
+        self._generation = meta.generation
+        logger.info(
+            "Mapped embedding replica with %d papers (generation %d)", meta.rows, meta.generation
+        )
+        if meta.rows > self._max_rows:
+            logger.warning(
+                "Embedding replica exceeds EMBEDDING_REPLICA_MAX_ROWS (%d), "
+                "searches use the HNSW index",
+                self._max_rows,
+            )
+
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+    def _path(self, name: str) -> Path:
+        assert self._directory is not None
+        return self._directory / name
+
+    def _data_path(self, name: str, generation: int) -> Path:
+        """Path of the matrix or id file (MATRIX_FILE, IDS_FILE) of a generation."""
+        return self._path(name.format(generation=generation))
+
+    def _create_files(self, generation: int) -> None:
+        """Create empty matrix and id files for a generation, dropping leftovers of a crash."""
+        for name in (self.MATRIX_FILE, self.IDS_FILE):
+            self._data_path(name, generation).write_bytes(b"")
+
+    def _remove_files(self, generation: int) -> None:
+        """Remove the matrix and id files of a generation; existing mappings stay valid."""
+        for name in (self.MATRIX_FILE, self.IDS_FILE):
+            self._data_path(name, generation).unlink(missing_ok=True)
+
+    def _read_meta(self) -> ReplicaMeta:
+        try:
+            data = json.loads(self._path(self.META_FILE).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return ReplicaMeta()
+        return ReplicaMeta(**data)
+
+    def _write_meta(self, meta: ReplicaMeta) -> None:
+        """Replace meta.json atomically."""
+        tmp_path = self._path(self.META_FILE + ".tmp")
+        tmp_path.write_text(json.dumps(asdict(meta)), encoding="utf-8")
+        os.replace(tmp_path, self._path(self.META_FILE))
+
+    @contextlib.contextmanager
+    def _try_lock(self) -> Iterator[bool]:
+        """Try to take the refresh lock without blocking; yields whether it was acquired."""
+        with open(self._path(self.LOCK_FILE), "a", encoding="utf-8") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -0,0 +1,93 @@
+"""Two-tier memo for LLM keyword extraction results."""
+
+from __future__ import annotations
+
+import logging
+from typing import List, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.core.database import async_session_local
+from app.llm.openai.prompts import KEYWORD_PROMPT_VERSION
+from app.repositories.keyword_cache_repository import KeywordCacheRepository
+from app.utils.cache_utils import TTLCache, hash_text, normalize_query
+
+logger = logging.getLogger("inquiro")
+
+
+class KeywordMemo:
+    """
+    Memoizes extracted keywords per normalized query text and keyword prompt version.
+
+    Lookups go to an in-process LRU first and then to the keyword_cache table, which is shared
+    across replicas and restarts. Editing KEYWORD_PROMPT changes KEYWORD_PROMPT_VERSION, so
+    entries produced by an older prompt are no longer found.
+
+    The database tier uses its own short-lived sessions, so the memo can be used concurrently
+    with work on the request session. Database errors are logged and treated as a miss.
+
+    Uses singleton pattern - access via get_instance().
+    """
+
+    _instance: Optional[KeywordMemo] = None
+
+    def __init__(self, maxsize: int, prompt_version: str) -> None:
+        self._cache: TTLCache[Tuple[str, str], List[str]] = TTLCache(maxsize)
+        self._prompt_version = prompt_version
+
+    @classmethod
+    def get_instance(cls) -> KeywordMemo:
+        """Get or create the singleton memo instance."""
+        if cls._instance is None:
+            cls._instance = cls(
+                maxsize=settings.KEYWORD_MEMO_MAX_ENTRIES,
+                prompt_version=KEYWORD_PROMPT_VERSION,
+            )
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Reset the singleton instance (for testing)."""
+        cls._instance = None
+
+    async def get(self, query: str) -> Optional[List[str]]:
+        """Return the memoized keywords for the query, or None."""
+        query_hash = hash_text(normalize_query(query))
+        key = (query_hash, self._prompt_version)
+
+        keywords = self._cache.get(key)
+        if keywords is not None:
+            return keywords
+
+        try:
+            async with async_session_local() as session:
+                keywords = await KeywordCacheRepository.get_keywords(
+                    session, query_hash, self._prompt_version
+                )
+        except SQLAlchemyError as exc:
+            logger.warning("Keyword memo lookup failed: %s", exc)
+            return None
+
+        if keywords:
+            self._cache.set(key, keywords)
+            return keywords
+        return None
+
+    async def set(self, query: str, keywords: List[str]) -> None:
+        """Memoize the keywords extracted for the query."""
+        normalized_query = normalize_query(query)
+        query_hash = hash_text(normalized_query)
+        self._cache.set((query_hash, self._prompt_version), keywords)
+
+        try:
+            async with async_session_local() as session:
+                await KeywordCacheRepository.upsert_keywords(
+                    session,
+                    query_hash=query_hash,
+                    prompt_version=self._prompt_version,
+                    query_text=normalized_query,
+                    keywords=keywords,
+                )
+        except SQLAlchemyError as exc:
+            logger.warning("Failed to persist memoized keywords: %s", exc)
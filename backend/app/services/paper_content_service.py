@@ -144,6 +144,17 @@ class PaperContentService:
             f"Timeout waiting for paper {paper_id} conversion (status: {current_status})"
         )
 
+    @staticmethod
+    async def get_converted_markdown(paper_id: int, session: AsyncSession) -> Optional[str]:
+        """
+        Return the markdown content if the conversion has already succeeded, else None.
+        Unlike get_or_wait_for_markdown, this never triggers a conversion.
+        """
+        content = await PaperContentRepository.get_by_paper_id(session, paper_id)
+        if content and content.status == PaperContentStatus.SUCCEEDED and content.markdown:
+            return str(content.markdown)
+        return None
+
     @staticmethod
     async def get_or_wait_for_markdown(paper_id: int, session: AsyncSession) -> str:
         """
@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import Dict, List
+from typing import Any, Callable, Coroutine, Dict, List, TypeVar
 
 import httpx
 from fastapi import HTTPException
@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.constants.database_constants import PaperSource
 from app.core.deps import get_openai_provider
-from app.core.safety import SafetyService
+from app.core.safety import ModerationFlaggedError, SafetyService
 from app.repositories.paper_repository import PaperRepository
 from app.schemas.paper_dto import PaperSummaryResponse
 from app.services import PaperContentService
@@ -16,6 +16,8 @@ from app.utils.token_utils import ensure_fits_token_limit
 
 logger = logging.getLogger("inquiro")
 
+T = TypeVar("T")
+
 
 class PaperService:
     """Service for interacting with research papers (Summarization, Chat, and PDF retrieval)"""
@@ -33,19 +35,28 @@ class PaperService:
         Returns a summary of the specified paper.
 
         Uses pre-converted markdown from PaperContent (via Docling), waiting for
-        conversion if it's still in progress.
+        conversion if it's still in progress. The moderation check of the query runs
+        concurrently with the summary generation (see _run_with_moderation).
         """
-        if query and query.strip():
-            if not await SafetyService.check_moderation(query):
-                logger.warning("Blocked toxic summary query: %s", query)
-                raise HTTPException(status_code=400, detail="Query violates content safety policy.")
 
-        try:
-            # Get markdown content (waits for conversion if needed)
-            pdf_text = await PaperService._get_paper_text(paper_id, session)
+        async def summarise(pdf_text: str) -> Dict[str, Any]:
+            return await get_openai_provider().summarise_paper(pdf_text, query)
 
-            openai_provider = get_openai_provider()
-            summary_payload = await openai_provider.summarise_paper(pdf_text, query)
+        try:
+            if query and query.strip():
+                try:
+                    summary_payload = await PaperService._run_with_moderation(
+                        paper_id, query, session, summarise
+                    )
+                except ModerationFlaggedError as exc:
+                    logger.warning("Blocked toxic summary query: %s", query)
+                    raise HTTPException(
+                        status_code=400, detail="Query violates content safety policy."
+                    ) from exc
+            else:
+                summary_payload = await summarise(
+                    await PaperService._get_paper_text(paper_id, session)
+                )
 
             raw_dump = json.dumps(summary_payload)
             if not SafetyService.validate_output(raw_dump):
@@ -69,23 +80,27 @@ class PaperService:
     ) -> str:
         """
         Generates an AI response based on paper content and chat history.
+        The moderation check of the user query runs concurrently with the answer generation
+        (see _run_with_moderation).
         """
-        if not await SafetyService.check_moderation(user_query):
-            logger.warning("Blocked toxic user query: %s", user_query)
-            return "I cannot answer this query as it violates our safety policies."
 
-        try:
-            pdf_text = await PaperService._get_paper_text(paper_id, session)
-
-            openai_provider = get_openai_provider()
-            answer = await openai_provider.chat_about_paper(
+        async def answer_query(pdf_text: str) -> str:
+            return await get_openai_provider().chat_about_paper(
                 paper_text=pdf_text, user_query=user_query, chat_history=history
             )
 
+        try:
+            answer = await PaperService._run_with_moderation(
+                paper_id, user_query, session, answer_query
+            )
+
             if not SafetyService.validate_output(answer):
                 return "I apologize, but I encountered an error while generating the response."
 
             return answer
+        except ModerationFlaggedError:
+            logger.warning("Blocked toxic user query: %s", user_query)
+            return "I cannot answer this query as it violates our safety policies."
         except Exception as exc:
             logger.exception("Chat error for paper %s", paper_id)
             raise HTTPException(status_code=500, detail="Failed to generate AI response.") from exc
@@ -134,11 +149,41 @@ class PaperService:
                 detail="Upstream arXiv service unavailable, please try again later.",
             ) from exc
 
+    @staticmethod
+    async def _run_with_moderation(
+        paper_id: int,
+        query: str,
+        session: AsyncSession,
+        llm_call: Callable[[str], Coroutine[Any, Any, T]],
+    ) -> T:
+        """
+        Run the LLM call on the paper markdown while the query is moderated.
+        Only the LLM call itself overlaps with the moderation check: if the paper has not
+        been converted yet, the conversion is only triggered once the query has passed the
+        check, so flagged queries never enqueue conversion jobs.
+
+        Raises:
+            ModerationFlaggedError: If the query violates the safety policies.
+        """
+        pdf_text = await PaperContentService.get_converted_markdown(paper_id, session)
+        if pdf_text is not None:
+            PaperService._ensure_fits_context(pdf_text)
+            return await SafetyService.run_with_moderation(query, llm_call(pdf_text))
+
+        if not await SafetyService.check_moderation(query):
+            raise ModerationFlaggedError()
+        return await llm_call(await PaperService._get_paper_text(paper_id, session))
+
     @staticmethod
     async def _get_paper_text(paper_id: int, session: AsyncSession) -> str:
         """Shared internal logic to convert paper to markdown."""
         pdf_text = await PaperContentService.get_or_wait_for_markdown(paper_id, session)
+        PaperService._ensure_fits_context(pdf_text)
+        return pdf_text
 
+    @staticmethod
+    def _ensure_fits_context(pdf_text: str) -> None:
+        """Reject paper texts that do not fit into a single LLM request."""
         # If the pdf is of excessive length (> few hundred pages) it is too big for a single
         # request. We could process the paper in multiple parts but that would be a lot of
         # effort for a tiny proportion of all papers.
@@ -149,8 +194,6 @@ class PaperService:
             error_detail="Paper content exceeds context limits.",
         )
 
-        return pdf_text
-
     @staticmethod
     def arxiv_pdf_url(arxiv_id: str) -> str:
         """Get the Arxiv-PDF URL."""
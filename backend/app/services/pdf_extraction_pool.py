@@ -0,0 +1,111 @@
+"""Process pool that extracts the text of uploaded PDFs off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from app.core.config import settings
+from app.utils.pdf_utils import pdf_bytes_to_text
+
+logger = logging.getLogger("inquiro")
+
+
+class PdfExtractionPool:
+    """
+    Bounded pool of worker processes running the pypdf text extraction.
+
+    pypdf is pure Python, so on a thread it would still hold the GIL and stall the event loop.
+    Every document has a time limit. A running extraction cannot be cancelled, so on timeout
+    the pool is replaced and its worker processes are terminated.
+
+    Uses singleton pattern - access via get_instance().
+    """
+
+    _instance: Optional[PdfExtractionPool] = None
+
+    def __init__(self, max_workers: int, timeout_seconds: float) -> None:
+        self._max_workers = max_workers
+        self._timeout_seconds = timeout_seconds
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @classmethod
+    def get_instance(cls) -> PdfExtractionPool:
+        """Get or create the singleton pool instance."""
+        if cls._instance is None:
+            cls._instance = cls(
+                max_workers=settings.PDF_EXTRACTION_WORKERS,
+                timeout_seconds=settings.PDF_EXTRACTION_TIMEOUT_SECONDS,
+            )
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Reset the singleton instance (for testing)."""
+        cls._instance = None
+
+    async def extract_text(
+        self,
+        content: bytes,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None,
+    ) -> str:
+        """
+        Extract the text of a PDF in a worker process (see pdf_bytes_to_text).
+
+        Raises:
+            TimeoutError: If the extraction exceeds the time limit.
+            pypdf.errors.PdfReadError: If the PDF is invalid or corrupted.
+        """
+        executor = self._get_executor()
+        extract = functools.partial(
+            pdf_bytes_to_text, content, max_pages=max_pages, max_chars=max_chars
+        )
+        try:
+            return await asyncio.wait_for(
+                asyncio.get_running_loop().run_in_executor(executor, extract),
+                self._timeout_seconds,
+            )
+        except TimeoutError:
+            logger.warning(
+                "PDF text extraction exceeded %.1f s, restarting the worker processes",
+                self._timeout_seconds,
+            )
+            self._terminate(executor)
+            raise
+        except BrokenProcessPool:
+            if executor is self._executor:
+                # A worker died on this document; the next call starts a fresh pool
+                self._executor = None
+                raise
+            # The pool was replaced after another document timed out
+            return await self.extract_text(content, max_pages, max_chars)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Forking would copy the API process including its models and event loop
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _terminate(self, executor: ProcessPoolExecutor) -> None:
+        """Discard the pool and kill its worker processes."""
+        if executor is self._executor:
+            self._executor = None
+        processes = executor._processes or {}  # pylint: disable=protected-access
+        for process in list(processes.values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
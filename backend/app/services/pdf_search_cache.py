@@ -0,0 +1,82 @@
+"""In-process cache for the extracted text and search keywords of uploaded PDFs."""
+
+from __future__ import annotations
+
+import logging
+from typing import List, Optional, Tuple
+
+from app.core.config import settings
+from app.llm.openai.prompts import PDF_KEYWORD_PROMPT_VERSION
+from app.utils.cache_utils import CacheStats, TTLCache, normalize_query
+
+logger = logging.getLogger("inquiro")
+
+
+class PdfSearchCache:
+    """
+    Caches, per SHA-256 hash of the uploaded document, the text extracted for PDF search and
+    the keywords derived from it for each (normalized) optional query.
+
+    Re-uploading a document, e.g. with a different query or filter, then skips the text
+    extraction, and with an already seen query also the LLM keyword extraction. Keywords are
+    keyed by PDF_KEYWORD_PROMPT_VERSION, so editing the prompt invalidates them.
+
+    Uses singleton pattern - access via get_instance().
+    """
+
+    _instance: Optional[PdfSearchCache] = None
+
+    def __init__(self, text_maxsize: int, keyword_maxsize: int, ttl_seconds: float) -> None:
+        self._texts: TTLCache[str, str] = TTLCache(text_maxsize, ttl_seconds)
+        self._keywords: TTLCache[Tuple[str, str, str], List[str]] = TTLCache(
+            keyword_maxsize, ttl_seconds
+        )
+
+    @classmethod
+    def get_instance(cls) -> PdfSearchCache:
+        """Get or create the singleton cache instance."""
+        if cls._instance is None:
+            cls._instance = cls(
+                text_maxsize=settings.PDF_TEXT_CACHE_MAX_ENTRIES,
+                keyword_maxsize=settings.PDF_KEYWORD_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.PDF_CACHE_TTL_SECONDS,
+            )
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Reset the singleton instance (for testing)."""
+        cls._instance = None
+
+    def get_text(self, document_hash: str) -> Optional[str]:
+        """Return the extracted text of the document, or None."""
+        return self._texts.get(document_hash)
+
+    def set_text(self, document_hash: str, text: str) -> None:
+        """Cache the extracted text of the document."""
+        self._texts.set(document_hash, text)
+
+    def get_keywords(self, document_hash: str, query: Optional[str]) -> Optional[List[str]]:
+        """Return the keywords derived from the document and the optional query, or None."""
+        keywords = self._keywords.get(self._keyword_key(document_hash, query))
+        stats = self.keyword_stats
+        logger.debug(
+            "PDF keyword cache %s (hit rate %.2f, size=%d)",
+            "hit" if keywords is not None else "miss",
+            stats.hit_rate,
+            stats.size,
+        )
+        return keywords
+
+    def set_keywords(self, document_hash: str, query: Optional[str], keywords: List[str]) -> None:
+        """Cache the keywords derived from the document and the optional query."""
+        self._keywords.set(self._keyword_key(document_hash, query), keywords)
+
+    @property
+    def keyword_stats(self) -> CacheStats:
+        """Hit/miss counters of the keyword cache."""
+        return self._keywords.stats
+
+    @staticmethod
+    def _keyword_key(document_hash: str, query: Optional[str]) -> Tuple[str, str, str]:
+        return document_hash, normalize_query(query or ""), PDF_KEYWORD_PROMPT_VERSION
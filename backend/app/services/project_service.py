@@ -1,19 +1,25 @@
 import logging
 import re
-from typing import List
+from typing import List, Optional
 
+import numpy as np
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Project
+from app.core.config import settings
+from app.models import Paper, Project
+from app.repositories.paper_repository import PaperRepository
 from app.repositories.project_repository import ProjectRepository
+from app.repositories.search_repository import SearchRepository
 from app.schemas.paper_dto import PaperDto
 from app.schemas.project_dto import (
     ProjectCreate,
+    ProjectRecommendationsResponse,
     ProjectResponse,
     ProjectUpdate,
     ProjectWithPapersResponse,
 )
+from app.schemas.search_dto import SearchTier
 from app.services.paper_content_service import PaperContentService
 from app.utils.author_utils import normalize_authors
 
@@ -94,6 +100,48 @@ class ProjectService:
 
         return ProjectService._build_project_with_papers_response(project)
 
+    @staticmethod
+    async def recommend_papers(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+            session: AsyncSession,
+            user_id: int,
+            project_id: int,
+            limit: int = 10,
+            tier: Optional[SearchTier] = None,
+    ) -> ProjectRecommendationsResponse:
+        """
+        Recommend the papers closest to the centroid of the project's papers.
+        The centroid is maintained incrementally (see ProjectRepository.add_paper), so the
+        cost does not depend on the size of the project. Papers already stored in the project
+        are excluded.
+        """
+        await ProjectService._validate_project_access(session, project_id, user_id)
+
+        centroid = await ProjectRepository.get_centroid(session, project_id)
+        if centroid.embedding_sum is None or centroid.paper_count <= 0:
+            return ProjectRecommendationsResponse(papers=[])
+
+        mean = np.asarray(centroid.embedding_sum, dtype=np.float32) / centroid.paper_count
+        rows = await SearchRepository.search_papers_by_embeddings(
+            db=session,
+            embeddings=[mean.tolist()],
+            limit=limit,
+            tier=tier or settings.SEARCH_DEFAULT_TIER,
+            excluded_ids=ProjectRepository.paper_ids_stmt(project_id),
+        )
+        papers = {
+            paper.paper_id: paper
+            for paper in await PaperRepository.get_papers_by_ids(
+                session, [paper_id for paper_id, _ in rows]
+            )
+        }
+        return ProjectRecommendationsResponse(
+            papers=[
+                ProjectService._to_paper_dto(papers[paper_id])
+                for paper_id, _ in rows
+                if paper_id in papers
+            ]
+        )
+
     # ------------------------------------------------------------------
     # Project papers: add / remove
     # ------------------------------------------------------------------
@@ -199,22 +247,23 @@ class ProjectService:
             project: Project,
     ) -> list[PaperDto]:
         """Convert project.papers into PaperDtos."""
-        summaries: list[PaperDto] = []
-        for paper in project.papers:
-            authors_value = normalize_authors(paper.authors)
-            summaries.append(
-                PaperDto(
-                    paper_id=paper.paper_id,
-                    doi=paper.doi,
-                    title=paper.title,
-                    source=str(paper.source),
-                    authors=authors_value,
-                    paper_type=str(paper.paper_type),
-                    abstract=paper.abstract,
-                    published_at=paper.published_at,
-                )
-            )
-        return summaries
+        return [ProjectService._to_paper_dto(paper) for paper in project.papers]
+
+    @staticmethod
+    def _to_paper_dto(
+            paper: Paper,
+    ) -> PaperDto:
+        """Map a Paper ORM entity to a PaperDto."""
+        return PaperDto(
+            paper_id=paper.paper_id,
+            doi=paper.doi,
+            title=paper.title,
+            source=str(paper.source),
+            authors=normalize_authors(paper.authors),
+            paper_type=str(paper.paper_type),
+            abstract=paper.abstract,
+            published_at=paper.published_at,
+        )
 
     @staticmethod
     def _validate_project_name(name: str) -> None:
@@ -0,0 +1,232 @@
+"""In-process cache for search results, invalidated when new papers are ingested."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+from app.core.database import engine
+from app.repositories.search_repository import CandidateStrategy
+from app.schemas.paper_dto import PaperDto
+from app.schemas.search_dto import AdvancedSearchFilter, SearchMode, SearchTier
+from app.utils.cache_utils import CacheStats, TTLCache, hash_text, normalize_query
+
+logger = logging.getLogger("inquiro")
+
+
+@dataclass
+class RankedSearch:
+    """Full ranked result list of a search, plus the DTOs of the papers hydrated so far."""
+
+    paper_ids: List[int]
+    papers: Dict[int, PaperDto] = field(default_factory=dict)
+
+
+class SearchCache:
+    """
+    Caches ranked search results keyed by the normalized query text and the advanced filter.
+    Later result pages are served from the cached ranking via opaque cursors.
+
+    Entries expire after SEARCH_CACHE_TTL_SECONDS. In addition, the whole cache is cleared
+    whenever a NOTIFY on INVALIDATION_CHANNEL is received, which the ingestion scripts send
+    after new papers have been written to the database. If the listener connection is lost,
+    the cache is cleared and the listener reconnects in the background.
+
+    Uses singleton pattern - access via get_instance().
+    """
+
+    # Postgres NOTIFY channel used by the ingestion scripts (see ingestion/arxiv_to_db.py)
+    INVALIDATION_CHANNEL = "paper_ingested"
+    # Backoff between reconnection attempts after the listener connection was lost
+    LISTENER_RETRY_MIN_SECONDS = 1.0
+    LISTENER_RETRY_MAX_SECONDS = 60.0
+
+    _instance: Optional[SearchCache] = None
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self._cache: TTLCache[str, RankedSearch] = TTLCache(maxsize, ttl_seconds)
+        self._listen_conn: Optional[AsyncConnection] = None
+        self._reconnect_task: Optional[asyncio.Task[None]] = None
+
+    @classmethod
+    def get_instance(cls) -> SearchCache:
+        """Get or create the singleton cache instance."""
+        if cls._instance is None:
+            cls._instance = cls(
+                maxsize=settings.SEARCH_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS,
+            )
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Reset the singleton instance (for testing)."""
+        cls._instance = None
+
+    @staticmethod
+    def make_key(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        query: str,
+        search_filter: Optional[AdvancedSearchFilter] = None,
+        document_hash: Optional[str] = None,
+        mode: SearchMode = "vector",
+        tier: SearchTier = "balanced",
+        strategy: Optional[CandidateStrategy] = None,
+    ) -> str:
+        """
+        Build a cache key from the normalized query text, a canonical dump of the filter, the
+        search mode, the tier and the candidate strategy (defaults to
+        SEARCH_CANDIDATE_STRATEGY). Queries that only differ in casing or whitespace share the
+        same key.
+        PDF searches additionally pass the hash of the uploaded document.
+        """
+        filter_json = search_filter.model_dump_json() if search_filter is not None else ""
+        strategy = strategy or settings.SEARCH_CANDIDATE_STRATEGY
+        return hash_text(
+            normalize_query(query), filter_json, document_hash or "", mode, tier, strategy
+        )
+
+    @staticmethod
+    def encode_cursor(key: str, offset: int) -> str:
+        """Build an opaque cursor pointing at the given offset of a cached ranking."""
+        payload = json.dumps({"k": key, "o": offset}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[str, int]:
+        """
+        Return the (cache key, offset) encoded in a cursor.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            key, offset = payload["k"], payload["o"]
+        except (ValueError, TypeError, KeyError) as exc:
+            raise ValueError("Malformed search cursor") from exc
+
+        if not isinstance(key, str) or not isinstance(offset, int) or offset < 0:
+            raise ValueError("Malformed search cursor")
+        return key, offset
+
+    def get(self, key: str) -> Optional[RankedSearch]:
+        """Return the cached ranking for the key, or None."""
+        ranked = self._cache.get(key)
+        stats = self._cache.stats
+        logger.debug(
+            "Search cache %s (hits=%d, misses=%d, size=%d)",
+            "hit" if ranked is not None else "miss",
+            stats.hits,
+            stats.misses,
+            stats.size,
+        )
+        return ranked
+
+    def set(self, key: str, ranked: RankedSearch) -> None:
+        """Store a ranked search result."""
+        self._cache.set(key, ranked)
+
+    def invalidate(self) -> None:
+        """Drop all cached rankings."""
+        self._cache.clear()
+        logger.info("Search cache invalidated")
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return the hit/miss counters of the cache."""
+        return self._cache.stats
+
+    # ------------------------------------------------------------------
+    # Invalidation listener
+    # ------------------------------------------------------------------
+    async def start_listener(self) -> None:
+        """Listen for ingestion notifications on a dedicated database connection."""
+        if self._listen_conn is not None or self._reconnect_task is not None:
+            return
+
+        await self._connect_listener()
+        logger.info("Listening for '%s' notifications", self.INVALIDATION_CHANNEL)
+
+    async def stop_listener(self) -> None:
+        """Stop listening for ingestion notifications and release the connection."""
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
+        if self._listen_conn is None:
+            return
+
+        listen_conn, self._listen_conn = self._listen_conn, None
+        driver_conn = await self._driver_connection(listen_conn)
+        # Closing the connection calls the termination listeners as well
+        driver_conn.remove_termination_listener(self._on_listener_terminated)
+        await driver_conn.remove_listener(self.INVALIDATION_CHANNEL, self._on_notification)
+        await listen_conn.close()
+
+    async def _connect_listener(self) -> None:
+        """Open the listener connection and subscribe to the invalidation channel."""
+        listen_conn = await engine.connect()
+        try:
+            driver_conn = await self._driver_connection(listen_conn)
+            await driver_conn.add_listener(self.INVALIDATION_CHANNEL, self._on_notification)
+            driver_conn.add_termination_listener(self._on_listener_terminated)
+        except BaseException:
+            await listen_conn.close()
+            raise
+        self._listen_conn = listen_conn
+
+    async def _reconnect_listener(self, lost_conn: AsyncConnection) -> None:
+        """Reconnect the listener with exponential backoff until it succeeds."""
+        try:
+            await lost_conn.invalidate()
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.debug("Could not invalidate the lost listener connection", exc_info=True)
+
+        delay = self.LISTENER_RETRY_MIN_SECONDS
+        while True:
+            try:
+                await self._connect_listener()
+                break
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.warning(
+                    "Reconnecting the search cache listener failed, retrying in %.0f s: %s",
+                    delay,
+                    exc,
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.LISTENER_RETRY_MAX_SECONDS)
+
+        self._reconnect_task = None
+        # Notifications sent while the listener was disconnected were missed
+        self.invalidate()
+        logger.info("Search cache listener reconnected")
+
+    def _on_listener_terminated(self, *_args: Any) -> None:
+        """asyncpg termination callback: (connection). Reconnects in the background."""
+        if self._listen_conn is None:
+            return
+
+        logger.warning("Search cache listener connection lost, reconnecting")
+        lost_conn, self._listen_conn = self._listen_conn, None
+        self.invalidate()
+        self._reconnect_task = asyncio.create_task(self._reconnect_listener(lost_conn))
+
+    @staticmethod
+    async def _driver_connection(conn: AsyncConnection) -> Any:
+        """Return the asyncpg connection underlying a SQLAlchemy connection."""
+        raw_conn = await conn.get_raw_connection()
+        driver_conn = raw_conn.driver_connection
+        if driver_conn is None:
+            raise RuntimeError("The listener connection has been closed")
+        return driver_conn
+
+    def _on_notification(self, *_args: Any) -> None:
+        """asyncpg listener callback: (connection, pid, channel, payload)."""
+        self.invalidate()
@@ -1,65 +1,416 @@
+import asyncio
+import hashlib
 import logging
 import re
-from typing import Any, Iterable, List, Optional
+import weakref
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
 from fastapi import HTTPException, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.database import async_session_local, has_column
 from app.core.deps import get_openai_provider, get_specter2_query_embedder
-from app.core.safety import SafetyService
-from app.repositories.search_repository import SearchRepository
-from app.schemas.search_dto import AdvancedSearchFilter, PaperDto, SearchResponse
+from app.core.safety import ModerationFlaggedError, SafetyService
+from app.models import Paper
+from app.repositories.paper_repository import PaperRepository
+from app.repositories.search_repository import SearchRepository, VectorSearchParams
+from app.schemas.search_dto import (
+    AdvancedSearchFilter,
+    BatchSearchResponse,
+    BatchSearchResult,
+    PaperDto,
+    SearchMode,
+    SearchResponse,
+    SearchStreamChunk,
+    SearchTier,
+)
+from app.services.embedding_replica import EmbeddingReplica
+from app.services.keyword_memo import KeywordMemo
+from app.services.pdf_extraction_pool import PdfExtractionPool
+from app.services.pdf_search_cache import PdfSearchCache
+from app.services.search_cache import RankedSearch, SearchCache
 from app.utils.author_utils import normalize_authors
-from app.utils.pdf_utils import pdf_bytes_to_text
-from app.utils.token_utils import ensure_fits_token_limit
+from app.utils.timing_utils import stage_timer, timed
+from app.utils.token_utils import truncate_to_token_budget
 
 logger = logging.getLogger("inquiro")
 
 
+@dataclass(frozen=True)
+class ExtractedKeywords:
+    """Search keywords of a query."""
+
+    keywords: List[str]
+    # True if the keywords were newly extracted by the LLM and are not memoized yet
+    memoize: bool
+
+
 class SearchService:
     """
     Service for managing search requests.
     """
 
     MAX_KEYWORD_RETRIES = 2
+    DEFAULT_PAGE_SIZE = 10
     MAX_PDF_KEYWORD_INPUT_TOKENS = 280_000
+    UPLOAD_READ_CHUNK_BYTES = 1024 * 1024
 
     @staticmethod
-    async def search_papers(
+    async def search_papers(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         query: str,
         db: AsyncSession,
         search_filter: Optional[AdvancedSearchFilter] = None,
+        mode: SearchMode = "vector",
+        tier: Optional[SearchTier] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
     ) -> SearchResponse:
         """
-        Search using a free-text query
+        Search using a free-text query.
+        In hybrid mode, the query and the keywords are also matched with full-text search.
+        The tier defaults to SEARCH_DEFAULT_TIER.
+        The ranked result list is cached per normalized query, filter, mode and tier (see
+        SearchCache), so repeated searches and later pages requested with a cursor skip the
+        search pipeline.
         """
+        tier = tier or settings.SEARCH_DEFAULT_TIER
+        cache = SearchCache.get_instance()
+        cache_key = cache.make_key(query, search_filter, mode=mode, tier=tier)
+        offset = SearchService._resolve_cursor(cursor, cache_key)
+
+        ranked = cache.get(cache_key)
+        if ranked is not None:
+            logger.info("Serving cached search results for query: '%s'", query)
+            return await SearchService._build_page(db, cache_key, ranked, offset, page_size)
+
         openai_provider = get_openai_provider()
 
-        if not await SafetyService.check_moderation(query):
+        # Extract + normalize keywords with retry, overlapped with the moderation check
+        try:
+            extracted = await SafetyService.run_with_moderation(
+                query,
+                timed(
+                    "keyword_extraction",
+                    SearchService._extract_keywords_with_retry(
+                        openai_provider=openai_provider,
+                        query=query,
+                        max_retries=SearchService.MAX_KEYWORD_RETRIES,
+                    ),
+                ),
+            )
+        except ModerationFlaggedError as exc:
             logger.warning("Blocked toxic search query: %s", query)
-            raise HTTPException(status_code=400, detail="Search query violates safety policies.")
+            raise HTTPException(
+                status_code=400, detail="Search query violates safety policies."
+            ) from exc
 
-        # Extract + normalize keywords with retry
-        keywords = await SearchService._extract_keywords_with_retry(
-            openai_provider=openai_provider,
-            query=query,
-            max_retries=SearchService.MAX_KEYWORD_RETRIES,
-        )
+        keywords = extracted.keywords
         logger.info("Text search keywords: %s", keywords)
+        await SearchService._memoize_keywords(query, extracted)
 
-        return await SearchService._search_with_keywords(
+        ranked = await SearchService._search_with_keywords(
             keywords=keywords,
             db=db,
             user_query=query,
             search_filter=search_filter,
+            hydrate=offset + page_size,
+            lexical_terms=SearchService._lexical_terms(mode, query, keywords),
+            tier=tier,
+        )
+        cache.set(cache_key, ranked)
+        return await SearchService._build_page(db, cache_key, ranked, offset, page_size)
+
+    @staticmethod
+    async def stream_search_papers(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        query: str,
+        db: AsyncSession,
+        search_filter: Optional[AdvancedSearchFilter] = None,
+        mode: SearchMode = "vector",
+        tier: Optional[SearchTier] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[SearchStreamChunk]:
+        """
+        Progressive variant of search_papers that yields two result pages.
+
+        The preliminary page ranks the papers by the embedding of the raw query (the fallback
+        of the keyword extraction) and is available once this search and the moderation check
+        are done. The keyword extraction and the final search run concurrently on their own
+        session; the final page is the same as the first page of search_papers, and its
+        next_cursor can be used with search_papers.
+
+        The moderation check completes before this method returns, so flagged queries are
+        rejected with a regular 400 response instead of inside the stream. The final search
+        only memoizes its keywords and caches its ranking once the check has passed.
+        """
+        tier = tier or settings.SEARCH_DEFAULT_TIER
+        cache = SearchCache.get_instance()
+        cache_key = cache.make_key(query, search_filter, mode=mode, tier=tier)
+
+        ranked = cache.get(cache_key)
+        if ranked is not None:
+            logger.info("Serving cached search results for query: '%s'", query)
+            page = await SearchService._build_page(db, cache_key, ranked, 0, page_size)
+            return SearchService._stream_stages(
+                SearchStreamChunk(stage="final", **page.model_dump()), None
+            )
+
+        moderation_passed = asyncio.Event()
+        final_task = asyncio.create_task(
+            SearchService._search_page_in_new_session(
+                query, search_filter, mode, tier, page_size, cache_key, moderation_passed
+            )
         )
 
+        try:
+            # The preliminary ranking is replaced shortly after, so it uses the fast tier
+            preliminary = await SafetyService.run_with_moderation(
+                query,
+                SearchService._search_with_keywords(
+                    keywords=[query],
+                    db=db,
+                    user_query=query,
+                    search_filter=search_filter,
+                    hydrate=page_size,
+                    tier="fast",
+                ),
+            )
+        except ModerationFlaggedError as exc:
+            final_task.cancel()
+            logger.warning("Blocked toxic search query: %s", query)
+            raise HTTPException(
+                status_code=400, detail="Search query violates safety policies."
+            ) from exc
+        except BaseException:
+            final_task.cancel()
+            raise
+        moderation_passed.set()
+
+        first_chunk = SearchStreamChunk(
+            stage="preliminary",
+            papers=[
+                preliminary.papers[pid]
+                for pid in preliminary.paper_ids[:page_size]
+                if pid in preliminary.papers
+            ],
+        )
+        stream = SearchService._stream_stages(first_chunk, final_task)
+        # A generator that is never iterated (e.g. the client disconnects before the response
+        # starts) does not run its finally block, so the task is also cancelled once the
+        # stream is discarded
+        weakref.finalize(stream, final_task.cancel)
+        return stream
+
+    @staticmethod
+    async def _stream_stages(
+        first_chunk: SearchStreamChunk,
+        final_task: Optional[asyncio.Task[SearchResponse]],
+    ) -> AsyncIterator[SearchStreamChunk]:
+        """Yield the first chunk, then the final page once it is ready."""
+        try:
+            yield first_chunk
+            if final_task is not None:
+                page = await final_task
+                yield SearchStreamChunk(stage="final", **page.model_dump())
+        finally:
+            # Stop the pipeline if the client disconnects early
+            if final_task is not None:
+                final_task.cancel()
+
+    @staticmethod
+    async def _search_page_in_new_session(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        query: str,
+        search_filter: Optional[AdvancedSearchFilter],
+        mode: SearchMode,
+        tier: SearchTier,
+        page_size: int,
+        cache_key: str,
+        moderation_passed: asyncio.Event,
+    ) -> SearchResponse:
+        """
+        Run the keyword-based search pipeline on a new session while the caller runs the
+        moderation check. Once moderation_passed is set, the keywords are memoized, the
+        ranking is cached and its first page is returned.
+        """
+        with stage_timer("keyword_extraction"):
+            extracted = await SearchService._extract_keywords_with_retry(
+                openai_provider=get_openai_provider(),
+                query=query,
+                max_retries=SearchService.MAX_KEYWORD_RETRIES,
+            )
+        keywords = extracted.keywords
+        logger.info("Text search keywords: %s", keywords)
+
+        async with async_session_local() as db:
+            ranked = await SearchService._search_with_keywords(
+                keywords=keywords,
+                db=db,
+                user_query=query,
+                search_filter=search_filter,
+                hydrate=page_size,
+                lexical_terms=SearchService._lexical_terms(mode, query, keywords),
+                tier=tier,
+            )
+            await moderation_passed.wait()
+            await SearchService._memoize_keywords(query, extracted)
+            SearchCache.get_instance().set(cache_key, ranked)
+            return await SearchService._build_page(db, cache_key, ranked, 0, page_size)
+
+    @staticmethod
+    async def search_papers_batch(  # pylint: disable=too-many-locals
+        queries: List[str],
+        db: AsyncSession,
+        search_filter: Optional[AdvancedSearchFilter] = None,
+        tier: Optional[SearchTier] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> BatchSearchResponse:
+        """
+        Search for several free-text queries at once (vector mode).
+        Cached queries are served from the SearchCache. For all others, one batched moderation
+        check runs concurrently with the keyword extractions, all keywords are embedded in one
+        batch, and the vector searches are resolved in a single SQL statement. The first page
+        of every query is hydrated with a single query as well.
+        Flagged queries get an error instead of results. The rankings are cached like those
+        of single searches with the centroid candidate strategy, which the batched statement
+        always uses, so further pages can be requested from POST /search with the returned
+        next_cursor.
+        """
+        tier = tier or settings.SEARCH_DEFAULT_TIER
+        cache = SearchCache.get_instance()
+        keys = [
+            cache.make_key(query, search_filter, mode="vector", tier=tier, strategy="centroid")
+            for query in queries
+        ]
+
+        ranked_by_key: Dict[str, RankedSearch] = {}
+        pending: Dict[str, str] = {}
+        for key, query in zip(keys, queries):
+            ranked = cache.get(key)
+            if ranked is not None:
+                ranked_by_key[key] = ranked
+            else:
+                pending.setdefault(key, query)
+
+        flagged: set[str] = set()
+        if pending:
+            pending_keys = list(pending)
+            pending_queries = list(pending.values())
+            safe, extracted = await asyncio.gather(
+                SafetyService.check_moderation_batch(pending_queries),
+                SearchService._extract_batch_keywords(pending_queries),
+            )
+            flagged = {key for key, is_safe in zip(pending_keys, safe) if not is_safe}
+            searched = [i for i, key in enumerate(pending_keys) if key not in flagged]
+            if flagged:
+                logger.warning("Blocked %d toxic queries of a batch search", len(flagged))
+            await asyncio.gather(
+                *(
+                    SearchService._memoize_keywords(pending_queries[i], extracted[i])
+                    for i in searched
+                )
+            )
+
+            embeddings = await SearchService._embed_batch_keywords(
+                [extracted[i].keywords for i in searched]
+            )
+            rows = await SearchRepository.search_papers_batch(
+                db=db, embeddings=embeddings, search_filter=search_filter, tier=tier
+            )
+            for i, query_embeddings, query_rows in zip(searched, embeddings, rows):
+                ranked = RankedSearch(paper_ids=[paper_id for paper_id, _ in query_rows])
+                ranked_by_key[pending_keys[i]] = ranked
+                if query_embeddings:
+                    cache.set(pending_keys[i], ranked)
+
+        await SearchService._hydrate_first_pages(db, list(ranked_by_key.values()), page_size)
+
+        results: List[BatchSearchResult] = []
+        for key, query in zip(keys, queries):
+            if key in flagged:
+                results.append(
+                    BatchSearchResult(
+                        query=query, papers=[], error="Search query violates safety policies."
+                    )
+                )
+                continue
+            page = await SearchService._build_page(db, key, ranked_by_key[key], 0, page_size)
+            results.append(BatchSearchResult(query=query, **page.model_dump()))
+
+        logger.info("Batch search: %d queries, %d searched", len(queries), len(pending))
+        return BatchSearchResponse(results=results)
+
+    @staticmethod
+    async def _hydrate_first_pages(
+        db: AsyncSession, rankings: List[RankedSearch], page_size: int
+    ) -> None:
+        """Load the papers of the first page of all rankings with a single query."""
+        page_ids = {
+            paper_id
+            for ranked in rankings
+            for paper_id in ranked.paper_ids[:page_size]
+            if paper_id not in ranked.papers
+        }
+        if not page_ids:
+            return
+
+        with stage_timer("hydrate_query"):
+            docs = await PaperRepository.get_papers_by_ids(db, list(page_ids))
+        with stage_timer("dto_mapping"):
+            dtos = {doc.paper_id: SearchService._to_paper_dto(doc) for doc in docs}
+            for ranked in rankings:
+                for paper_id in ranked.paper_ids[:page_size]:
+                    if paper_id in dtos:
+                        ranked.papers[paper_id] = dtos[paper_id]
+
+    @staticmethod
+    async def _extract_batch_keywords(queries: List[str]) -> List[ExtractedKeywords]:
+        """
+        Extract the keywords of all queries concurrently, with at most
+        SEARCH_BATCH_KEYWORD_CONCURRENCY LLM calls in flight.
+        """
+        openai_provider = get_openai_provider()
+        semaphore = asyncio.Semaphore(settings.SEARCH_BATCH_KEYWORD_CONCURRENCY)
+
+        async def extract(query: str) -> ExtractedKeywords:
+            async with semaphore:
+                return await SearchService._extract_keywords_with_retry(
+                    openai_provider=openai_provider,
+                    query=query,
+                    max_retries=SearchService.MAX_KEYWORD_RETRIES,
+                )
+
+        with stage_timer("keyword_extraction"):
+            return list(await asyncio.gather(*(extract(query) for query in queries)))
+
+    @staticmethod
+    async def _embed_batch_keywords(keywords: List[List[str]]) -> List[List[List[float]]]:
+        """
+        Embed the distinct keywords of all queries in one batch.
+        Returns the keyword embeddings of every query; failed embeddings are skipped.
+        """
+        distinct = list(dict.fromkeys(keyword for query in keywords for keyword in query))
+        if not distinct:
+            return [[] for _ in keywords]
+
+        embedder = get_specter2_query_embedder()
+        with stage_timer("embedding"):
+            vectors = dict(zip(distinct, await embedder.embed_batch_async(distinct)))
+        return [
+            [vector for keyword in query if (vector := vectors[keyword]) is not None]
+            for query in keywords
+        ]
+
     @staticmethod
-    async def search_papers_from_pdf(
+    async def search_papers_from_pdf(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
         pdf_file: UploadFile,
         db: AsyncSession,
         query: Optional[str] = None,
         search_filter: Optional[AdvancedSearchFilter] = None,
+        mode: SearchMode = "vector",
+        tier: Optional[SearchTier] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
     ) -> SearchResponse:
         """
         Search using a PDF as the primary signal.
@@ -67,26 +418,177 @@ class SearchService:
         2. Optionally combine with user query.
         3. Let the LLM derive search keywords from this context.
         4. Use keywords for vector search.
+        The moderation check of the optional query runs concurrently with steps 1-3.
+        The ranked result list is cached per document, query, filter, mode and tier.
         """
+        tier = tier or settings.SEARCH_DEFAULT_TIER
+        content, document_hash = await SearchService._read_upload(pdf_file)
+        if not content:
+            logger.warning("Empty PDF uploaded for search")
+            return SearchResponse(papers=[])
+
+        cache = SearchCache.get_instance()
+        cache_key = cache.make_key(
+            query or "",
+            search_filter,
+            document_hash=document_hash,
+            mode=mode,
+            tier=tier,
+        )
+        offset = SearchService._resolve_cursor(cursor, cache_key)
+
+        ranked = cache.get(cache_key)
+        if ranked is not None:
+            logger.info("Serving cached PDF search results for: '%s'", pdf_file.filename)
+            return await SearchService._build_page(db, cache_key, ranked, offset, page_size)
+
+        keyword_work = SearchService._extract_pdf_search_keywords(
+            content, document_hash, pdf_file.filename, query
+        )
+
         if query and query.strip():
-            if not await SafetyService.check_moderation(query):
+            try:
+                keywords = await SafetyService.run_with_moderation(query, keyword_work)
+            except ModerationFlaggedError as exc:
                 logger.warning("Blocked toxic PDF context query: %s", query)
                 raise HTTPException(
                     status_code=400, detail="Context query violates safety policies."
-                )
+                ) from exc
+        else:
+            keywords = await keyword_work
 
-        content = await pdf_file.read()
-        if not content:
-            logger.warning("Empty PDF uploaded for search")
+        # Only keywords of a query that passed moderation are reused
+        if keywords:
+            PdfSearchCache.get_instance().set_keywords(document_hash, query, keywords)
+
+        ranked = await SearchService._search_with_keywords(
+            keywords=keywords,
+            db=db,
+            user_query=query or pdf_file.filename or "pdf-search",
+            search_filter=search_filter,
+            hydrate=offset + page_size,
+            lexical_terms=SearchService._lexical_terms(mode, query, keywords),
+            tier=tier,
+        )
+        cache.set(cache_key, ranked)
+        return await SearchService._build_page(db, cache_key, ranked, offset, page_size)
+
+    @staticmethod
+    async def find_similar_papers(
+        paper_id: int,
+        db: AsyncSession,
+        search_filter: Optional[AdvancedSearchFilter] = None,
+        tier: Optional[SearchTier] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> SearchResponse:
+        """
+        Find the papers closest to the stored embedding of the given paper.
+        No keywords are extracted and nothing is embedded: the stored vector is the query.
+        Without filter, the embedding replica is scanned if it is ready; otherwise the search
+        runs like any vector search (filter plan, index settings and candidate query).
+        The paper itself is excluded from the results.
+        """
+        paper = await PaperRepository.get_paper_embedding_by_id(db, paper_id)
+        if paper is None:
+            logger.warning("Paper with id %s not found", paper_id)
+            raise HTTPException(status_code=404, detail="Paper not found.")
+        if paper.embedding is None:
+            logger.warning("Paper with id %s has no embedding", paper_id)
             return SearchResponse(papers=[])
 
+        embeddings = [[float(value) for value in paper.embedding]]
+        tier = tier or settings.SEARCH_DEFAULT_TIER
+        replica = EmbeddingReplica.get_instance()
+        if replica.is_ready and search_filter is None:
+            ranked = await SearchService._search_replica(
+                replica, embeddings, db, f"similar to paper {paper_id}", limit + 1, tier
+            )
+            similar_ids = [pid for pid in ranked.paper_ids[: limit + 1] if pid != paper_id]
+            return SearchResponse(
+                papers=[ranked.papers[pid] for pid in similar_ids if pid in ranked.papers][:limit]
+            )
+
+        # The paper is its own nearest neighbour, so one extra result is requested
+        rows = await SearchRepository.search_papers_by_embeddings(
+            db=db,
+            embeddings=embeddings,
+            limit=limit + 1,
+            search_filter=search_filter,
+            tier=tier,
+        )
+        ranked = RankedSearch(paper_ids=[pid for pid, _ in rows if pid != paper_id][:limit])
+        await SearchService._hydrate_first_pages(db, [ranked], limit)
+        return SearchResponse(
+            papers=[ranked.papers[pid] for pid in ranked.paper_ids if pid in ranked.papers]
+        )
+
+    @staticmethod
+    async def _read_upload(upload: UploadFile) -> Tuple[bytes, str]:
+        """Read the upload in chunks and return its content and SHA-256 hex digest."""
+        digest = hashlib.sha256()
+        content = bytearray()
+        while chunk := await upload.read(SearchService.UPLOAD_READ_CHUNK_BYTES):
+            digest.update(chunk)
+            content.extend(chunk)
+        return bytes(content), digest.hexdigest()
+
+    @staticmethod
+    async def _extract_pdf_search_keywords(
+        content: bytes,
+        document_hash: str,
+        filename: Optional[str],
+        query: Optional[str],
+    ) -> List[str]:
+        """
+        Let the LLM derive search keywords from the text of the uploaded PDF.
+        The text and the keywords per query are cached by document hash; the caller stores
+        the keywords once the query has passed moderation.
+        """
+        pdf_cache = PdfSearchCache.get_instance()
+        keywords = pdf_cache.get_keywords(document_hash, query)
+        if keywords is not None:
+            logger.info("Using cached PDF search keywords: %s", keywords)
+            return keywords
+
+        pdf_text = pdf_cache.get_text(document_hash)
+        if pdf_text is None:
+            with stage_timer("pdf_text_extraction"):
+                pdf_text = await SearchService._extract_pdf_text(content, filename)
+            pdf_cache.set_text(document_hash, pdf_text)
+
+        openai_provider = get_openai_provider()
+        with stage_timer("keyword_extraction"):
+            keywords = await SearchService._extract_pdf_keywords_with_retry(
+                openai_provider=openai_provider,
+                pdf_text=pdf_text,
+                query=query,
+                max_retries=SearchService.MAX_KEYWORD_RETRIES,
+            )
+        logger.info("PDF search keywords: %s", keywords)
+        return keywords
+
+    @staticmethod
+    async def _extract_pdf_text(content: bytes, filename: Optional[str]) -> str:
+        """
+        Extract the text of the uploaded PDF, truncated to the keyword input budget.
+        The extraction runs in a worker process and only reads the leading pages.
+        """
         try:
-            pdf_text = pdf_bytes_to_text(content)
+            pdf_text = await PdfExtractionPool.get_instance().extract_text(
+                content,
+                max_pages=settings.PDF_SEARCH_MAX_PAGES,
+                max_chars=settings.PDF_SEARCH_MAX_CHARS,
+            )
+        except TimeoutError as exc:
+            logger.warning("PDF text extraction timed out for: %s", filename or "<unknown>")
+            raise HTTPException(
+                status_code=422,
+                detail="PDF text extraction took too long. Please try a smaller document.",
+            ) from exc
         except Exception as exc:  # pylint: disable=broad-exception-caught
-            filename = pdf_file.filename or "<unknown>"
             logger.warning(
                 "Invalid or corrupted PDF uploaded for search: %s; error: %s",
-                filename,
+                filename or "<unknown>",
                 exc,
             )
             # Return a client error instead of 500
@@ -95,81 +597,190 @@ class SearchService:
                 detail="Invalid or corrupted PDF file.",
             ) from exc
 
-        ensure_fits_token_limit(
-            pdf_text,
-            max_tokens=SearchService.MAX_PDF_KEYWORD_INPUT_TOKENS,
-            error_status=413,
-            error_detail=(
-                "PDF is too large to be used directly for semantic search. "
-                "Please try a shorter document or a cropped version."
-            ),
-        )
-
-        openai_provider = get_openai_provider()
-        keywords = await SearchService._extract_pdf_keywords_with_retry(
-            openai_provider=openai_provider,
-            pdf_text=pdf_text,
-            query=query,
-            max_retries=SearchService.MAX_KEYWORD_RETRIES,
-        )
-        logger.info("PDF search keywords: %s", keywords)
-
-        label = query or pdf_file.filename or "pdf-search"
-        return await SearchService._search_with_keywords(
-            keywords=keywords, db=db, user_query=label, search_filter=search_filter
+        # Keywords only need the leading part of very long documents
+        return truncate_to_token_budget(
+            pdf_text, max_tokens=SearchService.MAX_PDF_KEYWORD_INPUT_TOKENS
         )
 
     # ---------- Shared search pipeline ----------
 
     @staticmethod
-    async def _search_with_keywords(
+    async def _search_with_keywords(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         keywords: List[str],
         db: AsyncSession,
         user_query: str,
         search_filter: Optional[AdvancedSearchFilter] = None,
-    ) -> SearchResponse:
+        hydrate: int = DEFAULT_PAGE_SIZE,
+        lexical_terms: Optional[List[str]] = None,
+        tier: SearchTier = "balanced",
+    ) -> RankedSearch:
         """
-        Core embedding + vector-search + DTO mapping pipeline.
+        Core embedding + vector-search pipeline.
+        If lexical_terms are given, the hybrid full-text + vector search is used; its
+        full-text query runs concurrently on a separate session. Without the
+        paper.search_document column (see init_db), hybrid searches fall back to vector search.
+        Returns the full ranked candidate list; the papers of the first `hydrate` results are
+        loaded with a single query.
         """
         if not keywords:
             logger.warning("No keywords provided for query '%s'", user_query)
-            return SearchResponse(papers=[])
+            return RankedSearch(paper_ids=[])
 
         # Generate query embeddings
         embedder = get_specter2_query_embedder()
-        embeddings = embedder.embed_batch(keywords)
+        with stage_timer("embedding"):
+            embeddings = await embedder.embed_batch_async(keywords)
 
-        rows = await SearchRepository.search_papers_by_embeddings(
-            db=db,
-            embeddings=embeddings,
-            limit=10,
-            search_filter=search_filter,
-        )
+        if lexical_terms and not has_column(Paper.__tablename__, "search_document"):
+            logger.warning("Full-text search unavailable, running a vector search instead")
+            lexical_terms = None
+
+        replica = EmbeddingReplica.get_instance()
+        if replica.is_ready and search_filter is None and not lexical_terms:
+            return await SearchService._search_replica(
+                replica, embeddings, db, user_query, hydrate, tier
+            )
 
-        results: List[PaperDto] = []
-        # Iterate over resolved results
-        for doc, avg_dist in rows:
-            logger.info("Match: %s... | Avg. Distance: %.4f", doc.title[:30], avg_dist)
-            authors_value = normalize_authors(doc.authors)
-            results.append(
-                PaperDto(
-                    paper_id=doc.paper_id,
-                    doi=doc.doi,
-                    source=str(doc.source),
-                    paper_type=str(doc.paper_type),
-                    title=doc.title,
-                    authors=authors_value,
-                    abstract=doc.abstract,
-                    published_at=doc.published_at,
+        if lexical_terms:
+            async with async_session_local() as lexical_db:
+                rows = await SearchRepository.search_papers_hybrid(
+                    db=db,
+                    lexical_db=lexical_db,
+                    embeddings=embeddings,
+                    lexical_terms=lexical_terms,
+                    limit=None,
+                    search_filter=search_filter,
+                    tier=tier,
                 )
+        else:
+            rows = await SearchRepository.search_papers_by_embeddings(
+                db=db,
+                embeddings=embeddings,
+                limit=None,
+                search_filter=search_filter,
+                tier=tier,
             )
 
+        ranked = RankedSearch(paper_ids=[paper_id for paper_id, _ in rows])
+        await SearchService._hydrate_first_pages(db, [ranked], hydrate)
+        for paper_id, avg_dist in rows[:hydrate]:
+            if paper_id in ranked.papers:
+                logger.info(
+                    "Match: %s... | Avg. Distance: %.4f",
+                    ranked.papers[paper_id].title[:30],
+                    avg_dist,
+                )
+
         logger.info(
             "Found %d papers for query: '%s'",
-            len(results),
+            len(ranked.paper_ids),
             user_query,
         )
-        return SearchResponse(papers=results)
+        return ranked
+
+    @staticmethod
+    async def _search_replica(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        replica: EmbeddingReplica,
+        embeddings: List[List[float]],
+        db: AsyncSession,
+        user_query: str,
+        hydrate: int,
+        tier: SearchTier,
+    ) -> RankedSearch:
+        """
+        Rank the candidates of the in-process embedding replica; only the first `hydrate`
+        papers are loaded from the database.
+        """
+        with stage_timer("replica_search"):
+            matches = await replica.search(
+                embeddings,
+                pool_size=VectorSearchParams.for_tier(tier, exact=True).pool_size,
+                threshold=SearchRepository.DEFAULT_DISTANCE_THRESHOLD,
+            )
+
+        ranked = RankedSearch(paper_ids=[paper_id for paper_id, _ in matches])
+        await SearchService._hydrate_first_pages(db, [ranked], hydrate)
+
+        logger.info(
+            "Found %d papers for query: '%s' (embedding replica)",
+            len(ranked.paper_ids),
+            user_query,
+        )
+        return ranked
+
+    @staticmethod
+    async def _build_page(
+        db: AsyncSession,
+        cache_key: str,
+        ranked: RankedSearch,
+        offset: int,
+        page_size: int,
+    ) -> SearchResponse:
+        """
+        Map one page of a ranked result list to a SearchResponse.
+        Papers of the page that have not been hydrated yet are loaded by id.
+        """
+        page_ids = ranked.paper_ids[offset : offset + page_size]
+
+        missing_ids = [paper_id for paper_id in page_ids if paper_id not in ranked.papers]
+        if missing_ids:
+            with stage_timer("hydrate_query"):
+                docs = await PaperRepository.get_papers_by_ids(db, missing_ids)
+            with stage_timer("dto_mapping"):
+                for doc in docs:
+                    ranked.papers[doc.paper_id] = SearchService._to_paper_dto(doc)
+
+        next_offset = offset + page_size
+        next_cursor = None
+        if next_offset < len(ranked.paper_ids):
+            next_cursor = SearchCache.encode_cursor(cache_key, next_offset)
+
+        # Papers deleted since the search was ranked are skipped
+        return SearchResponse(
+            papers=[ranked.papers[pid] for pid in page_ids if pid in ranked.papers],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _resolve_cursor(cursor: Optional[str], cache_key: str) -> int:
+        """Return the result offset encoded in the cursor (0 without a cursor)."""
+        if cursor is None:
+            return 0
+
+        try:
+            cursor_key, offset = SearchCache.decode_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail="Invalid search cursor.") from exc
+
+        if cursor_key != cache_key:
+            raise HTTPException(
+                status_code=400, detail="Search cursor does not belong to this search."
+            )
+        return offset
+
+    @staticmethod
+    def _lexical_terms(
+        mode: SearchMode, query: Optional[str], keywords: List[str]
+    ) -> Optional[List[str]]:
+        """Return the full-text terms of a hybrid search (query and keywords), else None."""
+        if mode != "hybrid":
+            return None
+        return [query, *keywords] if query and query.strip() else keywords
+
+    @staticmethod
+    def _to_paper_dto(doc: Paper) -> PaperDto:
+        """Map a Paper ORM entity to a PaperDto."""
+        authors_value = normalize_authors(doc.authors)
+        return PaperDto(
+            paper_id=doc.paper_id,
+            doi=doc.doi,
+            source=str(doc.source),
+            paper_type=str(doc.paper_type),
+            title=doc.title,
+            authors=authors_value,
+            abstract=doc.abstract,
+            published_at=doc.published_at,
+        )
 
     # ---------- Helper functions ----------
 
@@ -178,11 +789,19 @@ class SearchService:
         openai_provider: Any,
         query: str,
         max_retries: int = 2,
-    ) -> List[str]:
+    ) -> ExtractedKeywords:
         """
         Extract keywords from the provider with retries and format normalization
+        Previously extracted keywords are served from the KeywordMemo without an LLM call
         Falls back to [query] if all attempts fail or produce no valid keywords
+        New keywords are not memoized here, since the query may still fail moderation
+        (see _memoize_keywords)
         """
+        memoized = await KeywordMemo.get_instance().get(query)
+        if memoized:
+            logger.info("Using memoized keywords for query: '%s'", query)
+            return ExtractedKeywords(keywords=memoized, memoize=False)
+
         last_error: Exception | None = None
 
         for attempt in range(max_retries + 1):
@@ -200,7 +819,7 @@ class SearchService:
                 keywords = []
 
             if keywords:
-                return keywords
+                return ExtractedKeywords(keywords=keywords, memoize=True)
 
         # All retries failed or produced unusable keywords
         if last_error:
@@ -217,7 +836,13 @@ class SearchService:
                 max_retries + 1,
             )
 
-        return [query]
+        return ExtractedKeywords(keywords=[query], memoize=False)
+
+    @staticmethod
+    async def _memoize_keywords(query: str, extracted: ExtractedKeywords) -> None:
+        """Memoize newly extracted keywords; call only once the query passed moderation."""
+        if extracted.memoize:
+            await KeywordMemo.get_instance().set(query, extracted.keywords)
 
     @staticmethod
     async def _extract_pdf_keywords_with_retry(
@@ -1,15 +1,24 @@
 import io
+from typing import Optional
 
 from pypdf import PdfReader
 
 
-def pdf_bytes_to_text(content: bytes) -> str:
+def pdf_bytes_to_text(
+    content: bytes,
+    *,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+) -> str:
     """
     Convert raw PDF bytes to plain text.
-    Reads all pages and joins with newlines.
+    Reads the pages in order and joins them with newlines. Reading stops early after
+    max_pages pages or as soon as max_chars characters have been collected.
 
     Args:
         content: Raw PDF file bytes.
+        max_pages: Maximum number of leading pages to read (None reads all pages).
+        max_chars: Maximum length of the returned text (None returns the full text).
 
     Returns:
         Extracted text with normalized line endings (\\r replaced with \\n).
@@ -20,8 +29,16 @@ def pdf_bytes_to_text(content: bytes) -> str:
     with io.BytesIO(content) as buf:
         reader = PdfReader(buf)
         parts: list[str] = []
-        for page in reader.pages:
+        length = 0
+        for page_number, page in enumerate(reader.pages):
+            if max_pages is not None and page_number >= max_pages:
+                break
             parts.append(page.extract_text() or "")
+            length += len(parts[-1]) + 1
+            if max_chars is not None and length >= max_chars:
+                break
 
     text = "\n".join(parts)
+    if max_chars is not None:
+        text = text[:max_chars]
     return text.replace("\r", "\n")
@@ -0,0 +1,27 @@
+"""Helpers for serializing responses that contain large paper lists."""
+
+from typing import Any, Dict, Union
+
+from fastapi.responses import ORJSONResponse
+
+from app.schemas.paper_dto import PaperProjection
+from app.schemas.project_dto import ProjectRecommendationsResponse, ProjectWithPapersResponse
+from app.schemas.search_dto import SearchResponse
+
+PaperListResponse = Union[SearchResponse, ProjectRecommendationsResponse, ProjectWithPapersResponse]
+
+
+def paper_list_content(response: PaperListResponse, projection: PaperProjection) -> Dict[str, Any]:
+    """Dump a response to plain data, applying the field projection to its papers."""
+    content = response.model_dump(mode="json", exclude={"papers"})
+    content["papers"] = [projection.apply(paper) for paper in response.papers]
+    # Keep the field order of the response model
+    return {name: content[name] for name in type(response).model_fields}
+
+
+def paper_list_response(response: PaperListResponse, projection: PaperProjection) -> ORJSONResponse:
+    """
+    Serialize a response with orjson, applying the field projection to its papers.
+    Bypasses the response_model validation of FastAPI, which would re-validate every paper.
+    """
+    return ORJSONResponse(paper_list_content(response, projection))
@@ -0,0 +1,115 @@
+"""Per-request stage timers and latency histograms."""
+
+import bisect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Awaitable, Dict, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Stage durations (ms) of the current request, None outside of record_stage_timings
+_stage_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("stage_timings", default=None)
+
+# Upper bounds (ms) of the histogram buckets; larger values fall into an overflow bucket
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10_000, 30_000)
+
+
+@contextmanager
+def record_stage_timings() -> Iterator[Dict[str, float]]:
+    """
+    Collect the durations of all stages timed within the block (see stage_timer).
+    Tasks and threads started within the block inherit the context, so their stages are
+    collected as well.
+    """
+    timings: Dict[str, float] = {}
+    token = _stage_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _stage_timings.reset(token)
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """
+    Add the duration of the block to the stage of the current request (monotonic clock).
+    Repeated stages are summed; stages running concurrently overlap. Outside of
+    record_stage_timings nothing is recorded.
+    """
+    timings = _stage_timings.get()
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = timings.get(stage, 0.0) + (time.perf_counter() - start) * 1000
+
+
+async def timed(stage: str, awaitable: Awaitable[T]) -> T:
+    """Await the awaitable and add its duration to the stage (see stage_timer)."""
+    with stage_timer(stage):
+        return await awaitable
+
+
+def format_server_timing(timings: Dict[str, float]) -> str:
+    """Format stage durations (ms) as the value of a Server-Timing header."""
+    return ", ".join(f"{stage};dur={duration:.1f}" for stage, duration in timings.items())
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Snapshot of a latency histogram."""
+
+    # Number of observations per bucket of BUCKETS_MS, plus the overflow bucket
+    counts: Tuple[int, ...]
+    count: int
+    total_ms: float
+
+    @property
+    def mean_ms(self) -> float:
+        """Average of all observations."""
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile_ms(self, q: float) -> float:
+        """
+        Return the upper bound of the bucket containing the q-th percentile (0-100).
+        Observations in the overflow bucket are reported as infinity.
+        """
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for bound, bucket_count in zip(BUCKETS_MS, self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return float(bound)
+        return float("inf")
+
+
+class LatencyHistogram:
+    """
+    Histogram of durations (ms) with fixed buckets (BUCKETS_MS).
+
+    Not thread-safe: intended to be used from the asyncio event loop only.
+    """
+
+    def __init__(self) -> None:
+        self._counts = [0] * (len(BUCKETS_MS) + 1)
+        self._total_ms = 0.0
+
+    def observe(self, duration_ms: float) -> None:
+        """Add one observation."""
+        self._counts[bisect.bisect_left(BUCKETS_MS, duration_ms)] += 1
+        self._total_ms += duration_ms
+
+    @property
+    def snapshot(self) -> HistogramSnapshot:
+        """Current counts of the histogram."""
+        return HistogramSnapshot(
+            counts=tuple(self._counts), count=sum(self._counts), total_ms=self._total_ms
+        )
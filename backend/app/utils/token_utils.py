@@ -1,18 +1,96 @@
+from typing import Iterator
+
 import tiktoken
 from fastapi import HTTPException
 
 ENCODING = tiktoken.get_encoding("o200k_base")
 
+# Texts are tokenized in chunks of about this many characters, so counting can stop early
+CHUNK_CHARS = 32_768
+# Every o200k_base token covers at least one UTF-8 byte, and a character at most four bytes
+_MAX_BYTES_PER_CHAR = 4
+
+
+def _certainly_fits(text: str, max_tokens: int) -> bool:
+    """
+    Return True if the text certainly fits into max_tokens without tokenizing it.
+    The number of tokens never exceeds the number of UTF-8 bytes of the text.
+    """
+    if len(text) * _MAX_BYTES_PER_CHAR <= max_tokens:
+        return True
+    # Only compute the exact byte length if the cheap character bound may be decisive
+    return len(text) <= max_tokens and len(text.encode("utf-8")) <= max_tokens
+
+
+def _iter_chunks(text: str) -> Iterator[str]:
+    """
+    Split the text into chunks of about CHUNK_CHARS characters. Chunks end before a
+    whitespace character, where the tokenizer's pre-tokenization splits the text anyway,
+    so the chunks encode to (almost exactly) the tokens of the whole text.
+    """
+    start = 0
+    while start < len(text):
+        end = start + CHUNK_CHARS
+        if end < len(text):
+            split = text.rfind(" ", start + 1, end)
+            end = split if split > start else end
+        yield text[start:end]
+        start = end
+
+
+def count_tokens_up_to(text: str, limit: int) -> int:
+    """
+    Count the o200k_base tokens of the text incrementally, stopping as soon as the count
+    exceeds limit. The exact count is returned if it is at most limit, otherwise some value
+    greater than limit.
+    """
+    count = 0
+    for chunk in _iter_chunks(text):
+        count += len(ENCODING.encode_ordinary(chunk))
+        if count > limit:
+            break
+    return count
+
+
+def fits_token_budget(text: str, max_tokens: int) -> bool:
+    """Return whether the text has at most max_tokens tokens (o200k_base)."""
+    if not text or _certainly_fits(text, max_tokens):
+        return True
+    return count_tokens_up_to(text, max_tokens) <= max_tokens
+
+
+def truncate_to_token_budget(text: str, max_tokens: int) -> str:
+    """
+    Return the longest prefix of the text (at chunk and token boundaries) that has at most
+    max_tokens tokens. Texts within the budget are returned unchanged.
+    """
+    if not text or _certainly_fits(text, max_tokens):
+        return text
+
+    parts: list[str] = []
+    remaining = max_tokens
+    for chunk in _iter_chunks(text):
+        tokens = ENCODING.encode_ordinary(chunk)
+        if len(tokens) > remaining:
+            # A token cut in the middle of a multibyte character is dropped
+            parts.append(ENCODING.decode(tokens[:remaining], errors="ignore"))
+            break
+        parts.append(chunk)
+        remaining -= len(tokens)
+    return "".join(parts)
+
 
 def ensure_fits_token_limit(
-        text: str,
-        max_tokens: int,
-        *,
-        error_status: int = 413,
-        error_detail: str | None = None,
+    text: str,
+    max_tokens: int,
+    *,
+    error_status: int = 413,
+    error_detail: str | None = None,
 ) -> None:
     """
     Checks if the given text fits within the token limit using o200k_base encoding.
+    Small texts are accepted without tokenization; larger ones are tokenized in chunks
+    until the limit is exceeded.
 
     Args:
         text (str): The text to check.
@@ -23,13 +101,8 @@ def ensure_fits_token_limit(
     Raises:
         HTTPException: If token count exceeds max_tokens.
     """
-    if not text:
-        token_count = 0
-    else:
-        token_count = len(ENCODING.encode(text))
-
-    if token_count > max_tokens:
+    if not fits_token_budget(text, max_tokens):
         raise HTTPException(
             status_code=error_status,
-            detail=error_detail or f"Input too long ({token_count} tokens, limit {max_tokens}).",
+            detail=error_detail or f"Input too long (more than {max_tokens} tokens).",
         )
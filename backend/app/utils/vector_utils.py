@@ -0,0 +1,67 @@
+"""Utility helpers for in-process vector math on embedding matrices."""
+
+from typing import Any, Dict, Hashable, Sequence
+
+import numpy as np
+
+
+def to_matrix(vectors: Sequence[Any]) -> np.ndarray:
+    """Stack a sequence of vectors (lists or arrays) into a 2D float32 matrix."""
+    return np.asarray([np.asarray(v, dtype=np.float32) for v in vectors], dtype=np.float32)
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Return a copy of the matrix with every row scaled to unit length."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / (norms + 1e-12)
+
+
+def centroid(vectors: Sequence[Any]) -> np.ndarray:
+    """Return the unit-length mean of the given vectors."""
+    q = to_matrix(vectors).mean(axis=0)
+    q /= np.linalg.norm(q) + 1e-12
+    return q
+
+
+def mean_unit_vector(vectors: Sequence[Any]) -> np.ndarray:
+    """
+    Return the mean of the given vectors after scaling each of them to unit length.
+    For a candidate c, the avg. cosine distance to the vectors is 1 - |m| * (1 - d), where m
+    is this mean and d the cosine distance of c to m; see mean_cosine_distances.
+    """
+    return normalize_rows(to_matrix(vectors)).mean(axis=0)
+
+
+def mean_cosine_distances(candidates: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    """
+    Compute the average cosine distance of every candidate row to all query rows.
+    Equivalent to averaging pgvector's ``<=>`` over all queries, but done as one matrix product.
+    """
+    similarities = normalize_rows(candidates) @ normalize_rows(queries).T
+    return 1.0 - similarities.mean(axis=1)
+
+
+def rank_by_distance(distances: np.ndarray, threshold: float, limit: int | None) -> np.ndarray:
+    """
+    Return the indices of all distances below the threshold, ordered ascending.
+    If a limit is given, only the best ``limit`` indices are returned.
+    """
+    (eligible,) = np.nonzero(distances < threshold)
+    order = eligible[np.argsort(distances[eligible], kind="stable")]
+    if limit is not None:
+        order = order[:limit]
+    return order
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Hashable]], k: int = 60
+) -> Dict[Hashable, float]:
+    """
+    Merge several rankings into one score per item: the sum of 1 / (k + rank) over all
+    rankings that contain the item (rank starting at 1). Higher scores rank first.
+    """
+    scores: Dict[Hashable, float] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking, start=1):
+            scores[item] = scores.get(item, 0.0) + 1.0 / (k + rank)
+    return scores
@@ -0,0 +1,81 @@
+"""
+Benchmark the latency of the vector search against the hybrid full-text + vector search.
+
+Query embeddings are taken from randomly sampled papers and the lexical terms from their titles,
+so the benchmark needs neither the embedding model nor the LLM.
+
+Usage (from backend/):
+    python -m benchmarks.hybrid_search_benchmark --queries 20
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import List, Tuple
+
+from app.core.database import async_session_local, engine
+from app.models.paper import Paper
+from app.repositories.search_repository import SearchRepository
+from benchmarks.common import configure_logging, latency_summary, sample_papers
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+
+async def time_search(embedding: List[float], title: str, hybrid: bool) -> Tuple[float, int]:
+    """Run one search and return (elapsed ms, number of results)."""
+    async with async_session_local() as db, async_session_local() as lexical_db:
+        start = time.perf_counter()
+        if hybrid:
+            rows = await SearchRepository.search_papers_hybrid(
+                db=db,
+                lexical_db=lexical_db,
+                embeddings=[embedding],
+                lexical_terms=[title],
+                limit=None,
+            )
+        else:
+            rows = await SearchRepository.search_papers_by_embeddings(
+                db=db, embeddings=[embedding], limit=None
+            )
+        return (time.perf_counter() - start) * 1000, len(rows)
+
+
+async def run(num_queries: int) -> None:
+    """Benchmark both modes on the same sampled queries."""
+    # (embedding, title) of randomly sampled papers
+    queries = await sample_papers(num_queries, Paper.title)
+    if not queries:
+        logger.warning("No papers with embeddings found")
+        await engine.dispose()
+        return
+    logger.info("Sampled %d queries", len(queries))
+
+    for hybrid in (False, True):
+        timings, results = [], []
+        for embedding, title in queries:
+            elapsed_ms, count = await time_search(embedding, title, hybrid)
+            timings.append(elapsed_ms)
+            results.append(count)
+
+        latency = latency_summary(timings)
+        logger.info(
+            "%-7s median %.1f ms | p95 %.1f ms | max %.1f ms | avg. results %.1f",
+            "hybrid" if hybrid else "vector",
+            latency["p50"],
+            latency["p95"],
+            latency["max"],
+            statistics.mean(results),
+        )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark vector vs. hybrid search latency.")
+    parser.add_argument("--queries", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.queries))
@@ -0,0 +1,111 @@
+"""
+Benchmark recall and latency of the centroid and multi-probe candidate strategies.
+
+Each benchmark query consists of several "keyword" embeddings: papers sampled from the
+neighbourhood of a random seed paper, so the vectors are related but not identical. The ground
+truth is the exact top-k by avg. distance to all keyword embeddings (a full scan without index).
+
+Usage (from backend/):
+    python -m benchmarks.multi_probe_benchmark --queries 20 --keywords 5
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import time
+from typing import List, Set, Tuple
+
+from sqlalchemy import select, text
+
+from app.core.database import async_session_local, engine
+from app.models.paper import Paper
+from app.repositories.search_repository import CandidateStrategy, SearchRepository
+from benchmarks.common import configure_logging, latency_summary, recall, sample_papers
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+NEIGHBOURHOOD_SIZE = 50
+
+
+async def sample_queries(count: int, keywords: int) -> List[List[List[float]]]:
+    """Return `count` queries of `keywords` related embeddings each."""
+    queries = []
+    seeds = await sample_papers(count)
+    async with async_session_local() as session:
+        for (seed,) in seeds:
+            neighbours = await session.scalars(
+                select(Paper.embedding)
+                .where(Paper.embedding.is_not(None))
+                .order_by(Paper.embedding.cosine_distance(seed))
+                .limit(NEIGHBOURHOOD_SIZE)
+            )
+            pool = [list(embedding) for embedding in neighbours.all() if embedding is not None]
+            queries.append(random.sample(pool, min(keywords, len(pool))))
+    return queries
+
+
+async def exact_top_k(embeddings: List[List[float]], k: int) -> Set[int]:
+    """Return the ids of the exact top-k papers by avg. distance (full scan)."""
+    distances = [Paper.embedding.cosine_distance(embedding) for embedding in embeddings]
+    avg_distance = sum(distances) / len(distances)
+    async with async_session_local() as session, session.begin():
+        await session.execute(text("SET LOCAL enable_indexscan = off"))
+        rows = await session.scalars(select(Paper.paper_id).order_by(avg_distance).limit(k))
+        return set(rows.all())
+
+
+async def time_strategy(
+    embeddings: List[List[float]], k: int, strategy: CandidateStrategy
+) -> Tuple[float, Set[int]]:
+    """Run one search and return (elapsed ms, ids of the top-k results)."""
+    async with async_session_local() as session:
+        start = time.perf_counter()
+        rows = await SearchRepository.search_papers_by_embeddings(
+            db=session, embeddings=embeddings, limit=k, threshold=2.0, strategy=strategy
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    return elapsed_ms, {paper_id for paper_id, _ in rows}
+
+
+async def run(num_queries: int, keywords: int, k: int) -> None:
+    """Compare both strategies on the same sampled queries."""
+    queries = await sample_queries(num_queries, keywords)
+    if not queries:
+        logger.warning("No papers with embeddings found")
+        await engine.dispose()
+        return
+    truths = [await exact_top_k(embeddings, k) for embeddings in queries]
+    logger.info("Sampled %d queries with %d keywords each", len(queries), keywords)
+
+    strategies: Tuple[CandidateStrategy, ...] = ("centroid", "multi_probe")
+    for strategy in strategies:
+        timings, recalls = [], []
+        for embeddings, truth in zip(queries, truths):
+            elapsed_ms, found = await time_strategy(embeddings, k, strategy)
+            timings.append(elapsed_ms)
+            recalls.append(recall(found, truth))
+
+        latency = latency_summary(timings)
+        logger.info(
+            "%-11s recall@%d %.3f | median %.1f ms | p95 %.1f ms",
+            strategy,
+            k,
+            statistics.mean(recalls),
+            latency["p50"],
+            latency["p95"],
+        )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark centroid vs. multi-probe search.")
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--keywords", type=int, default=5)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.queries, args.keywords, args.k))
@@ -0,0 +1,111 @@
+"""
+Benchmark recall, latency and size of the float32, halfvec and binary HNSW indexes.
+
+Every query embedding is taken from a randomly sampled paper. The ground truth is the exact
+top-k by cosine distance (a full scan without index). Searches rerank the index candidates
+with the float32 embeddings, as in the API. Quantizations whose index has not been built
+(see ingestion/build_vector_index.py) are skipped.
+
+Usage (from backend/):
+    python -m benchmarks.quantized_index_benchmark --queries 20 --k 10
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import List, Set, Tuple
+
+from sqlalchemy import select, text
+
+from app.core.config import settings
+from app.core.database import async_session_local, engine
+from app.models.paper import Paper
+from app.repositories.search_repository import SearchRepository
+from benchmarks.common import configure_logging, latency_summary, recall, sample_papers
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+
+async def exact_top_k(embedding: List[float], k: int) -> Set[int]:
+    """Return the ids of the exact top-k papers by cosine distance (full scan)."""
+    async with async_session_local() as session, session.begin():
+        await session.execute(text("SET LOCAL enable_indexscan = off"))
+        rows = await session.scalars(
+            select(Paper.paper_id).order_by(Paper.embedding.cosine_distance(embedding)).limit(k)
+        )
+        return set(rows.all())
+
+
+async def index_size(name: str) -> int:
+    """Return the size of the index in bytes (0 if it does not exist)."""
+    async with async_session_local() as session:
+        size = await session.scalar(
+            text("SELECT pg_relation_size(to_regclass(:name))"), {"name": name}
+        )
+        return int(size or 0)
+
+
+async def time_search(embedding: List[float], k: int) -> Tuple[float, Set[int]]:
+    """Run one search and return (elapsed ms, ids of the top-k results)."""
+    async with async_session_local() as session:
+        start = time.perf_counter()
+        rows = await SearchRepository.search_papers_by_embeddings(
+            db=session, embeddings=[embedding], limit=k, threshold=2.0
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    return elapsed_ms, {paper_id for paper_id, _ in rows}
+
+
+async def run(num_queries: int, k: int) -> None:
+    """Compare all built indexes on the same sampled queries."""
+    try:
+        queries: List[List[float]] = [
+            embedding for (embedding,) in await sample_papers(num_queries)
+        ]
+        if not queries:
+            logger.warning("No papers with embeddings found")
+            return
+        truths = [await exact_top_k(embedding, k) for embedding in queries]
+        logger.info("Sampled %d queries", len(queries))
+
+        for index in Paper.__table__.indexes:
+            quantization = index.info.get("vector_quantization")
+            if quantization is None:
+                continue
+            size = await index_size(index.name)
+            if not size:
+                logger.info("%-8s skipped (index %s not built)", quantization, index.name)
+                continue
+
+            # The repository reads the setting on every search
+            settings.VECTOR_INDEX_QUANTIZATION = quantization
+            timings, recalls = [], []
+            for embedding, truth in zip(queries, truths):
+                elapsed_ms, found = await time_search(embedding, k)
+                timings.append(elapsed_ms)
+                recalls.append(recall(found, truth))
+
+            latency = latency_summary(timings)
+            logger.info(
+                "%-8s recall@%d %.3f | median %.1f ms | p95 %.1f ms | index %.1f MB",
+                quantization,
+                k,
+                statistics.mean(recalls),
+                latency["p50"],
+                latency["p95"],
+                size / 2**20,
+            )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark quantized HNSW indexes.")
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.queries, args.k))
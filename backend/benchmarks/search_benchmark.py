@@ -0,0 +1,210 @@
+"""
+Replay a query set against the synthetic corpus and report latency, throughput and recall.
+
+Every query consists of --keywords embeddings: perturbed copies of a random corpus vector, so
+the query has a well-defined neighbourhood. The queries are replayed through
+SearchRepository.search_papers_by_embeddings with --concurrency searches in flight. The ground
+truth is the exact top-k by avg. distance, computed by brute force over the regenerated corpus.
+
+For every tier one JSON line with a fixed set of keys (schema_version SCHEMA_VERSION) is
+written to stdout, so results can be appended to a file and compared across commits:
+
+    {"commit": ..., "concurrency": 8, "corpus_size": 100000, "latency_ms": {"max": ...,
+     "mean": ..., "p50": ..., "p95": ..., "p99": ...}, "qps": ..., "recall_at_k": ..., ...}
+
+Usage (from backend/):
+    python -m benchmarks.synthetic_corpus --size 100000
+    python -m benchmarks.search_benchmark --queries 200 --concurrency 8 >> search_results.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.repositories.search_repository import SearchRepository
+from app.schemas.search_dto import SearchTier
+from app.utils.vector_utils import normalize_rows
+from benchmarks.common import configure_logging, create_benchmark_engine, latency_summary, recall
+from benchmarks.synthetic_corpus import (
+    CHUNK_ROWS,
+    EMBEDDING_DIM,
+    corpus_chunk,
+    corpus_params,
+    iter_corpus,
+)
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+# Seed offset of the query generator, so queries never share a generator with a corpus chunk
+QUERY_SEED_OFFSET = 1_000_003
+
+
+def make_queries(size: int, seed: int, count: int, keywords: int, noise: float) -> np.ndarray:
+    """Return `count` queries of `keywords` unit embeddings each, shape (count, keywords, dim)."""
+    rng = np.random.default_rng([seed, QUERY_SEED_OFFSET])
+    rows = rng.integers(0, size, count)
+
+    base = np.empty((count, EMBEDDING_DIM), dtype=np.float32)
+    for chunk in np.unique(rows // CHUNK_ROWS):
+        chunk_rows = min(CHUNK_ROWS, size - int(chunk) * CHUNK_ROWS)
+        vectors = corpus_chunk(seed, int(chunk), chunk_rows)
+        mask = rows // CHUNK_ROWS == chunk
+        base[mask] = vectors[rows[mask] % CHUNK_ROWS]
+
+    # Noise of norm ~`noise` around the base vector
+    perturbation = rng.standard_normal((count, keywords, EMBEDDING_DIM)).astype(np.float32)
+    queries = base[:, np.newaxis, :] + noise / np.sqrt(EMBEDDING_DIM) * perturbation
+    return normalize_rows(queries.reshape(-1, EMBEDDING_DIM)).reshape(queries.shape)
+
+
+def exact_top_k(queries: np.ndarray, size: int, seed: int, k: int) -> List[Set[int]]:
+    """
+    Return the paper ids of the exact top-k of every query by avg. cosine distance.
+    For unit corpus vectors the avg. distance to all keywords is 1 - x . mean(keywords).
+    """
+    scorers = queries.mean(axis=1)
+    best_scores = np.empty((len(queries), 0), dtype=np.float32)
+    best_rows = np.empty((len(queries), 0), dtype=np.int64)
+
+    for start, vectors in iter_corpus(size, seed):
+        chunk_scores = scorers @ vectors.T
+        chunk_rows = np.broadcast_to(np.arange(start, start + len(vectors)), chunk_scores.shape)
+        scores = np.concatenate([best_scores, chunk_scores], axis=1)
+        rows = np.concatenate([best_rows, chunk_rows], axis=1)
+        if scores.shape[1] > k:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            scores = np.take_along_axis(scores, top, axis=1)
+            rows = np.take_along_axis(rows, top, axis=1)
+        best_scores, best_rows = scores, rows
+
+    return [{int(row) + 1 for row in query_rows} for query_rows in best_rows]
+
+
+async def replay(
+    sessions: async_sessionmaker[AsyncSession],
+    queries: np.ndarray,
+    k: int,
+    tier: SearchTier,
+    concurrency: int,
+) -> Tuple[List[float], List[Set[int]], float]:
+    """Run all queries with `concurrency` in flight; return (latencies ms, results, wall s)."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def search(embeddings: np.ndarray) -> Tuple[float, Set[int]]:
+        async with semaphore, sessions() as session:
+            start = time.perf_counter()
+            rows = await SearchRepository.search_papers_by_embeddings(
+                db=session, embeddings=embeddings.tolist(), limit=k, threshold=2.0, tier=tier
+            )
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        return elapsed_ms, {paper_id for paper_id, _ in rows}
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(search(embeddings) for embeddings in queries))
+    wall_s = time.perf_counter() - start
+    return [elapsed for elapsed, _ in results], [found for _, found in results], wall_s
+
+
+def git_commit() -> Optional[str]:
+    """Return the current git commit, if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    num_queries: int,
+    keywords: int,
+    concurrency: int,
+    k: int,
+    tiers: List[SearchTier],
+    noise: float,
+    warmup: int,
+) -> None:
+    """Benchmark every tier on the same query set and print one JSON line per tier."""
+    engine = create_benchmark_engine(pool_size=concurrency)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        async with sessions() as session:
+            size, seed = await corpus_params(session)
+
+        queries = make_queries(size, seed, num_queries + warmup, keywords, noise)
+        truths = exact_top_k(queries[warmup:], size, seed, k)
+        logger.info("Corpus of %d papers, %d queries with %d keywords", size, num_queries, keywords)
+
+        for tier in tiers:
+            # Warm up the connections and the page cache of the index
+            await replay(sessions, queries[:warmup], k, tier, concurrency)
+            timings, found, wall_s = await replay(sessions, queries[warmup:], k, tier, concurrency)
+
+            record: Dict[str, Any] = {
+                "schema_version": SCHEMA_VERSION,
+                "benchmark": "search",
+                "commit": git_commit(),
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "corpus_size": size,
+                "dim": EMBEDDING_DIM,
+                "queries": num_queries,
+                "keywords": keywords,
+                "concurrency": concurrency,
+                "k": k,
+                "tier": tier,
+                "strategy": settings.SEARCH_CANDIDATE_STRATEGY,
+                "quantization": settings.VECTOR_INDEX_QUANTIZATION,
+                "rerank_mode": settings.SEARCH_RERANK_MODE,
+                "latency_ms": latency_summary(timings),
+                "qps": round(num_queries / wall_s, 2) if wall_s > 0 else 0.0,
+                "recall_at_k": round(
+                    float(np.mean([recall(f, t) for f, t in zip(found, truths)])), 4
+                ),
+            }
+            print(json.dumps(record, sort_keys=True), flush=True)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark search latency and recall.")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--keywords", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument(
+        "--tiers",
+        nargs="+",
+        choices=["fast", "balanced", "exhaustive"],
+        default=["fast", "balanced", "exhaustive"],
+    )
+    parser.add_argument("--noise", type=float, default=0.5, help="norm of the query noise")
+    parser.add_argument("--warmup", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(
+        run(
+            args.queries,
+            args.keywords,
+            args.concurrency,
+            args.k,
+            args.tiers,
+            args.noise,
+            args.warmup,
+        )
+    )
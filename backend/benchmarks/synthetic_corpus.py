@@ -0,0 +1,151 @@
+"""
+Generate a synthetic corpus of random unit 768-d embeddings and load it into the benchmark
+database (BENCHMARK_DATABASE_URL, see benchmarks/common.py).
+
+The corpus is fully determined by its size and seed: the vectors are generated in fixed-size
+chunks, each from its own seeded generator, so the search benchmark can regenerate them for the
+exact ground truth instead of scanning the table. Row i is stored as paper_id i + 1.
+
+The rows are loaded with COPY before the HNSW index is built, which is much faster than
+inserting into an indexed table. Only the index of VECTOR_INDEX_QUANTIZATION is built.
+
+Usage (from backend/):
+    python -m benchmarks.synthetic_corpus --size 1000000 --seed 42 --reset
+"""
+
+import argparse
+import asyncio
+import logging
+import re
+import time
+from typing import Iterator, Tuple
+
+import asyncpg
+import numpy as np
+from pgvector.asyncpg import register_vector
+from sqlalchemy import Connection, func, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.database import DATABASE_EXTENSIONS
+from app.models.paper import Paper
+from app.utils.vector_utils import normalize_rows
+from benchmarks.common import BENCHMARK_DATABASE_URL, configure_logging, create_benchmark_engine
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIM = 768
+CHUNK_ROWS = 10_000
+
+_DOI_PATTERN = re.compile(r"^synthetic/(\d+)/0$")
+
+
+def corpus_chunk(seed: int, chunk: int, rows: int) -> np.ndarray:
+    """Return the unit vectors of one corpus chunk."""
+    rng = np.random.default_rng([seed, chunk])
+    return normalize_rows(rng.standard_normal((rows, EMBEDDING_DIM), dtype=np.float32))
+
+
+def iter_corpus(size: int, seed: int) -> Iterator[Tuple[int, np.ndarray]]:
+    """Yield (index of the first row, vectors) of all corpus chunks in order."""
+    for chunk, start in enumerate(range(0, size, CHUNK_ROWS)):
+        yield start, corpus_chunk(seed, chunk, min(CHUNK_ROWS, size - start))
+
+
+async def corpus_params(session: AsyncSession) -> Tuple[int, int]:
+    """Return (size, seed) of the corpus loaded into the benchmark database."""
+    size = await session.scalar(select(func.count()).select_from(Paper))
+    first_doi = await session.scalar(select(Paper.doi).where(Paper.paper_id == 1))
+    match = _DOI_PATTERN.match(first_doi or "")
+    if not size or match is None:
+        raise RuntimeError("No synthetic corpus found, run benchmarks.synthetic_corpus first")
+    return int(size), int(match.group(1))
+
+
+def _vector_indexes(conn: Connection, create: bool) -> None:
+    """Drop all HNSW indexes of the paper table, or create the configured one."""
+    for index in Paper.__table__.indexes:
+        if "vector_quantization" not in index.info:
+            continue
+        if create:
+            # Skipped by the index's ddl_if unless it matches VECTOR_INDEX_QUANTIZATION
+            index.create(conn)
+        else:
+            conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index.name}")
+
+
+async def prepare_table(engine: AsyncEngine, reset: bool) -> None:
+    """Create the paper table and drop its vector indexes for the bulk load."""
+    async with engine.begin() as conn:
+        for extension in DATABASE_EXTENSIONS:
+            await conn.exec_driver_sql(f"CREATE EXTENSION IF NOT EXISTS {extension}")
+        await conn.run_sync(Paper.metadata.create_all, tables=[Paper.__table__])
+
+        if reset:
+            await conn.execute(text("TRUNCATE paper CASCADE"))
+        elif await conn.scalar(select(func.count()).select_from(Paper)):
+            raise RuntimeError("The paper table is not empty, pass --reset to replace it")
+
+        await conn.run_sync(_vector_indexes, False)
+
+
+async def copy_corpus(size: int, seed: int) -> None:
+    """Load the corpus with COPY on a plain asyncpg connection (binary vector codec)."""
+    conn = await asyncpg.connect(BENCHMARK_DATABASE_URL.replace("+asyncpg", "", 1))
+    try:
+        await register_vector(conn)
+        for start, vectors in iter_corpus(size, seed):
+            records = [
+                (start + i + 1, f"synthetic/{seed}/{start + i}", "ARXIV", f"Paper {start + i}", v)
+                for i, v in enumerate(vectors)
+            ]
+            await conn.copy_records_to_table(
+                Paper.__tablename__,
+                records=records,
+                columns=["paper_id", "doi", "source", "title", "embedding"],
+            )
+            if (start // CHUNK_ROWS) % 10 == 0:
+                logger.info("Loaded %d / %d papers", start + len(vectors), size)
+    finally:
+        await conn.close()
+
+
+async def build_index(engine: AsyncEngine, maintenance_work_mem: str) -> None:
+    """Build the configured HNSW index and refresh the planner statistics."""
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("SELECT set_config('maintenance_work_mem', :value, true)"),
+            {"value": maintenance_work_mem},
+        )
+        await conn.run_sync(_vector_indexes, True)
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.exec_driver_sql(f"ANALYZE {Paper.__tablename__}")
+
+
+async def run(size: int, seed: int, reset: bool, maintenance_work_mem: str) -> None:
+    """Load a corpus of `size` papers and index it."""
+    engine = create_benchmark_engine()
+    try:
+        await prepare_table(engine, reset)
+
+        start = time.perf_counter()
+        await copy_corpus(size, seed)
+        logger.info("Loaded %d papers in %.1f s", size, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await build_index(engine, maintenance_work_mem)
+        logger.info("Built the vector index in %.1f s", time.perf_counter() - start)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load a synthetic embedding corpus.")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true", help="replace an existing corpus")
+    parser.add_argument("--maintenance-work-mem", default="2GB")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.size, args.seed, args.reset, args.maintenance_work_mem))
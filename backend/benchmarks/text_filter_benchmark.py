@@ -0,0 +1,85 @@
+"""
+Benchmark the substring text conditions of the advanced search filter.
+
+Compares the sequential ILIKE scan (the behaviour without text indexes, forced by disabling
+index scans for the transaction) against the same predicate answered by the pg_trgm GIN
+indexes on paper.title / paper.abstract.
+
+Usage (from backend/):
+    python -m benchmarks.text_filter_benchmark --field abstract --terms transformer "graph neural"
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import async_session_local, engine
+from benchmarks.common import configure_logging
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+DEFAULT_TERMS = ["transformer", "graph neural network", "reinforcement", "quantum", "diffusion"]
+
+# Disabling index and bitmap scans reproduces the plan used before the trigram indexes existed
+SEQ_SCAN_SETTINGS = ("SET LOCAL enable_indexscan = off", "SET LOCAL enable_bitmapscan = off")
+
+
+async def time_filter(
+    session: AsyncSession, field: str, term: str, seq_scan: bool
+) -> Tuple[float, int]:
+    """Run one count query with the ILIKE predicate and return (elapsed ms, matching rows)."""
+    async with session.begin():
+        if seq_scan:
+            for statement in SEQ_SCAN_SETTINGS:
+                await session.execute(text(statement))
+
+        start = time.perf_counter()
+        count = await session.scalar(
+            text(f"SELECT count(*) FROM paper WHERE {field} ILIKE :pattern"),
+            {"pattern": f"%{term}%"},
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+    return elapsed_ms, int(count or 0)
+
+
+async def run(field: str, terms: List[str], repeat: int) -> None:
+    """Benchmark every term with and without the trigram index."""
+    logger.info("%-24s %-10s %10s %10s %10s", "term", "plan", "median ms", "max ms", "rows")
+
+    async with async_session_local() as session:
+        for term in terms:
+            for seq_scan in (True, False):
+                timings = []
+                rows = 0
+                for _ in range(repeat):
+                    elapsed_ms, rows = await time_filter(session, field, term, seq_scan)
+                    timings.append(elapsed_ms)
+
+                logger.info(
+                    "%-24s %-10s %10.1f %10.1f %10d",
+                    term[:24],
+                    "ilike_seq" if seq_scan else "trigram",
+                    statistics.median(timings),
+                    max(timings),
+                    rows,
+                )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark ILIKE vs. trigram text filters.")
+    parser.add_argument("--field", choices=["title", "abstract"], default="abstract")
+    parser.add_argument("--terms", nargs="+", default=DEFAULT_TERMS)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.field, args.terms, args.repeat))
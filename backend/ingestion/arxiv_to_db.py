@@ -26,6 +26,9 @@ DB_CONFIG: dict[str, Any] = {
 
 TABLE = "paper"
 
+# Channel the API listens on to invalidate its search cache (see app/services/search_cache.py)
+INGEST_NOTIFY_CHANNEL = "paper_ingested"
+
 
 def iter_shards(data_dir: Path) -> Iterable[Path]:
     """Return all parquet shard paths in sorted order."""
@@ -77,6 +80,13 @@ def embedding_to_literal(embedding: Any) -> str:
     return "[" + ",".join(f"{float(v):.6f}" for v in embedding) + "]"
 
 
+def notify_ingested(conn: connection) -> None:
+    """Notify running API instances that new papers are available."""
+    with conn.cursor() as cur:
+        cur.execute(f"NOTIFY {INGEST_NOTIFY_CHANNEL};")
+    conn.commit()
+
+
 def insert_rows(conn: connection, rows: List[Tuple[Any, ...]]) -> None:
     """Insert a batch of rows into the paper table."""
     if not rows:
@@ -150,6 +160,8 @@ def ingest_shard(conn: connection, shard_path: Path, batch_size: int) -> None:
             insert_rows(conn, rows)
             rows.clear()
 
+    notify_ingested(conn)
+
 
 def main(data_dir: Path, batch_size: int) -> None:
     """Main entrypoint for bulk ingestion."""
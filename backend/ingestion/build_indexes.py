@@ -0,0 +1,74 @@
+"""
+Build the paper indexes missing on an existing database without blocking writes.
+
+init_db only creates indexes together with a new table; indexes added to the model later
+(trigram and full-text indexes, the HNSW index of VECTOR_INDEX_QUANTIZATION) are reported on
+startup but not built, since a plain CREATE INDEX locks the paper table against writes for the
+whole build. This script builds them with CREATE INDEX CONCURRENTLY.
+
+Generated columns added to the model later (Paper.search_document) are added first. Postgres
+computes a stored generated column for every row in a table rewrite, which blocks reads and
+writes of the paper table until it is done, so run this during a maintenance window.
+
+Usage (from backend/):
+    python -m ingestion.build_indexes
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.schema import CreateColumn
+
+from app.core.config import settings
+from app.core.database import engine
+from app.models.paper import Paper
+from ingestion.build_vector_index import build_index, index_build_connection
+
+logger = logging.getLogger(__name__)
+
+
+async def add_generated_columns(conn: AsyncConnection) -> None:
+    """Add the generated columns of the paper table that do not exist yet."""
+    existing = set(
+        await conn.scalars(
+            text("SELECT column_name FROM information_schema.columns WHERE table_name = :table"),
+            {"table": Paper.__tablename__},
+        )
+    )
+    for column in Paper.__table__.columns:
+        if column.computed is None or column.name in existing:
+            continue
+        ddl = CreateColumn(column).compile(dialect=conn.dialect)
+        logger.info("Adding generated column %s (this rewrites the table)...", column.name)
+        start = time.perf_counter()
+        await conn.exec_driver_sql(f"ALTER TABLE {Paper.__tablename__} ADD COLUMN {ddl}")
+        logger.info("Added %s in %.1f s", column.name, time.perf_counter() - start)
+
+
+async def run(maintenance_work_mem: str) -> None:
+    """
+    Add the generated columns and build all paper indexes; of the vector indexes only the
+    one of the configured quantization.
+    """
+    async with index_build_connection(maintenance_work_mem) as conn:
+        await add_generated_columns(conn)
+
+        for index in Paper.__table__.indexes:
+            quantization = index.info.get("vector_quantization")
+            if quantization in (None, settings.VECTOR_INDEX_QUANTIZATION):
+                await build_index(conn, index)
+
+    logger.info("Done.")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Add the missing paper columns and indexes.")
+    parser.add_argument("--maintenance-work-mem", default="2GB")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.maintenance_work_mem))
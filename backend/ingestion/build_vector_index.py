@@ -0,0 +1,108 @@
+"""
+Build the HNSW index of a VECTOR_INDEX_QUANTIZATION setting without blocking writes.
+
+A plain CREATE INDEX locks the paper table against writes for the whole build, so init_db does
+not build indexes on existing tables. Run this script before switching the setting on an
+existing database. It builds the index with CREATE INDEX CONCURRENTLY. The quantized indexes
+are expression indexes over the float32 embeddings, so no column has to be backfilled.
+
+Usage (from backend/):
+    python -m ingestion.build_vector_index --quantization halfvec --drop-unused
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+from sqlalchemy import Index, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.schema import CreateIndex
+
+from app.core.database import engine
+from app.models.paper import Paper
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s")
+logger = logging.getLogger(__name__)
+
+QUANTIZATIONS = ("none", "halfvec", "binary")
+
+
+def vector_indexes() -> List[Index]:
+    """Return the HNSW indexes of all quantizations defined on the paper table."""
+    return [index for index in Paper.__table__.indexes if "vector_quantization" in index.info]
+
+
+async def index_is_valid(conn: AsyncConnection, name: str) -> Optional[bool]:
+    """Return whether the index is valid, or None if it does not exist."""
+    return await conn.scalar(
+        text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+        {"name": name},
+    )
+
+
+@asynccontextmanager
+async def index_build_connection(maintenance_work_mem: str) -> AsyncIterator[AsyncConnection]:
+    """Open an autocommit connection with the maintenance_work_mem for index builds."""
+    # CREATE / DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(
+            text("SELECT set_config('maintenance_work_mem', :value, false)"),
+            {"value": maintenance_work_mem},
+        )
+        yield conn
+
+
+async def build_index(conn: AsyncConnection, index: Index) -> None:
+    """Create the index concurrently, replacing an invalid one from an interrupted build."""
+    if index.name is None:
+        raise ValueError("Only named indexes can be built")
+    valid = await index_is_valid(conn, index.name)
+    if valid:
+        logger.info("Index %s already exists", index.name)
+        return
+    if valid is False:
+        logger.warning("Dropping invalid index %s left by an interrupted build", index.name)
+        await conn.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {index.name}")
+
+    ddl = str(CreateIndex(index).compile(dialect=conn.dialect))
+    ddl = ddl.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1)
+
+    logger.info("Building %s (this may take a while)...", index.name)
+    start = time.perf_counter()
+    await conn.exec_driver_sql(ddl)
+    logger.info("Built %s in %.1f s", index.name, time.perf_counter() - start)
+
+
+async def run(quantization: str, drop_unused: bool, maintenance_work_mem: str) -> None:
+    """Build the index of the quantization and optionally drop the other vector indexes."""
+    async with index_build_connection(maintenance_work_mem) as conn:
+        for index in vector_indexes():
+            if index.info["vector_quantization"] == quantization:
+                await build_index(conn, index)
+
+        if drop_unused:
+            for index in vector_indexes():
+                if index.info["vector_quantization"] != quantization:
+                    logger.info("Dropping unused index %s", index.name)
+                    await conn.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {index.name}")
+
+    logger.info("Done. Set VECTOR_INDEX_QUANTIZATION=%s and restart the API.", quantization)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build a (quantized) HNSW embedding index.")
+    parser.add_argument("--quantization", choices=QUANTIZATIONS, required=True)
+    parser.add_argument(
+        "--drop-unused",
+        action="store_true",
+        help="drop the HNSW indexes of the other quantizations afterwards",
+    )
+    parser.add_argument("--maintenance-work-mem", default="2GB")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.quantization, args.drop_unused, args.maintenance_work_mem))
@@ -0,0 +1,76 @@
+"""Tests for the incremental token counting and truncation of app.utils.token_utils."""
+
+import random
+
+import pytest
+from fastapi import HTTPException
+
+from app.utils.token_utils import (
+    CHUNK_CHARS,
+    ENCODING,
+    count_tokens_up_to,
+    ensure_fits_token_limit,
+    fits_token_budget,
+    truncate_to_token_budget,
+)
+
+WORDS = ["vector", "search", "paper", "embedding", "index", "query", "the", "of", "model"]
+# Larger than any count in these tests, so counting never stops early
+NO_LIMIT = 10**9
+
+
+def _words(count: int, seed: int = 0) -> str:
+    """Return a text of count random words separated by single spaces."""
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(count))
+
+
+def test_exact_limit_fits() -> None:
+    """A text with exactly max_tokens tokens fits, one token less does not."""
+    text = _words(200)
+    tokens = len(ENCODING.encode_ordinary(text))
+
+    assert fits_token_budget(text, tokens)
+    assert not fits_token_budget(text, tokens - 1)
+    assert truncate_to_token_budget(text, tokens) == text
+    ensure_fits_token_limit(text, tokens)
+    with pytest.raises(HTTPException) as exc_info:
+        ensure_fits_token_limit(text, tokens - 1)
+    assert exc_info.value.status_code == 413
+
+
+def test_text_without_spaces_is_chunked_at_chunk_size() -> None:
+    """Texts without whitespace are split every CHUNK_CHARS characters."""
+    text = "abcdefghij" * (CHUNK_CHARS // 4)
+    chunk_tokens = [
+        len(ENCODING.encode_ordinary(text[start : start + CHUNK_CHARS]))
+        for start in range(0, len(text), CHUNK_CHARS)
+    ]
+    tokens = sum(chunk_tokens)
+
+    assert count_tokens_up_to(text, NO_LIMIT) == tokens
+    assert fits_token_budget(text, tokens)
+    assert not fits_token_budget(text, tokens - 1)
+
+    truncated = truncate_to_token_budget(text, chunk_tokens[0] + 10)
+    assert text.startswith(truncated)
+    assert CHUNK_CHARS < len(truncated) < len(text)
+
+
+def test_truncation_drops_partial_multibyte_characters() -> None:
+    """A token budget ending inside a character never yields a broken character."""
+    # Characters outside the basic multilingual plane span several byte-level tokens
+    text = "𝔘𝔫𝔦𝔠𝔬𝔡𝔢 " * 10
+
+    for max_tokens in range(1, 20):
+        truncated = truncate_to_token_budget(text, max_tokens)
+        assert text.startswith(truncated)
+        assert "\ufffd" not in truncated
+
+
+@pytest.mark.parametrize("word_count", [0, 1, 50, 5_000, 40_000])
+def test_count_matches_full_encoding(word_count: int) -> None:
+    """Counting in chunks agrees with encoding the whole text at once."""
+    text = _words(word_count, seed=word_count)
+
+    assert count_tokens_up_to(text, NO_LIMIT) == len(ENCODING.encode_ordinary(text))
@@ -1 +1,2 @@
-CREATE EXTENSION IF NOT EXISTS vector;
\ No newline at end of file
+CREATE EXTENSION IF NOT EXISTS vector;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
\ No newline at end of file